@@ -1,5 +1,7 @@
 //! Get command - retrieve a VĀKYA by ID
 
+use std::io::{BufWriter, Write};
+
 use aapi_sdk::{AapiClient, ClientConfig};
 
 pub async fn run(
@@ -34,31 +36,42 @@ pub async fn run(
             println!("{}", serde_json::to_string_pretty(&output)?);
         }
         _ => {
-            println!("VĀKYA: {}", vakya.vakya_id);
-            println!("  Hash:     {}", vakya.vakya_hash);
-            println!("  Actor:    {}", vakya.karta_pid);
-            println!("  Resource: {}", vakya.karma_rid);
-            println!("  Action:   {}", vakya.kriya_action);
-            println!("  Created:  {}", vakya.created_at);
+            // Fetch everything first, then write the report in one go
+            let effects = if include_effects {
+                Some(client.get_effects(&vakya_id).await?)
+            } else {
+                None
+            };
+            let receipt = if include_receipt {
+                client.get_receipt(&vakya_id).await.ok()
+            } else {
+                None
+            };
 
-            if include_effects {
-                let effects = client.get_effects(&vakya_id).await?;
-                println!("\nEffects ({}):", effects.len());
+            let mut out = BufWriter::new(std::io::stdout().lock());
+            writeln!(out, "VĀKYA: {}", vakya.vakya_id)?;
+            writeln!(out, "  Hash:     {}", vakya.vakya_hash)?;
+            writeln!(out, "  Actor:    {}", vakya.karta_pid)?;
+            writeln!(out, "  Resource: {}", vakya.karma_rid)?;
+            writeln!(out, "  Action:   {}", vakya.kriya_action)?;
+            writeln!(out, "  Created:  {}", vakya.created_at)?;
+
+            if let Some(effects) = effects {
+                writeln!(out, "\nEffects ({}):", effects.len())?;
                 for effect in effects {
-                    println!("  - {} on {} ({})", effect.effect_bucket, effect.target_rid, effect.id);
+                    writeln!(out, "  - {} on {} ({})", effect.effect_bucket, effect.target_rid, effect.id)?;
                 }
             }
 
-            if include_receipt {
-                if let Ok(receipt) = client.get_receipt(&vakya_id).await {
-                    println!("\nReceipt:");
-                    println!("  Status:   {}", receipt.reason_code);
-                    println!("  Executor: {}", receipt.executor_id);
-                    if let Some(duration) = receipt.duration_ms {
-                        println!("  Duration: {}ms", duration);
-                    }
+            if let Some(receipt) = receipt {
+                writeln!(out, "\nReceipt:")?;
+                writeln!(out, "  Status:   {}", receipt.reason_code)?;
+                writeln!(out, "  Executor: {}", receipt.executor_id)?;
+                if let Some(duration) = receipt.duration_ms {
+                    writeln!(out, "  Duration: {}ms", duration)?;
                 }
             }
+            out.flush()?;
         }
     }
 
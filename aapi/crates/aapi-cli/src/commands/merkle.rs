@@ -1,5 +1,7 @@
 //! Merkle tree commands
 
+use std::io::{BufWriter, Write};
+
 use aapi_sdk::{AapiClient, ClientConfig};
 
 pub async fn root(gateway: &str, tree_type: String, format: &str) -> Result<(), Box<dyn std::error::Error>> {
@@ -36,15 +38,17 @@ pub async fn proof(gateway: &str, tree_type: String, index: i64, format: &str) -
             println!("{}", serde_json::to_string_pretty(&response)?);
         }
         _ => {
-            println!("Inclusion Proof:");
-            println!("  Leaf Hash:  {}", response.leaf_hash);
-            println!("  Leaf Index: {}", response.leaf_index);
-            println!("  Tree Size:  {}", response.tree_size);
-            println!("  Root Hash:  {}", response.root_hash);
-            println!("  Proof Path ({} nodes):", response.proof_hashes.len());
+            let mut out = BufWriter::new(std::io::stdout().lock());
+            writeln!(out, "Inclusion Proof:")?;
+            writeln!(out, "  Leaf Hash:  {}", response.leaf_hash)?;
+            writeln!(out, "  Leaf Index: {}", response.leaf_index)?;
+            writeln!(out, "  Tree Size:  {}", response.tree_size)?;
+            writeln!(out, "  Root Hash:  {}", response.root_hash)?;
+            writeln!(out, "  Proof Path ({} nodes):", response.proof_hashes.len())?;
             for (i, node) in response.proof_hashes.iter().enumerate() {
-                println!("    {}: {} ({})", i, node.hash, node.position);
+                writeln!(out, "    {}: {} ({})", i, node.hash, node.position)?;
             }
+            out.flush()?;
         }
     }
 
@@ -8,6 +8,8 @@
 use sha2::{Sha256, Digest};
 use serde::Serialize;
 use serde_json::Value;
+use std::cmp::Ordering;
+use std::io::Write;
 
 use crate::error::{AapiError, AapiResult};
 use crate::types::ContentHash;
@@ -41,20 +43,24 @@ impl SandhiOutput {
 pub fn canonicalize(vakya: &Vakya) -> AapiResult<SandhiOutput> {
     // First, serialize to JSON Value
     let value = serde_json::to_value(vakya)?;
-    
+    canonicalize_json(&vakya.vakya_id.0, &value)
+}
+
+/// Canonicalize a VĀKYA that has already been converted to a JSON value
+///
+/// For callers that need the `serde_json::Value` form anyway (e.g. to store
+/// it), so the VĀKYA is only walked into a value tree once.
+pub fn canonicalize_json(vakya_id: &str, value: &Value) -> AapiResult<SandhiOutput> {
     // Apply JCS canonicalization
-    let canonical_bytes = jcs_canonicalize(&value)?;
+    let canonical_bytes = jcs_canonicalize(value)?;
     
     // Compute SHA-256 hash
-    let mut hasher = Sha256::new();
-    hasher.update(&canonical_bytes);
-    let hash_bytes = hasher.finalize();
-    let hash_hex = hex::encode(hash_bytes);
+    let hash_hex = hex::encode(Sha256::digest(&canonical_bytes));
     
     Ok(SandhiOutput {
         canonical_bytes,
         vakya_hash: ContentHash::sha256(hash_hex),
-        vakya_id: vakya.vakya_id.0.clone(),
+        vakya_id: vakya_id.to_string(),
     })
 }
 
@@ -100,9 +106,9 @@ fn jcs_serialize(value: &Value, output: &mut Vec<u8>) -> AapiResult<()> {
             output.extend_from_slice(if *b { b"true" } else { b"false" });
         }
         Value::Number(n) => {
-            // Use the default JSON representation for numbers
-            let s = n.to_string();
-            output.extend_from_slice(s.as_bytes());
+            // Use the default JSON representation for numbers, written
+            // straight into the output rather than via a temporary String
+            write!(output, "{}", n).expect("writing to a Vec cannot fail");
         }
         Value::String(s) => {
             jcs_serialize_string(s, output);
@@ -120,21 +126,25 @@ fn jcs_serialize(value: &Value, output: &mut Vec<u8>) -> AapiResult<()> {
         Value::Object(obj) => {
             output.push(b'{');
             
-            // Sort keys lexicographically by UTF-16 code units
-            let mut keys: Vec<&String> = obj.keys().collect();
-            keys.sort_by(|a, b| {
-                let a_utf16: Vec<u16> = a.encode_utf16().collect();
-                let b_utf16: Vec<u16> = b.encode_utf16().collect();
-                a_utf16.cmp(&b_utf16)
-            });
+            // Sort keys lexicographically by UTF-16 code units. serde_json
+            // maps iterate in UTF-8 byte order, which agrees with UTF-16
+            // order unless keys mix U+E000..U+FFFF with astral characters,
+            // so the sort is usually skipped after a linear check.
+            let mut entries: Vec<(&String, &Value)> = obj.iter().collect();
+            let sorted = entries
+                .windows(2)
+                .all(|pair| utf16_cmp(pair[0].0, pair[1].0) != Ordering::Greater);
+            if !sorted {
+                entries.sort_by(|a, b| utf16_cmp(a.0, b.0));
+            }
             
-            for (i, key) in keys.iter().enumerate() {
+            for (i, (key, value)) in entries.iter().enumerate() {
                 if i > 0 {
                     output.push(b',');
                 }
                 jcs_serialize_string(key, output);
                 output.push(b':');
-                jcs_serialize(obj.get(*key).unwrap(), output)?;
+                jcs_serialize(value, output)?;
             }
             output.push(b'}');
         }
@@ -142,28 +152,48 @@ fn jcs_serialize(value: &Value, output: &mut Vec<u8>) -> AapiResult<()> {
     Ok(())
 }
 
+/// Compare strings by UTF-16 code units without allocating
+fn utf16_cmp(a: &str, b: &str) -> Ordering {
+    a.encode_utf16().cmp(b.encode_utf16())
+}
+
 fn jcs_serialize_string(s: &str, output: &mut Vec<u8>) {
+    const HEX: &[u8; 16] = b"0123456789abcdef";
+
+    output.reserve(s.len() + 2);
     output.push(b'"');
-    for ch in s.chars() {
-        match ch {
-            '"' => output.extend_from_slice(b"\\\""),
-            '\\' => output.extend_from_slice(b"\\\\"),
-            '\x08' => output.extend_from_slice(b"\\b"),
-            '\x0c' => output.extend_from_slice(b"\\f"),
-            '\n' => output.extend_from_slice(b"\\n"),
-            '\r' => output.extend_from_slice(b"\\r"),
-            '\t' => output.extend_from_slice(b"\\t"),
-            c if c < '\x20' => {
-                // Control characters use \uXXXX
-                output.extend_from_slice(format!("\\u{:04x}", c as u32).as_bytes());
-            }
-            c => {
-                // All other characters are written as-is (UTF-8)
-                let mut buf = [0u8; 4];
-                output.extend_from_slice(c.encode_utf8(&mut buf).as_bytes());
-            }
+
+    // Only '"', '\\' and C0 controls need escaping, and none of them can
+    // occur inside a multi-byte UTF-8 sequence, so scan bytes and copy the
+    // runs in between (including all non-ASCII text) verbatim.
+    let bytes = s.as_bytes();
+    let mut start = 0;
+    for (i, &b) in bytes.iter().enumerate() {
+        let escape: &[u8] = match b {
+            b'"' => b"\\\"",
+            b'\\' => b"\\\\",
+            0x08 => b"\\b",
+            0x0c => b"\\f",
+            b'\n' => b"\\n",
+            b'\r' => b"\\r",
+            b'\t' => b"\\t",
+            0x00..=0x1f => &[],
+            _ => continue,
+        };
+
+        output.extend_from_slice(&bytes[start..i]);
+        if escape.is_empty() {
+            // Other control characters use \u00XX
+            output.extend_from_slice(b"\\u00");
+            output.push(HEX[(b >> 4) as usize]);
+            output.push(HEX[(b & 0x0f) as usize]);
+        } else {
+            output.extend_from_slice(escape);
         }
+        start = i + 1;
     }
+    output.extend_from_slice(&bytes[start..]);
+
     output.push(b'"');
 }
 
@@ -271,26 +301,35 @@ pub struct MerkleProof {
 
 impl MerkleProof {
     /// Verify the proof
+    ///
+    /// Digests stay raw throughout: each sibling is hex-decoded straight into
+    /// one reused `0x01 || left || right` preimage, one SHA-256 call per hop.
     pub fn verify(&self) -> bool {
-        let mut current = hex::decode(&self.leaf_hash.value).unwrap_or_default();
-        
+        let mut current = [0u8; 32];
+        let mut expected = [0u8; 32];
+        if hex::decode_to_slice(&self.leaf_hash.value, &mut current).is_err()
+            || hex::decode_to_slice(&self.root_hash.value, &mut expected).is_err()
+        {
+            return false;
+        }
+
+        let mut preimage = [0u8; 65];
+        preimage[0] = 0x01; // Internal node prefix
+
         for (sibling, is_right) in &self.proof_hashes {
-            let sibling_bytes = hex::decode(&sibling.value).unwrap_or_default();
-            let mut hasher = Sha256::new();
-            hasher.update(&[0x01]); // Internal node prefix
-            
-            if *is_right {
-                hasher.update(&current);
-                hasher.update(&sibling_bytes);
+            let (current_slot, sibling_slot) = if *is_right {
+                (1..33, 33..65)
             } else {
-                hasher.update(&sibling_bytes);
-                hasher.update(&current);
+                (33..65, 1..33)
+            };
+            preimage[current_slot].copy_from_slice(&current);
+            if hex::decode_to_slice(&sibling.value, &mut preimage[sibling_slot]).is_err() {
+                return false;
             }
-            
-            current = hasher.finalize().to_vec();
+            current = Sha256::digest(preimage).into();
         }
-        
-        hex::encode(&current) == self.root_hash.value
+
+        current == expected
     }
 }
 
@@ -323,6 +362,89 @@ mod tests {
         assert_eq!(canonical_str, r#"{"text":"hello\nworld"}"#);
     }
 
+    #[test]
+    fn test_jcs_string_escaping_all_controls() {
+        let text: String = (0u8..0x20).map(char::from).chain("\"\\/é€😀".chars()).collect();
+        let canonical = jcs_canonicalize(&Value::String(text.clone())).unwrap();
+
+        // Every C0 control without a short form is \u00xx in lowercase hex
+        let mut expected = String::from("\"");
+        for c in text.chars() {
+            match c {
+                '"' => expected.push_str("\\\""),
+                '\\' => expected.push_str("\\\\"),
+                '\x08' => expected.push_str("\\b"),
+                '\x0c' => expected.push_str("\\f"),
+                '\n' => expected.push_str("\\n"),
+                '\r' => expected.push_str("\\r"),
+                '\t' => expected.push_str("\\t"),
+                c if c < '\x20' => expected.push_str(&format!("\\u{:04x}", c as u32)),
+                c => expected.push(c),
+            }
+        }
+        expected.push('"');
+
+        assert_eq!(String::from_utf8(canonical).unwrap(), expected);
+        // The output is still valid JSON for the same string
+        let parsed: String = serde_json::from_str(&expected).unwrap();
+        assert_eq!(parsed, text);
+    }
+
+    #[test]
+    fn test_jcs_utf16_key_order() {
+        // U+10000 encodes as a surrogate pair (0xD800 0xDC00), so it sorts
+        // before U+E000 in UTF-16 even though it is larger in UTF-8
+        let value = json!({"\u{e000}": 1, "\u{10000}": 2, "a": 3});
+        let canonical = jcs_canonicalize(&value).unwrap();
+        let canonical_str = String::from_utf8(canonical).unwrap();
+        assert_eq!(canonical_str, "{\"a\":3,\"\u{10000}\":2,\"\u{e000}\":1}");
+    }
+
+    #[test]
+    fn test_canonicalize_json_matches_canonicalize() {
+        let vakya = Vakya::builder()
+            .karta(crate::Karta {
+                pid: crate::PrincipalId::new("user:test"),
+                role: None,
+                realm: None,
+                key_id: None,
+                actor_type: crate::ActorType::Human,
+                delegation_chain: vec![],
+            })
+            .karma(crate::Karma {
+                rid: crate::ResourceId::new("file:/tmp/test.txt"),
+                kind: None,
+                ns: None,
+                version: None,
+                labels: std::collections::HashMap::new(),
+            })
+            .kriya(crate::Kriya::new("file", "read"))
+            .adhikarana(crate::Adhikarana {
+                cap: crate::CapabilityRef::Reference { cap_ref: "cap:test".to_string() },
+                policy_ref: None,
+                ttl: None,
+                budgets: vec![],
+                approval_lane: crate::ApprovalLane::None,
+                scopes: vec![],
+                context: None,
+                delegation_chain_cid: None,
+                execution_constraints: None,
+                port_id: None,
+                required_phase: None,
+                required_role: None,
+            })
+            .build()
+            .unwrap();
+
+        let value = serde_json::to_value(&vakya).unwrap();
+        let from_value = canonicalize_json(&vakya.vakya_id.0, &value).unwrap();
+        let direct = canonicalize(&vakya).unwrap();
+
+        assert_eq!(from_value.canonical_bytes, direct.canonical_bytes);
+        assert_eq!(from_value.vakya_hash, direct.vakya_hash);
+        assert_eq!(from_value.vakya_id, direct.vakya_id);
+    }
+
     #[test]
     fn test_hash_determinism() {
         let value = json!({"b": 2, "a": 1});
@@ -346,6 +468,26 @@ mod tests {
         assert_eq!(tree.unwrap().hash.value, "abc123");
     }
 
+    #[test]
+    fn test_merkle_proof_verify() {
+        let a = MerkleNode::leaf(b"a");
+        let b = MerkleNode::leaf(b"b");
+        let root = MerkleNode::internal(a.clone(), b.clone());
+
+        let proof = MerkleProof {
+            leaf_hash: a.hash.clone(),
+            proof_hashes: vec![(b.hash.clone(), true)],
+            root_hash: root.hash.clone(),
+        };
+        assert!(proof.verify());
+
+        let swapped = MerkleProof {
+            proof_hashes: vec![(b.hash.clone(), false)],
+            ..proof.clone()
+        };
+        assert!(!swapped.verify());
+    }
+
     #[test]
     fn test_merkle_tree_multiple() {
         let leaves = vec![
@@ -582,6 +582,16 @@ pub struct TtlConstraint {
     pub max_duration_ms: Option<u64>,
 }
 
+impl TtlConstraint {
+    /// TTL of `secs` seconds counted from `start`
+    pub fn from_secs(start: &Timestamp, secs: i64) -> Self {
+        Self {
+            expires_at: Timestamp(start.0 + chrono::Duration::seconds(secs)),
+            max_duration_ms: Some((secs * 1000) as u64),
+        }
+    }
+}
+
 /// Authority context constraints
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct AuthorityContext {
@@ -765,6 +775,7 @@ pub struct VakyaBuilder {
     body: Option<serde_json::Value>,
     trace: Option<TraceContext>,
     hetu: Option<Hetu>,
+    created_at: Option<Timestamp>,
 }
 
 impl VakyaBuilder {
@@ -827,7 +838,25 @@ impl VakyaBuilder {
         self
     }
 
+    /// Use a caller-supplied creation time instead of reading the clock
+    /// again in `build`, e.g. the same instant a TTL was derived from.
+    pub fn created_at(mut self, created_at: Timestamp) -> Self {
+        self.created_at = Some(created_at);
+        self
+    }
+
     pub fn build(self) -> AapiResult<Vakya> {
+        let vakya = self.build_unchecked()?;
+        vakya.validate()?;
+        Ok(vakya)
+    }
+
+    /// Assemble the VĀKYA without running [`Vakya::validate`].
+    ///
+    /// Only required builder fields are checked. Meant for callers that
+    /// synthesize the fields from data they have already checked; anything
+    /// received from outside should still go through `validate`.
+    pub fn build_unchecked(self) -> AapiResult<Vakya> {
         let karta = self.karta.ok_or_else(|| AapiError::MissingField("karta".into()))?;
         let karma = self.karma.ok_or_else(|| AapiError::MissingField("karma".into()))?;
         let kriya = self.kriya.ok_or_else(|| AapiError::MissingField("kriya".into()))?;
@@ -855,7 +884,7 @@ impl VakyaBuilder {
             body_type,
             body,
             meta: VakyaMeta {
-                created_at: Timestamp::now(),
+                created_at: self.created_at.unwrap_or_else(Timestamp::now),
                 trace: self.trace,
                 hetu: self.hetu,
                 client: None,
@@ -866,7 +895,6 @@ impl VakyaBuilder {
             },
         };
 
-        vakya.validate()?;
         Ok(vakya)
     }
 }
@@ -948,6 +976,31 @@ mod tests {
         assert!(matches!(result, Err(AapiError::MissingField(_))));
     }
 
+    #[test]
+    fn test_build_unchecked_skips_validation() {
+        let builder = || Vakya::builder()
+            .karta(Karta {
+                pid: PrincipalId::new(""),
+                role: None,
+                realm: None,
+                key_id: None,
+                actor_type: ActorType::Human,
+                delegation_chain: vec![],
+            })
+            .karma(Karma {
+                rid: ResourceId::new("test"),
+                kind: None,
+                ns: None,
+                version: None,
+                labels: std::collections::HashMap::new(),
+            })
+            .kriya(Kriya::new("test", "action"))
+            .adhikarana(create_test_adhikarana());
+
+        assert!(builder().build().is_err());
+        assert!(builder().build_unchecked().is_ok());
+    }
+
     #[test]
     fn test_kriya_parse_action() {
         let kriya = Kriya::new("database", "query");
@@ -2,10 +2,11 @@
 //!
 //! Provides Ed25519 key generation, storage, and retrieval.
 
-use ed25519_dalek::{SigningKey, VerifyingKey, SECRET_KEY_LENGTH};
+use ed25519_dalek::{Signer, SigningKey, VerifyingKey, SECRET_KEY_LENGTH};
 use rand::rngs::OsRng;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{Arc, RwLock};
 
 use crate::error::{CryptoError, CryptoResult};
@@ -102,6 +103,13 @@ impl KeyPair {
         &self.signing_key
     }
 
+    /// Sign a message and return the raw 64-byte Ed25519 signature
+    ///
+    /// Encoding is left to the caller so it happens once, at the wire.
+    pub fn sign_raw(&self, message: &[u8]) -> [u8; 64] {
+        self.signing_key.sign(message).to_bytes()
+    }
+
     /// Get the verifying (public) key
     pub fn verifying_key(&self) -> VerifyingKey {
         self.signing_key.verifying_key()
@@ -210,6 +218,8 @@ impl PublicKeyInfo {
 pub struct KeyStore {
     keys: Arc<RwLock<HashMap<KeyId, KeyPair>>>,
     public_keys: Arc<RwLock<HashMap<KeyId, PublicKeyInfo>>>,
+    /// Bumped whenever a private key is added, replaced or removed
+    revision: Arc<AtomicU64>,
 }
 
 impl Default for KeyStore {
@@ -223,6 +233,7 @@ impl KeyStore {
         Self {
             keys: Arc::new(RwLock::new(HashMap::new())),
             public_keys: Arc::new(RwLock::new(HashMap::new())),
+            revision: Arc::new(AtomicU64::new(0)),
         }
     }
 
@@ -236,6 +247,7 @@ impl KeyStore {
         })?;
         
         keys.insert(key_id.clone(), key_pair);
+        self.revision.fetch_add(1, Ordering::Release);
         Ok(key_id)
     }
 
@@ -249,6 +261,7 @@ impl KeyStore {
         })?;
         
         keys.insert(key_id.clone(), key_pair);
+        self.revision.fetch_add(1, Ordering::Release);
         
         let mut public_keys = self.public_keys.write().map_err(|_| {
             CryptoError::KeyGeneration("Failed to acquire lock".to_string())
@@ -279,6 +292,14 @@ impl KeyStore {
             .ok_or_else(|| CryptoError::KeyNotFound(key_id.to_string()))
     }
 
+    /// Revision of the private key set
+    ///
+    /// Changes whenever a key pair is generated, stored or removed, so
+    /// callers holding on to a key pair can tell when to fetch it again.
+    pub fn revision(&self) -> u64 {
+        self.revision.load(Ordering::Acquire)
+    }
+
     /// Get public key info by ID
     pub fn get_public_key(&self, key_id: &KeyId) -> CryptoResult<PublicKeyInfo> {
         // First check if we have the full key pair
@@ -308,6 +329,7 @@ impl KeyStore {
         })?;
         
         keys.remove(key_id);
+        self.revision.fetch_add(1, Ordering::Release);
         
         let mut public_keys = self.public_keys.write().map_err(|_| {
             CryptoError::KeyNotFound("Failed to acquire lock".to_string())
@@ -355,6 +377,7 @@ impl Clone for KeyStore {
         Self {
             keys: Arc::clone(&self.keys),
             public_keys: Arc::clone(&self.public_keys),
+            revision: Arc::clone(&self.revision),
         }
     }
 }
@@ -411,4 +434,16 @@ mod tests {
         assert_eq!(hex.len(), 64); // 32 bytes = 64 hex chars
         assert!(!base64.is_empty());
     }
+
+    #[test]
+    fn test_sign_raw_verifies() {
+        use ed25519_dalek::{Signature, Verifier};
+
+        let key_pair = KeyPair::generate(KeyPurpose::VakyaSigning);
+        let sig = key_pair.sign_raw(b"payload");
+
+        let signature = Signature::from_bytes(&sig);
+        assert!(key_pair.verifying_key().verify(b"payload", &signature).is_ok());
+        assert!(key_pair.verifying_key().verify(b"other", &signature).is_err());
+    }
 }
@@ -2,8 +2,10 @@
 //!
 //! Implements Ed25519 signing for VĀKYA requests and PRAMĀṆA receipts.
 
-use ed25519_dalek::{Signature, Signer, Verifier};
+use ed25519_dalek::{Signature, SignatureError, Verifier, VerifyingKey};
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use std::sync::{Arc, RwLock};
 
 use aapi_core::{Vakya, SandhiOutput, canonicalize};
 use crate::error::{CryptoError, CryptoResult};
@@ -47,43 +49,92 @@ impl Default for SignatureAlgorithm {
 }
 
 /// Signer for VĀKYA requests
+#[derive(Clone)]
 pub struct VakyaSigner {
     key_store: KeyStore,
+    /// Last key pair used, shared between clones of the signer
+    cached_key: Arc<RwLock<Option<CachedKey>>>,
+}
+
+/// Key pair held by a signer, valid while the store revision is unchanged
+struct CachedKey {
+    revision: u64,
+    key_pair: Arc<KeyPair>,
 }
 
 impl VakyaSigner {
     pub fn new(key_store: KeyStore) -> Self {
-        Self { key_store }
+        Self {
+            key_store,
+            cached_key: Arc::new(RwLock::new(None)),
+        }
     }
 
     /// Sign a VĀKYA with the specified key
     pub fn sign(&self, vakya: &Vakya, key_id: &KeyId) -> CryptoResult<SignedVakya> {
-        // Get the key pair
-        let key_pair = self.key_store.get_key(key_id)?;
-        
-        if key_pair.is_expired() {
-            return Err(CryptoError::TokenExpired);
-        }
-
-        // Canonicalize the VĀKYA
-        let sandhi = canonicalize(vakya)
-            .map_err(|e| CryptoError::SigningFailed(e.to_string()))?;
-
-        // Sign the canonical bytes
-        let signature = sign_bytes(&key_pair, &sandhi.canonical_bytes)?;
+        let (signature, sandhi) = self.sign_detached(vakya, key_id)?;
 
         Ok(SignedVakya {
             vakya: vakya.clone(),
-            signature: VakyaSignature {
-                key_id: key_id.clone(),
-                algorithm: SignatureAlgorithm::Ed25519,
-                value: signature,
-                signed_at: chrono::Utc::now(),
-            },
+            signature,
             vakya_hash: sandhi.vakya_hash.value,
         })
     }
 
+    /// Sign a VĀKYA and return the signature alongside the canonical form
+    ///
+    /// Unlike [`VakyaSigner::sign`] this does not clone the VĀKYA, and it hands
+    /// back the exact bytes that were signed so callers can send them as-is
+    /// instead of serializing the VĀKYA a second time.
+    pub fn sign_detached(&self, vakya: &Vakya, key_id: &KeyId) -> CryptoResult<(VakyaSignature, SandhiOutput)> {
+        let key_pair = self.usable_key(key_id)?;
+        sign_with_key(&key_pair, vakya, key_id, chrono::Utc::now())
+    }
+
+    /// Sign several VĀKYAs with one key, returning detached signatures
+    ///
+    /// The key is looked up once and every signature carries the same
+    /// `signed_at`; results are in input order.
+    pub fn sign_detached_many(&self, vakyas: &[Vakya], key_id: &KeyId) -> CryptoResult<Vec<(VakyaSignature, SandhiOutput)>> {
+        let key_pair = self.usable_key(key_id)?;
+        let signed_at = chrono::Utc::now();
+
+        vakyas
+            .iter()
+            .map(|vakya| sign_with_key(&key_pair, vakya, key_id, signed_at))
+            .collect()
+    }
+
+    /// Get a key pair, rejecting expired keys
+    ///
+    /// The pair is cached until the key store changes, so repeated signing
+    /// with the same key skips the store lookup and the key clone.
+    fn usable_key(&self, key_id: &KeyId) -> CryptoResult<Arc<KeyPair>> {
+        let revision = self.key_store.revision();
+        let cached = self.cached_key.read().ok().and_then(|slot| {
+            slot.as_ref()
+                .filter(|c| c.revision == revision && c.key_pair.key_id == *key_id)
+                .map(|c| Arc::clone(&c.key_pair))
+        });
+
+        let key_pair = match cached {
+            Some(key_pair) => key_pair,
+            None => {
+                let key_pair = Arc::new(self.key_store.get_key(key_id)?);
+                if let Ok(mut slot) = self.cached_key.write() {
+                    *slot = Some(CachedKey { revision, key_pair: Arc::clone(&key_pair) });
+                }
+                key_pair
+            }
+        };
+
+        if key_pair.is_expired() {
+            return Err(CryptoError::TokenExpired);
+        }
+
+        Ok(key_pair)
+    }
+
     /// Sign with automatic key selection based on principal
     pub fn sign_auto(&self, vakya: &Vakya) -> CryptoResult<SignedVakya> {
         // Try to find a key for this principal
@@ -99,6 +150,31 @@ impl VakyaSigner {
     }
 }
 
+/// Canonicalize and sign a VĀKYA with an already-fetched key pair
+fn sign_with_key(
+    key_pair: &KeyPair,
+    vakya: &Vakya,
+    key_id: &KeyId,
+    signed_at: chrono::DateTime<chrono::Utc>,
+) -> CryptoResult<(VakyaSignature, SandhiOutput)> {
+    // Canonicalize the VĀKYA
+    let sandhi = canonicalize(vakya)
+        .map_err(|e| CryptoError::SigningFailed(e.to_string()))?;
+
+    // Sign the canonical bytes
+    let signature = sign_bytes(key_pair, &sandhi.canonical_bytes)?;
+
+    Ok((
+        VakyaSignature {
+            key_id: key_id.clone(),
+            algorithm: SignatureAlgorithm::Ed25519,
+            value: signature,
+            signed_at,
+        },
+        sandhi,
+    ))
+}
+
 /// Verifier for signed VĀKYA requests
 pub struct VakyaVerifier {
     key_store: KeyStore,
@@ -113,7 +189,6 @@ impl VakyaVerifier {
     pub fn verify(&self, signed: &SignedVakya) -> CryptoResult<VerificationResult> {
         // Get the public key
         let public_info = self.key_store.get_public_key(&signed.signature.key_id)?;
-        let verifying_key = public_info.verifying_key()?;
 
         // Re-canonicalize the VĀKYA
         let sandhi = canonicalize(&signed.vakya)
@@ -129,72 +204,137 @@ impl VakyaVerifier {
             });
         }
 
-        // Decode signature
-        use base64::Engine;
-        let sig_bytes = base64::engine::general_purpose::STANDARD
-            .decode(&signed.signature.value)?;
-        
-        if sig_bytes.len() != 64 {
-            return Err(CryptoError::InvalidSignature);
-        }
+        verify_canonical(&public_info, &sandhi.canonical_bytes, &signed.signature)
+    }
 
-        let mut sig_array = [0u8; 64];
-        sig_array.copy_from_slice(&sig_bytes);
-        let signature = Signature::from_bytes(&sig_array);
+    /// Verify a detached signature against an already canonicalized VĀKYA
+    ///
+    /// Counterpart of [`VakyaSigner::sign_detached`]: callers that canonicalize
+    /// the VĀKYA anyway (e.g. to store its hash) skip the clone into a
+    /// `SignedVakya` and the second canonicalization `verify` would do.
+    pub fn verify_detached(&self, sandhi: &SandhiOutput, signature: &VakyaSignature) -> CryptoResult<VerificationResult> {
+        let public_info = self.key_store.get_public_key(&signature.key_id)?;
+        verify_canonical(&public_info, &sandhi.canonical_bytes, signature)
+    }
 
-        // Verify signature
-        match verifying_key.verify(&sandhi.canonical_bytes, &signature) {
-            Ok(_) => Ok(VerificationResult {
-                valid: true,
-                reason: None,
-                key_id: signed.signature.key_id.clone(),
-                verified_at: chrono::Utc::now(),
-            }),
-            Err(e) => Ok(VerificationResult {
-                valid: false,
-                reason: Some(e.to_string()),
-                key_id: signed.signature.key_id.clone(),
-                verified_at: chrono::Utc::now(),
-            }),
+    /// Verify many detached signatures with one Ed25519 batch check
+    ///
+    /// Each distinct key is looked up and decoded once, and all well-formed
+    /// signatures go through a single `ed25519_dalek::verify_batch` call. Only
+    /// when the batch fails are they re-checked one by one to tell the bad
+    /// ones apart. Results come back in input order; key lookup and signature
+    /// decoding errors are reported per item, as `verify_detached` would.
+    pub fn verify_detached_batch(
+        &self,
+        items: &[(&SandhiOutput, &VakyaSignature)],
+    ) -> Vec<CryptoResult<VerificationResult>> {
+        let mut keys: HashMap<&KeyId, VerifyingKey> = HashMap::new();
+        let mut decoded = Vec::with_capacity(items.len());
+        for (_, signature) in items {
+            decoded.push(self.decode_detached(signature, &mut keys));
+        }
+
+        let mut messages = Vec::with_capacity(items.len());
+        let mut signatures = Vec::with_capacity(items.len());
+        let mut verifying_keys = Vec::with_capacity(items.len());
+        for ((sandhi, _), entry) in items.iter().zip(&decoded) {
+            if let Ok((verifying_key, signature)) = entry {
+                messages.push(sandhi.canonical_bytes.as_slice());
+                signatures.push(*signature);
+                verifying_keys.push(*verifying_key);
+            }
         }
+        let all_valid = messages.is_empty()
+            || ed25519_dalek::verify_batch(&messages, &signatures, &verifying_keys).is_ok();
+
+        items
+            .iter()
+            .zip(decoded)
+            .map(|((sandhi, signature), entry)| {
+                let (verifying_key, sig) = entry?;
+                let outcome = if all_valid {
+                    Ok(())
+                } else {
+                    verifying_key.verify(&sandhi.canonical_bytes, &sig)
+                };
+                Ok(verification_result(signature, outcome))
+            })
+            .collect()
+    }
+
+    /// Resolve the key and decode the signature of one batch entry
+    fn decode_detached<'a>(
+        &self,
+        signature: &'a VakyaSignature,
+        keys: &mut HashMap<&'a KeyId, VerifyingKey>,
+    ) -> CryptoResult<(VerifyingKey, Signature)> {
+        let verifying_key = match keys.get(&signature.key_id) {
+            Some(key) => *key,
+            None => {
+                let key = self.key_store.get_public_key(&signature.key_id)?.verifying_key()?;
+                keys.insert(&signature.key_id, key);
+                key
+            }
+        };
+        Ok((verifying_key, decode_signature(&signature.value)?))
     }
 
     /// Verify with a specific public key (without key store lookup)
     pub fn verify_with_key(&self, signed: &SignedVakya, public_info: &PublicKeyInfo) -> CryptoResult<VerificationResult> {
-        let verifying_key = public_info.verifying_key()?;
-
         // Re-canonicalize the VĀKYA
         let sandhi = canonicalize(&signed.vakya)
             .map_err(|e| CryptoError::VerificationFailed(e.to_string()))?;
 
-        // Decode signature
-        use base64::Engine;
-        let sig_bytes = base64::engine::general_purpose::STANDARD
-            .decode(&signed.signature.value)?;
-        
-        if sig_bytes.len() != 64 {
-            return Err(CryptoError::InvalidSignature);
-        }
+        verify_canonical(public_info, &sandhi.canonical_bytes, &signed.signature)
+    }
+}
 
-        let mut sig_array = [0u8; 64];
-        sig_array.copy_from_slice(&sig_bytes);
-        let signature = Signature::from_bytes(&sig_array);
+/// Check an Ed25519 signature over canonical VĀKYA bytes
+fn verify_canonical(
+    public_info: &PublicKeyInfo,
+    canonical_bytes: &[u8],
+    signature: &VakyaSignature,
+) -> CryptoResult<VerificationResult> {
+    let verifying_key = public_info.verifying_key()?;
+    let sig = decode_signature(&signature.value)?;
 
-        // Verify signature
-        match verifying_key.verify(&sandhi.canonical_bytes, &signature) {
-            Ok(_) => Ok(VerificationResult {
-                valid: true,
-                reason: None,
-                key_id: signed.signature.key_id.clone(),
-                verified_at: chrono::Utc::now(),
-            }),
-            Err(e) => Ok(VerificationResult {
-                valid: false,
-                reason: Some(e.to_string()),
-                key_id: signed.signature.key_id.clone(),
-                verified_at: chrono::Utc::now(),
-            }),
-        }
+    // Verify signature
+    Ok(verification_result(signature, verifying_key.verify(canonical_bytes, &sig)))
+}
+
+/// Decode a base64 Ed25519 signature
+fn decode_signature(value: &str) -> CryptoResult<Signature> {
+    use base64::Engine;
+    let sig_bytes = base64::engine::general_purpose::STANDARD
+        .decode(value)?;
+
+    if sig_bytes.len() != 64 {
+        return Err(CryptoError::InvalidSignature);
+    }
+
+    let mut sig_array = [0u8; 64];
+    sig_array.copy_from_slice(&sig_bytes);
+    Ok(Signature::from_bytes(&sig_array))
+}
+
+/// Turn the outcome of an Ed25519 check into a verification result
+fn verification_result(
+    signature: &VakyaSignature,
+    outcome: Result<(), SignatureError>,
+) -> VerificationResult {
+    match outcome {
+        Ok(_) => VerificationResult {
+            valid: true,
+            reason: None,
+            key_id: signature.key_id.clone(),
+            verified_at: chrono::Utc::now(),
+        },
+        Err(e) => VerificationResult {
+            valid: false,
+            reason: Some(e.to_string()),
+            key_id: signature.key_id.clone(),
+            verified_at: chrono::Utc::now(),
+        },
     }
 }
 
@@ -209,9 +349,8 @@ pub struct VerificationResult {
 
 /// Sign arbitrary bytes with a key pair
 pub fn sign_bytes(key_pair: &KeyPair, data: &[u8]) -> CryptoResult<String> {
-    let signature = key_pair.signing_key().sign(data);
     use base64::Engine;
-    Ok(base64::engine::general_purpose::STANDARD.encode(signature.to_bytes()))
+    Ok(base64::engine::general_purpose::STANDARD.encode(key_pair.sign_raw(data)))
 }
 
 /// Verify a signature over arbitrary bytes
@@ -247,20 +386,22 @@ pub struct BatchSignature {
 impl VakyaSigner {
     /// Sign multiple VĀKYA requests as a batch
     pub fn sign_batch(&self, vakyas: &[Vakya], key_id: &KeyId) -> CryptoResult<BatchSignature> {
-        let key_pair = self.key_store.get_key(key_id)?;
-        
-        if key_pair.is_expired() {
-            return Err(CryptoError::TokenExpired);
-        }
+        // Fetch the key and read the clock once for the whole batch
+        let key_pair = self.usable_key(key_id)?;
+        let signed_at = chrono::Utc::now();
 
         // Sign each VĀKYA individually
         let mut signatures = Vec::with_capacity(vakyas.len());
         let mut hashes = Vec::with_capacity(vakyas.len());
-        
+
         for vakya in vakyas {
-            let signed = self.sign(vakya, key_id)?;
-            hashes.push(signed.vakya_hash.clone());
-            signatures.push(signed);
+            let (signature, sandhi) = sign_with_key(&key_pair, vakya, key_id, signed_at)?;
+            hashes.push(sandhi.vakya_hash.value.clone());
+            signatures.push(SignedVakya {
+                vakya: vakya.clone(),
+                signature,
+                vakya_hash: sandhi.vakya_hash.value,
+            });
         }
 
         // Compute batch hash
@@ -281,7 +422,7 @@ impl VakyaSigner {
                 key_id: key_id.clone(),
                 algorithm: SignatureAlgorithm::Ed25519,
                 value: batch_sig,
-                signed_at: chrono::Utc::now(),
+                signed_at,
             },
         })
     }
@@ -365,6 +506,118 @@ mod tests {
         assert!(!result.valid);
     }
 
+    #[test]
+    fn test_sign_detached_matches_sign() {
+        let key_store = KeyStore::new();
+        let key_id = key_store.generate_key(KeyPurpose::VakyaSigning).unwrap();
+        
+        let signer = VakyaSigner::new(key_store);
+        
+        let vakya = create_test_vakya();
+        let (signature, sandhi) = signer.sign_detached(&vakya, &key_id).unwrap();
+        let signed = signer.sign(&vakya, &key_id).unwrap();
+        
+        // Ed25519 is deterministic, so both paths sign the same bytes
+        assert_eq!(signature.value, signed.signature.value);
+        assert_eq!(sandhi.vakya_hash.value, signed.vakya_hash);
+        assert_eq!(sandhi.canonical_bytes, canonicalize(&vakya).unwrap().canonical_bytes);
+    }
+
+    #[test]
+    fn test_verify_detached() {
+        let key_store = KeyStore::new();
+        let key_id = key_store.generate_key(KeyPurpose::VakyaSigning).unwrap();
+
+        let signer = VakyaSigner::new(key_store.clone());
+        let verifier = VakyaVerifier::new(key_store);
+
+        let vakya = create_test_vakya();
+        let (signature, sandhi) = signer.sign_detached(&vakya, &key_id).unwrap();
+        assert!(verifier.verify_detached(&sandhi, &signature).unwrap().valid);
+
+        let mut tampered = vakya.clone();
+        tampered.v3_kriya.action = "tampered.action".to_string();
+        let tampered_sandhi = canonicalize(&tampered).unwrap();
+        assert!(!verifier.verify_detached(&tampered_sandhi, &signature).unwrap().valid);
+    }
+
+    #[test]
+    fn test_verify_detached_batch() {
+        let key_store = KeyStore::new();
+        let key_a = key_store.generate_key(KeyPurpose::VakyaSigning).unwrap();
+        let key_b = key_store.generate_key(KeyPurpose::VakyaSigning).unwrap();
+
+        let signer = VakyaSigner::new(key_store.clone());
+        let verifier = VakyaVerifier::new(key_store);
+
+        let vakyas: Vec<Vakya> = (0..4).map(|_| create_test_vakya()).collect();
+        let mut signed: Vec<(VakyaSignature, SandhiOutput)> = vakyas
+            .iter()
+            .enumerate()
+            .map(|(i, v)| signer.sign_detached(v, if i % 2 == 0 { &key_a } else { &key_b }).unwrap())
+            .collect();
+
+        let items: Vec<_> = signed.iter().map(|(sig, sandhi)| (sandhi, sig)).collect();
+        let results = verifier.verify_detached_batch(&items);
+        assert!(results.iter().all(|r| r.as_ref().unwrap().valid));
+
+        // One forged entry and one unknown key fail on their own slots only
+        signed[1].0.value = signed[0].0.value.clone();
+        signed[3].0.key_id = KeyId("missing".to_string());
+        let items: Vec<_> = signed.iter().map(|(sig, sandhi)| (sandhi, sig)).collect();
+        let results = verifier.verify_detached_batch(&items);
+        assert!(results[0].as_ref().unwrap().valid);
+        assert!(!results[1].as_ref().unwrap().valid);
+        assert!(results[2].as_ref().unwrap().valid);
+        assert!(results[3].is_err());
+    }
+
+    #[test]
+    fn test_verify_detached_batch_matches_single() {
+        let key_store = KeyStore::new();
+        let key_id = key_store.generate_key(KeyPurpose::VakyaSigning).unwrap();
+
+        let signer = VakyaSigner::new(key_store.clone());
+        let verifier = VakyaVerifier::new(key_store);
+
+        let mut signed: Vec<(VakyaSignature, SandhiOutput)> = (0..5)
+            .map(|_| signer.sign_detached(&create_test_vakya(), &key_id).unwrap())
+            .collect();
+        signed[2].0.value = signed[4].0.value.clone();
+
+        let items: Vec<_> = signed.iter().map(|(sig, sandhi)| (sandhi, sig)).collect();
+        let batch = verifier.verify_detached_batch(&items);
+        assert_eq!(batch.len(), items.len());
+
+        for ((sandhi, sig), batched) in items.iter().zip(&batch) {
+            let single = verifier.verify_detached(sandhi, sig).unwrap();
+            let batched = batched.as_ref().unwrap();
+            assert_eq!(batched.valid, single.valid);
+            assert_eq!(batched.reason, single.reason);
+        }
+        assert_eq!(batch.iter().filter(|r| !r.as_ref().unwrap().valid).count(), 1);
+    }
+
+    #[test]
+    fn test_cached_key_follows_store_changes() {
+        let key_store = KeyStore::new();
+        let key_id = key_store.generate_key(KeyPurpose::VakyaSigning).unwrap();
+
+        let signer = VakyaSigner::new(key_store.clone());
+        let vakyas: Vec<Vakya> = (0..3).map(|_| create_test_vakya()).collect();
+
+        let signed = signer.sign_detached_many(&vakyas, &key_id).unwrap();
+        assert_eq!(signed.len(), 3);
+        assert!(signed.iter().all(|(s, _)| s.signed_at == signed[0].0.signed_at));
+        for ((signature, _), vakya) in signed.iter().zip(&vakyas) {
+            assert_eq!(signature.value, signer.sign_detached(vakya, &key_id).unwrap().0.value);
+        }
+
+        // Removing the key must not leave a usable cached copy behind
+        key_store.remove_key(&key_id).unwrap();
+        assert!(signer.sign_detached(&vakyas[0], &key_id).is_err());
+    }
+
     #[test]
     fn test_batch_signing() {
         let key_store = KeyStore::new();
@@ -42,9 +42,10 @@ pub enum GatewayError {
     Serialization(#[from] serde_json::Error),
 }
 
-impl IntoResponse for GatewayError {
-    fn into_response(self) -> Response {
-        let (status, error_response) = match &self {
+impl GatewayError {
+    /// HTTP status and response body for this error
+    pub fn to_response_parts(&self) -> (StatusCode, ErrorResponse) {
+        match self {
             GatewayError::Validation(msg) => (
                 StatusCode::BAD_REQUEST,
                 ErrorResponse {
@@ -125,8 +126,13 @@ impl IntoResponse for GatewayError {
                     details: None,
                 },
             ),
-        };
+        }
+    }
+}
 
+impl IntoResponse for GatewayError {
+    fn into_response(self) -> Response {
+        let (status, error_response) = self.to_response_parts();
         (status, Json(error_response)).into_response()
     }
 }
@@ -0,0 +1,57 @@
+//! Request body extractors for the Gateway
+
+use axum::{
+    async_trait,
+    body::Bytes,
+    extract::{FromRequest, Request},
+    http::header,
+    response::{IntoResponse, Response},
+    Json,
+};
+use serde::de::DeserializeOwned;
+
+use crate::error::GatewayError;
+
+/// Media type for CBOR request bodies
+pub const CBOR_CONTENT_TYPE: &str = "application/cbor";
+
+/// Body extractor accepting either JSON or CBOR
+///
+/// `Content-Type: application/cbor` bodies are decoded with ciborium; anything
+/// else goes through axum's `Json` extractor, so JSON clients see exactly the
+/// same behaviour and rejections as before.
+#[derive(Debug, Clone)]
+pub struct JsonOrCbor<T>(pub T);
+
+#[async_trait]
+impl<T, S> FromRequest<S> for JsonOrCbor<T>
+where
+    T: DeserializeOwned,
+    S: Send + Sync,
+{
+    type Rejection = Response;
+
+    async fn from_request(req: Request, state: &S) -> Result<Self, Self::Rejection> {
+        let is_cbor = req
+            .headers()
+            .get(header::CONTENT_TYPE)
+            .and_then(|v| v.to_str().ok())
+            .map(|ct| ct.starts_with(CBOR_CONTENT_TYPE))
+            .unwrap_or(false);
+
+        if is_cbor {
+            let bytes = Bytes::from_request(req, state)
+                .await
+                .map_err(IntoResponse::into_response)?;
+            let value = ciborium::from_reader(bytes.as_ref()).map_err(|e| {
+                GatewayError::Validation(format!("Invalid CBOR body: {}", e)).into_response()
+            })?;
+            Ok(Self(value))
+        } else {
+            let Json(value) = Json::<T>::from_request(req, state)
+                .await
+                .map_err(IntoResponse::into_response)?;
+            Ok(Self(value))
+        }
+    }
+}
@@ -5,25 +5,26 @@ use axum::{
     http::StatusCode,
     Json,
 };
-use chrono::Utc;
+use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use std::sync::Arc;
 use tracing::{debug, info, warn};
 
 use aapi_adapters::ExecutionContext;
 use aapi_core::{
-    Vakya, VakyaId, canonicalize,
+    SandhiOutput, Vakya, VakyaId, canonicalize_json,
     error::ReasonCode,
     types::Timestamp,
 };
-use aapi_crypto::SignedVakya;
+use aapi_crypto::VerificationResult;
 use aapi_indexdb::{
     VakyaRecord, EffectRecord, ReceiptRecord,
-    TreeType, IndexDbStore,
+    InclusionProof, TreeType, IndexDbStore,
 };
 use aapi_metarules::{EvaluationContext, DecisionType};
 
-use crate::error::{GatewayError, GatewayResult};
+use crate::error::{ErrorResponse, GatewayError, GatewayResult};
+use crate::extract::JsonOrCbor;
 use crate::state::AppState;
 
 /// Health check response
@@ -92,14 +93,170 @@ pub struct ReceiptResponse {
     pub created_at: String,
 }
 
+/// Maximum number of VĀKYAs accepted in one batch submission
+pub const MAX_BATCH_SIZE: usize = 256;
+
+/// Outcome of one entry in a batch submission
+///
+/// Successful entries carry the same body `POST /v1/vakya` would return;
+/// failed entries carry the error body plus the HTTP status the single
+/// endpoint would have answered with.
+#[derive(Debug, Serialize)]
+#[serde(untagged)]
+pub enum BatchItemResponse {
+    Submitted(SubmitVakyaResponse),
+    Failed {
+        status_code: u16,
+        #[serde(flatten)]
+        error: ErrorResponse,
+    },
+}
+
+/// Submit VĀKYA batch response
+#[derive(Debug, Serialize)]
+pub struct SubmitBatchResponse {
+    /// One entry per submitted VĀKYA, in request order
+    pub results: Vec<BatchItemResponse>,
+    /// VĀKYA tree root after the last entry was logged
+    pub merkle_root: Option<String>,
+}
+
 /// Submit a VĀKYA for execution
 pub async fn submit_vakya(
     State(state): State<Arc<AppState>>,
-    Json(request): Json<SubmitVakyaRequest>,
+    JsonOrCbor(request): JsonOrCbor<SubmitVakyaRequest>,
 ) -> GatewayResult<Json<SubmitVakyaResponse>> {
+    process_submission(&state, request, Utc::now()).await.map(Json)
+}
+
+/// Submit several VĀKYAs in one request
+///
+/// Entries go through exactly the same validation, signature, policy,
+/// execution and logging steps as `POST /v1/vakya`. Validation and signature
+/// checks run for the whole batch first, the signatures in one Ed25519 batch
+/// verification; entries are then logged and executed one after another in
+/// request order, so their leaf indices follow the array order. A failing
+/// entry is reported in its slot and does not stop the rest of the batch.
+pub async fn submit_vakya_batch(
+    State(state): State<Arc<AppState>>,
+    JsonOrCbor(requests): JsonOrCbor<Vec<SubmitVakyaRequest>>,
+) -> GatewayResult<Json<SubmitBatchResponse>> {
+    if requests.is_empty() {
+        return Err(GatewayError::Validation("Batch must contain at least one VĀKYA".to_string()));
+    }
+    if requests.len() > MAX_BATCH_SIZE {
+        return Err(GatewayError::Validation(format!(
+            "Batch of {} exceeds the limit of {} VĀKYAs",
+            requests.len(),
+            MAX_BATCH_SIZE
+        )));
+    }
+
+    info!(count = requests.len(), "Received VĀKYA batch submission");
+
+    // One logical submission, one timestamp for every record it writes
+    let received_at = Utc::now();
+
+    // Validate and canonicalize every entry up front so that all required
+    // signatures can be checked with a single Ed25519 batch verification
+    let prepared: Vec<GatewayResult<(PreparedSubmission, Option<aapi_crypto::VakyaSignature>)>> = requests
+        .into_iter()
+        .map(|request| {
+            let prepared = prepare_submission(request)?;
+            let signature = required_signature(&state, &prepared, received_at)?;
+            Ok((prepared, signature))
+        })
+        .collect();
+    let mut verifications = {
+        let to_verify: Vec<_> = prepared
+            .iter()
+            .filter_map(|entry| match entry {
+                Ok((prepared, Some(signature))) => Some((&prepared.sandhi, signature)),
+                _ => None,
+            })
+            .collect();
+        state.verifier.verify_detached_batch(&to_verify).into_iter()
+    };
+
+    let mut results = Vec::with_capacity(prepared.len());
+    let mut merkle_root = None;
+    for entry in prepared {
+        let outcome = match entry {
+            Ok((prepared, signature)) => {
+                let verified = match signature {
+                    Some(_) => {
+                        let verification = verifications
+                            .next()
+                            .expect("one verification per collected signature");
+                        check_verification(&prepared, verification)
+                    }
+                    None => Ok(()),
+                };
+                match verified {
+                    Ok(()) => {
+                        complete_submission(&state, prepared, received_at, std::time::Instant::now()).await
+                    }
+                    Err(e) => Err(e),
+                }
+            }
+            Err(e) => Err(e),
+        };
+
+        match outcome {
+            Ok(response) => {
+                if response.merkle_root.is_some() {
+                    merkle_root = response.merkle_root.clone();
+                }
+                results.push(BatchItemResponse::Submitted(response));
+            }
+            Err(e) => {
+                let (status, error) = e.to_response_parts();
+                results.push(BatchItemResponse::Failed {
+                    status_code: status.as_u16(),
+                    error,
+                });
+            }
+        }
+    }
+
+    Ok(Json(SubmitBatchResponse { results, merkle_root }))
+}
+
+/// Validate, authorize, log and execute one submitted VĀKYA
+///
+/// `received_at` stamps the signature check, the stored VĀKYA record and its
+/// receipt, so the clock is read once per submission rather than per record.
+async fn process_submission(
+    state: &AppState,
+    request: SubmitVakyaRequest,
+    received_at: DateTime<Utc>,
+) -> GatewayResult<SubmitVakyaResponse> {
     let start = std::time::Instant::now();
+    let prepared = prepare_submission(request)?;
+
+    if let Some(signature) = required_signature(state, &prepared, received_at)? {
+        check_verification(&prepared, state.verifier.verify_detached(&prepared.sandhi, &signature))?;
+    }
+
+    complete_submission(state, prepared, received_at, start).await
+}
+
+/// A submitted VĀKYA that passed validation and has been canonicalized
+struct PreparedSubmission {
+    vakya: Vakya,
+    vakya_json: serde_json::Value,
+    sandhi: SandhiOutput,
+    signature: Option<String>,
+    key_id: Option<String>,
+}
+
+/// Validate a submitted VĀKYA and canonicalize it
+///
+/// The signature check, the stored hash and the stored JSON all reuse the
+/// canonical form computed here.
+fn prepare_submission(request: SubmitVakyaRequest) -> GatewayResult<PreparedSubmission> {
     let vakya = request.vakya;
-    
+
     info!(vakya_id = %vakya.vakya_id, action = %vakya.v3_kriya.action, "Received VĀKYA submission");
 
     // Validate the VĀKYA
@@ -108,62 +265,94 @@ pub async fn submit_vakya(
         return Err(GatewayError::Validation(e.to_string()));
     }
 
-    // Production mode security checks
-    if state.config.signatures_required() {
-        match (&request.signature, &request.key_id) {
-            (Some(sig), Some(key_id)) => {
-                // Build SignedVakya for verification
-                let signed = SignedVakya {
-                    vakya: vakya.clone(),
-                    vakya_hash: {
-                        let sandhi = canonicalize(&vakya)
-                            .map_err(|e| GatewayError::Internal(e.to_string()))?;
-                        sandhi.vakya_hash.value.clone()
-                    },
-                    signature: aapi_crypto::VakyaSignature {
-                        key_id: aapi_crypto::KeyId(key_id.clone()),
-                        algorithm: aapi_crypto::SignatureAlgorithm::Ed25519,
-                        value: sig.clone(),
-                        signed_at: chrono::Utc::now(),
-                    },
-                };
+    let vakya_json = serde_json::to_value(&vakya)?;
+    let sandhi = canonicalize_json(&vakya.vakya_id.0, &vakya_json)
+        .map_err(|e| GatewayError::Internal(e.to_string()))?;
 
-                match state.verifier.verify(&signed) {
-                    Ok(result) if result.valid => {
-                        info!(vakya_id = %vakya.vakya_id, "Signature verified");
-                    }
-                    Ok(result) => {
-                        warn!(
-                            vakya_id = %vakya.vakya_id,
-                            key_id = %key_id,
-                            reason = ?result.reason,
-                            "Signature verification failed"
-                        );
-                        return Err(GatewayError::AuthorizationDenied(
-                            format!("Invalid signature: {}", result.reason.unwrap_or_default()),
-                        ));
-                    }
-                    Err(e) => {
-                        warn!(
-                            vakya_id = %vakya.vakya_id,
-                            key_id = %key_id,
-                            "Signature verification error: {}",
-                            e
-                        );
-                        return Err(GatewayError::AuthorizationDenied(
-                            format!("Signature verification error: {}", e),
-                        ));
-                    }
-                }
-            }
-            _ => {
-                warn!(vakya_id = %vakya.vakya_id, "Missing signature or key_id in production mode");
-                return Err(GatewayError::AuthorizationDenied(
-                    "Signature required in production mode".to_string(),
-                ));
-            }
+    Ok(PreparedSubmission {
+        vakya,
+        vakya_json,
+        sandhi,
+        signature: request.signature,
+        key_id: request.key_id,
+    })
+}
+
+/// The detached signature a submission must be verified against
+///
+/// `None` when signatures are not required; an error in production mode when
+/// the signature or key ID is missing.
+fn required_signature(
+    state: &AppState,
+    prepared: &PreparedSubmission,
+    received_at: DateTime<Utc>,
+) -> GatewayResult<Option<aapi_crypto::VakyaSignature>> {
+    if !state.config.signatures_required() {
+        return Ok(None);
+    }
+
+    match (&prepared.signature, &prepared.key_id) {
+        (Some(sig), Some(key_id)) => Ok(Some(aapi_crypto::VakyaSignature {
+            key_id: aapi_crypto::KeyId(key_id.clone()),
+            algorithm: aapi_crypto::SignatureAlgorithm::Ed25519,
+            value: sig.clone(),
+            signed_at: received_at,
+        })),
+        _ => {
+            warn!(vakya_id = %prepared.vakya.vakya_id, "Missing signature or key_id in production mode");
+            Err(GatewayError::AuthorizationDenied(
+                "Signature required in production mode".to_string(),
+            ))
         }
     }
+}
+
+/// Turn a signature verification outcome into an authorization decision
+fn check_verification(
+    prepared: &PreparedSubmission,
+    verification: aapi_crypto::CryptoResult<VerificationResult>,
+) -> GatewayResult<()> {
+    let vakya_id = &prepared.vakya.vakya_id;
+    let key_id = prepared.key_id.as_deref().unwrap_or_default();
+
+    match verification {
+        Ok(result) if result.valid => {
+            info!(vakya_id = %vakya_id, "Signature verified");
+            Ok(())
+        }
+        Ok(result) => {
+            warn!(
+                vakya_id = %vakya_id,
+                key_id = %key_id,
+                reason = ?result.reason,
+                "Signature verification failed"
+            );
+            Err(GatewayError::AuthorizationDenied(
+                format!("Invalid signature: {}", result.reason.unwrap_or_default()),
+            ))
+        }
+        Err(e) => {
+            warn!(
+                vakya_id = %vakya_id,
+                key_id = %key_id,
+                "Signature verification error: {}",
+                e
+            );
+            Err(GatewayError::AuthorizationDenied(
+                format!("Signature verification error: {}", e),
+            ))
+        }
+    }
+}
+
+/// Log, authorize against policy, execute and receipt a verified submission
+async fn complete_submission(
+    state: &AppState,
+    prepared: PreparedSubmission,
+    received_at: DateTime<Utc>,
+    start: std::time::Instant,
+) -> GatewayResult<SubmitVakyaResponse> {
+    let PreparedSubmission { vakya, vakya_json, sandhi, signature, key_id } = prepared;
 
     // Note: Capability verification requires a CapabilityToken, which is not part of the
     // current request schema. For now, we log a warning if capabilities are required but
@@ -177,10 +366,6 @@ pub async fn submit_vakya(
         );
     }
 
-    // Canonicalize and hash
-    let sandhi = canonicalize(&vakya)
-        .map_err(|e| GatewayError::Internal(e.to_string()))?;
-    
     let vakya_hash = sandhi.vakya_hash.value.clone();
 
     // Store the VĀKYA record
@@ -190,14 +375,15 @@ pub async fn submit_vakya(
         vakya.v1_karta.pid.0.clone(),
         vakya.v2_karma.rid.0.clone(),
         vakya.v3_kriya.action.clone(),
-        serde_json::to_value(&vakya).unwrap_or_default(),
+        vakya_json,
     );
     
     record.karta_type = format!("{:?}", vakya.v1_karta.actor_type).to_lowercase();
     record.karma_kind = vakya.v2_karma.kind.clone();
     record.expected_effect = vakya.v3_kriya.expected_effect;
-    record.signature = request.signature;
-    record.key_id = request.key_id;
+    record.signature = signature;
+    record.key_id = key_id;
+    record.created_at = received_at;
     
     if let Some(ref trace) = vakya.meta.trace {
         record.trace_id = Some(trace.trace_id.clone());
@@ -205,12 +391,16 @@ pub async fn submit_vakya(
         record.parent_span_id = trace.parent_span_id.clone();
     }
 
-    let stored = state.index_db.store_vakya(record).await
-        .map_err(|e| GatewayError::Database(e.to_string()))?;
-
-    // Evaluate policy before execution
+    // Log the VĀKYA and evaluate policy before execution. Policy evaluation
+    // only reads the VĀKYA, so it overlaps with the index write instead of
+    // waiting for it.
     let eval_ctx = EvaluationContext::new(vakya.clone());
-    let policy_decision = state.policy_engine.evaluate(&eval_ctx).await
+    let (stored, policy_decision) = tokio::join!(
+        state.index_db.store_vakya(record),
+        state.policy_engine.evaluate(&eval_ctx),
+    );
+    let stored = stored.map_err(|e| GatewayError::Database(e.to_string()))?;
+    let policy_decision = policy_decision
         .map_err(|e| GatewayError::Internal(format!("Policy evaluation failed: {}", e)))?;
 
     info!(
@@ -232,7 +422,7 @@ pub async fn submit_vakya(
             }
 
             // Create denial receipt
-            let receipt = ReceiptRecord::new(
+            let mut receipt = ReceiptRecord::new(
                 vakya.vakya_id.0.clone(),
                 vakya_hash.clone(),
                 ReasonCode::PolicyDenied,
@@ -242,10 +432,11 @@ pub async fn submit_vakya(
                     "reason": policy_decision.reason,
                 }),
             );
+            receipt.created_at = received_at;
             let stored_receipt = state.index_db.store_receipt(receipt).await
                 .map_err(|e| GatewayError::Database(e.to_string()))?;
 
-            return Ok(Json(SubmitVakyaResponse {
+            return Ok(SubmitVakyaResponse {
                 vakya_id: vakya.vakya_id.0,
                 vakya_hash,
                 status: "denied".to_string(),
@@ -267,14 +458,14 @@ pub async fn submit_vakya(
                     matched_rules: Some(policy_decision.matched_rules.iter().map(|r| r.rule_name.clone()).collect()),
                     approval_id: None,
                 }),
-            }));
+            });
         }
         DecisionType::PendingApproval => {
             let duration_ms = start.elapsed().as_millis() as i64;
             let approval_id = uuid::Uuid::new_v4().to_string();
 
             // Create pending approval receipt
-            let receipt = ReceiptRecord::new(
+            let mut receipt = ReceiptRecord::new(
                 vakya.vakya_id.0.clone(),
                 vakya_hash.clone(),
                 ReasonCode::ApprovalRequired,
@@ -285,10 +476,11 @@ pub async fn submit_vakya(
                     "reason": policy_decision.reason,
                 }),
             );
+            receipt.created_at = received_at;
             let stored_receipt = state.index_db.store_receipt(receipt).await
                 .map_err(|e| GatewayError::Database(e.to_string()))?;
 
-            return Ok(Json(SubmitVakyaResponse {
+            return Ok(SubmitVakyaResponse {
                 vakya_id: vakya.vakya_id.0,
                 vakya_hash,
                 status: "pending_approval".to_string(),
@@ -310,7 +502,7 @@ pub async fn submit_vakya(
                     matched_rules: Some(policy_decision.matched_rules.iter().map(|r| r.rule_name.clone()).collect()),
                     approval_id: Some(approval_id),
                 }),
-            }));
+            });
         }
         _ => {
             // Allow or NotApplicable - proceed with execution
@@ -402,6 +594,7 @@ pub async fn submit_vakya(
     receipt.message = message;
     receipt.duration_ms = Some(duration_ms);
     receipt.effect_ids = effect_ids;
+    receipt.created_at = received_at;
 
     let stored_receipt = state
         .index_db
@@ -420,7 +613,7 @@ pub async fn submit_vakya(
         );
     }
 
-    Ok(Json(SubmitVakyaResponse {
+    Ok(SubmitVakyaResponse {
         vakya_id: vakya.vakya_id.0,
         vakya_hash,
         status: if stored_receipt.reason_code.is_success() { "accepted".to_string() } else { "failed".to_string() },
@@ -437,7 +630,7 @@ pub async fn submit_vakya(
         merkle_root: stored.merkle_root,
         leaf_index: stored.leaf_index,
         policy_decision: None,
-    }))
+    })
 }
 
 /// Get VĀKYA by ID
@@ -519,7 +712,7 @@ pub struct InclusionProofQuery {
 pub async fn get_inclusion_proof(
     State(state): State<Arc<AppState>>,
     Query(query): Query<InclusionProofQuery>,
-) -> GatewayResult<Json<serde_json::Value>> {
+) -> GatewayResult<Json<InclusionProof>> {
     let tree_type = match query.tree_type.as_str() {
         "vakya" => TreeType::Vakya,
         "effect" => TreeType::Effect,
@@ -531,7 +724,9 @@ pub async fn get_inclusion_proof(
         .map_err(|e| GatewayError::Database(e.to_string()))?
         .ok_or_else(|| GatewayError::NotFound("Proof not found".to_string()))?;
 
-    Ok(Json(serde_json::to_value(proof).unwrap_or_default()))
+    // Serialize the proof directly; going through serde_json::Value first
+    // would build and then re-walk a tree of every sibling hash.
+    Ok(Json(proof))
 }
 
 /// Gateway metrics response
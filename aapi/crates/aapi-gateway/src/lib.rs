@@ -13,8 +13,10 @@ pub mod middleware;
 pub mod state;
 pub mod error;
 pub mod routes;
+pub mod extract;
 
 pub use server::*;
 pub use handlers::*;
 pub use state::*;
 pub use error::*;
+pub use extract::*;
@@ -18,6 +18,7 @@ pub fn create_router(state: Arc<AppState>) -> Router {
         
         // VĀKYA operations
         .route("/v1/vakya", post(submit_vakya))
+        .route("/v1/vakya/batch", post(submit_vakya_batch))
         .route("/v1/vakya/:vakya_id", get(get_vakya))
         .route("/v1/vakya/:vakya_id/receipt", get(get_receipt))
         .route("/v1/vakya/:vakya_id/effects", get(get_effects))
@@ -115,6 +116,42 @@ async fn openapi_spec() -> axum::Json<serde_json::Value> {
                     }
                 }
             },
+            "/v1/vakya/batch": {
+                "post": {
+                    "summary": "Submit several VĀKYAs in one request",
+                    "operationId": "submitVakyaBatch",
+                    "tags": ["VĀKYA"],
+                    "requestBody": {
+                        "required": true,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "maxItems": 256,
+                                    "items": {
+                                        "$ref": "#/components/schemas/SubmitVakyaRequest"
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Per-VĀKYA results, in request order",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "$ref": "#/components/schemas/SubmitBatchResponse"
+                                    }
+                                }
+                            }
+                        },
+                        "400": {
+                            "description": "Empty or oversized batch"
+                        }
+                    }
+                }
+            },
             "/v1/vakya/{vakya_id}": {
                 "get": {
                     "summary": "Get a VĀKYA by ID",
@@ -300,6 +337,28 @@ async fn openapi_spec() -> axum::Json<serde_json::Value> {
                         "leaf_index": { "type": "integer" }
                     }
                 },
+                "SubmitBatchResponse": {
+                    "type": "object",
+                    "properties": {
+                        "results": {
+                            "type": "array",
+                            "items": {
+                                "oneOf": [
+                                    { "$ref": "#/components/schemas/SubmitVakyaResponse" },
+                                    {
+                                        "type": "object",
+                                        "properties": {
+                                            "status_code": { "type": "integer" },
+                                            "error": { "type": "string" },
+                                            "message": { "type": "string" }
+                                        }
+                                    }
+                                ]
+                            }
+                        },
+                        "merkle_root": { "type": "string" }
+                    }
+                },
                 "Vakya": {
                     "type": "object",
                     "description": "VĀKYA - Agentic Action Request envelope"
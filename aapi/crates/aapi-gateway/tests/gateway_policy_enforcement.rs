@@ -1,7 +1,6 @@
 use std::sync::Arc;
 
 use axum::extract::State;
-use axum::Json;
 
 use aapi_core::{
     ActorType,
@@ -16,7 +15,8 @@ use aapi_core::{
     Vakya,
 };
 
-use aapi_gateway::handlers::{submit_vakya, SubmitVakyaRequest};
+use aapi_gateway::extract::JsonOrCbor;
+use aapi_gateway::handlers::{submit_vakya, submit_vakya_batch, BatchItemResponse, SubmitVakyaRequest};
 use aapi_gateway::state::{AppState, GatewayConfig};
 
 fn test_adhikarana() -> Adhikarana {
@@ -77,7 +77,7 @@ async fn deny_decision_blocks_execution_and_stores_no_effects() {
         key_id: None,
     };
 
-    let response = submit_vakya(State(Arc::clone(&state)), Json(request))
+    let response = submit_vakya(State(Arc::clone(&state)), JsonOrCbor(request))
         .await
         .expect("handler ok")
         .0;
@@ -119,7 +119,7 @@ async fn pending_approval_blocks_execution_and_stores_no_effects() {
         key_id: None,
     };
 
-    let response = submit_vakya(State(Arc::clone(&state)), Json(request))
+    let response = submit_vakya(State(Arc::clone(&state)), JsonOrCbor(request))
         .await
         .expect("handler ok")
         .0;
@@ -150,3 +150,47 @@ async fn pending_approval_blocks_execution_and_stores_no_effects() {
         .expect("stored receipt");
     assert_eq!(stored_receipt.reason_code, aapi_core::error::ReasonCode::ApprovalRequired);
 }
+
+#[tokio::test]
+async fn batch_submission_reports_each_entry_in_order() {
+    let config = GatewayConfig::default();
+    let state = Arc::new(AppState::in_memory(config).await.expect("state"));
+
+    let denied = build_vakya("file.delete", "file:/tmp/aapi/batch-deny.txt");
+    let pending = build_vakya("http.post", "http:https://example.com/batch");
+    let ids = [denied.vakya_id.0.clone(), pending.vakya_id.0.clone()];
+
+    let requests = vec![
+        SubmitVakyaRequest { vakya: denied, signature: None, key_id: None },
+        SubmitVakyaRequest { vakya: pending, signature: None, key_id: None },
+    ];
+
+    let response = submit_vakya_batch(State(Arc::clone(&state)), JsonOrCbor(requests))
+        .await
+        .expect("handler ok")
+        .0;
+
+    assert_eq!(response.results.len(), 2);
+    let statuses: Vec<(&str, &str)> = response
+        .results
+        .iter()
+        .map(|item| match item {
+            BatchItemResponse::Submitted(r) => (r.vakya_id.as_str(), r.status.as_str()),
+            BatchItemResponse::Failed { error, .. } => panic!("unexpected failure: {}", error.message),
+        })
+        .collect();
+    assert_eq!(statuses, vec![(ids[0].as_str(), "denied"), (ids[1].as_str(), "pending_approval")]);
+
+    let last_root = match &response.results[1] {
+        BatchItemResponse::Submitted(r) => r.merkle_root.clone(),
+        _ => None,
+    };
+    assert_eq!(response.merkle_root, last_root);
+
+    for vakya_id in &ids {
+        assert!(state.index_db.get_receipt(vakya_id).await.expect("receipt query").is_some());
+    }
+
+    let empty = submit_vakya_batch(State(Arc::clone(&state)), JsonOrCbor(Vec::new())).await;
+    assert!(empty.is_err());
+}
@@ -3,13 +3,21 @@
 use sha2::{Sha256, Digest};
 use std::collections::HashMap;
 
+/// Raw SHA-256 digest of a tree node
+type Digest32 = [u8; 32];
+
 /// In-memory Merkle tree for append-only logs
+///
+/// Every complete subtree is hashed exactly once, when its last leaf is
+/// appended, and kept level by level. Appends are amortised O(1), and roots
+/// and inclusion proofs only combine the O(log n) nodes on the right edge.
+/// Node hashes are kept as raw digests and only hex-encoded when they leave
+/// the tree (roots, leaves and proof paths).
 #[derive(Debug, Clone)]
 pub struct MerkleTree {
-    /// Leaf hashes
-    leaves: Vec<String>,
-    /// Cached internal nodes: (level, index) -> hash
-    nodes: HashMap<(usize, usize), String>,
+    /// `levels[0]` holds the leaf hashes; `levels[k + 1][i]` is the hash of
+    /// the complete pair `levels[k][2i]`, `levels[k][2i + 1]`
+    levels: Vec<Vec<Digest32>>,
 }
 
 impl Default for MerkleTree {
@@ -22,59 +30,60 @@ impl MerkleTree {
     /// Create a new empty Merkle tree
     pub fn new() -> Self {
         Self {
-            leaves: Vec::new(),
-            nodes: HashMap::new(),
+            levels: Vec::new(),
         }
     }
 
     /// Append a new leaf and return its index
     pub fn append(&mut self, data: &str) -> usize {
-        let leaf_hash = self.hash_leaf(data.as_bytes());
-        let index = self.leaves.len();
-        self.leaves.push(leaf_hash);
-        
-        // Invalidate cached nodes (simple approach - rebuild on demand)
-        self.nodes.clear();
-        
+        let index = self.size();
+        let mut node = hash_leaf(data.as_bytes());
+
+        // Each time a level gains the second node of a pair, the pair is
+        // complete and its parent goes one level up
+        for level in 0.. {
+            if self.levels.len() == level {
+                self.levels.push(Vec::new());
+            }
+            let nodes = &mut self.levels[level];
+            nodes.push(node);
+            if nodes.len() % 2 == 1 {
+                break;
+            }
+            node = hash_internal(&nodes[nodes.len() - 2], &nodes[nodes.len() - 1]);
+        }
+
         index
     }
 
     /// Get the number of leaves
     pub fn size(&self) -> usize {
-        self.leaves.len()
+        self.leaves().len()
     }
 
     /// Check if the tree is empty
     pub fn is_empty(&self) -> bool {
-        self.leaves.is_empty()
+        self.leaves().is_empty()
     }
 
     /// Get the root hash
     pub fn root(&self) -> Option<String> {
-        if self.leaves.is_empty() {
-            return None;
-        }
-        
-        if self.leaves.len() == 1 {
-            return Some(self.leaves[0].clone());
-        }
-
-        Some(self.compute_root(&self.leaves))
+        self.root_at(self.size()).map(hex::encode)
     }
 
     /// Get a leaf hash by index
-    pub fn get_leaf(&self, index: usize) -> Option<&String> {
-        self.leaves.get(index)
+    pub fn get_leaf(&self, index: usize) -> Option<String> {
+        self.leaves().get(index).map(hex::encode)
     }
 
     /// Get an inclusion proof for a leaf
     pub fn get_proof(&self, leaf_index: usize) -> Option<MerkleProof> {
-        if leaf_index >= self.leaves.len() {
-            return None;
-        }
-
-        let leaf_hash = self.leaves[leaf_index].clone();
-        let path = self.compute_proof_path(leaf_index);
+        let leaf_hash = hex::encode(self.leaves().get(leaf_index)?);
+        let path = self
+            .compute_proof_path(leaf_index)
+            .into_iter()
+            .map(|(sibling, is_right)| (hex::encode(sibling), is_right))
+            .collect();
         
         Some(MerkleProof {
             leaf_hash,
@@ -85,115 +94,86 @@ impl MerkleTree {
 
     /// Verify an inclusion proof
     pub fn verify_proof(&self, proof: &MerkleProof) -> bool {
-        let root = match self.root() {
-            Some(r) => r,
-            None => return false,
-        };
+        match self.root() {
+            Some(root) => proof.verify(&root),
+            None => false,
+        }
+    }
 
-        let computed_root = self.compute_root_from_proof(proof);
-        computed_root == root
+    /// Verify many inclusion proofs, computing the root only once
+    pub fn verify_proofs(&self, proofs: &[MerkleProof]) -> Vec<bool> {
+        match self.root() {
+            Some(root) => MerkleProof::verify_batch(proofs, &root),
+            None => vec![false; proofs.len()],
+        }
     }
 
-    /// Hash a leaf (with 0x00 prefix to distinguish from internal nodes)
-    fn hash_leaf(&self, data: &[u8]) -> String {
-        let mut hasher = Sha256::new();
-        hasher.update(&[0x00]); // Leaf prefix
-        hasher.update(data);
-        hex::encode(hasher.finalize())
+    fn leaves(&self) -> &[Digest32] {
+        self.levels.first().map_or(&[], Vec::as_slice)
     }
 
-    /// Hash an internal node (with 0x01 prefix)
-    fn hash_internal(&self, left: &str, right: &str) -> String {
-        let mut hasher = Sha256::new();
-        hasher.update(&[0x01]); // Internal node prefix
-        hasher.update(hex::decode(left).unwrap_or_default());
-        hasher.update(hex::decode(right).unwrap_or_default());
-        hex::encode(hasher.finalize())
+    /// Complete nodes of `level` in the tree made of the first `size` leaves
+    ///
+    /// Complete subtrees never change once built, so every prefix of the log
+    /// shares them: the first `size >> level` nodes of a level are exactly
+    /// the ones the smaller tree would have built.
+    fn level_nodes(&self, level: usize, size: usize) -> &[Digest32] {
+        match self.levels.get(level) {
+            Some(nodes) => &nodes[..size >> level],
+            None => &[],
+        }
     }
 
-    /// Compute the root hash from leaves
-    fn compute_root(&self, leaves: &[String]) -> String {
-        if leaves.len() == 1 {
-            return leaves[0].clone();
+    /// Compute the root hash of the tree made of the first `size` leaves
+    fn root_at(&self, size: usize) -> Option<Digest32> {
+        if size == 0 {
+            return None;
         }
 
-        let mut current_level: Vec<String> = leaves.to_vec();
-
-        while current_level.len() > 1 {
-            let mut next_level = Vec::new();
-            let mut i = 0;
-
-            while i < current_level.len() {
-                if i + 1 < current_level.len() {
-                    let hash = self.hash_internal(&current_level[i], &current_level[i + 1]);
-                    next_level.push(hash);
-                    i += 2;
-                } else {
-                    // Odd node: promote to next level
-                    next_level.push(current_level[i].clone());
-                    i += 1;
-                }
+        let mut partial = None;
+        for level in 0.. {
+            let nodes = self.level_nodes(level, size);
+            match (nodes, partial) {
+                ([], Some(root)) => return Some(root),
+                ([root], None) => return Some(*root),
+                _ => partial = carry_partial(nodes, partial),
             }
-
-            current_level = next_level;
         }
-
-        current_level[0].clone()
+        unreachable!("a non-empty tree always reaches its root")
     }
 
     /// Compute the proof path for a leaf
-    fn compute_proof_path(&self, leaf_index: usize) -> Vec<(String, bool)> {
+    fn compute_proof_path(&self, leaf_index: usize) -> Vec<(Digest32, bool)> {
+        let size = self.size();
         let mut path = Vec::new();
-        let mut current_level = self.leaves.clone();
         let mut index = leaf_index;
+        let mut partial = None;
 
-        while current_level.len() > 1 {
-            let sibling_index = if index % 2 == 0 { index + 1 } else { index - 1 };
-            
-            if sibling_index < current_level.len() {
-                let is_right = index % 2 == 0;
-                path.push((current_level[sibling_index].clone(), is_right));
+        for level in 0.. {
+            let nodes = self.level_nodes(level, size);
+            let width = nodes.len() + usize::from(partial.is_some());
+            if width <= 1 {
+                break;
             }
 
-            // Move to next level
-            let mut next_level = Vec::new();
-            let mut i = 0;
-            while i < current_level.len() {
-                if i + 1 < current_level.len() {
-                    let hash = self.hash_internal(&current_level[i], &current_level[i + 1]);
-                    next_level.push(hash);
-                    i += 2;
-                } else {
-                    next_level.push(current_level[i].clone());
-                    i += 1;
+            let sibling_index = index ^ 1;
+            if sibling_index < width {
+                let sibling = nodes.get(sibling_index).copied().or(partial);
+                if let Some(sibling) = sibling {
+                    path.push((sibling, index % 2 == 0));
                 }
             }
 
-            current_level = next_level;
+            partial = carry_partial(nodes, partial);
             index /= 2;
         }
 
         path
     }
 
-    /// Compute root from a proof
-    fn compute_root_from_proof(&self, proof: &MerkleProof) -> String {
-        let mut current = proof.leaf_hash.clone();
-
-        for (sibling, is_right) in &proof.path {
-            if *is_right {
-                current = self.hash_internal(&current, sibling);
-            } else {
-                current = self.hash_internal(sibling, &current);
-            }
-        }
-
-        current
-    }
-
     /// Get a consistency proof between two tree sizes
     pub fn get_consistency_proof(&self, first_size: usize, second_size: usize) -> Option<ConsistencyProof> {
-        if first_size > second_size || second_size > self.leaves.len() {
+        if first_size > second_size || second_size > self.size() {
             return None;
         }
 
@@ -205,8 +185,8 @@ impl MerkleTree {
             });
         }
 
-        let first_root = self.compute_root(&self.leaves[..first_size]);
-        let second_root = self.compute_root(&self.leaves[..second_size]);
+        let first_root = hex::encode(self.root_at(first_size)?);
+        let second_root = hex::encode(self.root_at(second_size)?);
 
         // Simplified consistency proof - just include the roots
         // A full implementation would include the minimal set of nodes
@@ -218,6 +198,41 @@ impl MerkleTree {
     }
 }
 
+/// Hash a leaf (with 0x00 prefix to distinguish from internal nodes)
+fn hash_leaf(data: &[u8]) -> Digest32 {
+    let mut hasher = Sha256::new();
+    hasher.update([0x00]); // Leaf prefix
+    hasher.update(data);
+    hasher.finalize().into()
+}
+
+/// Hash an internal node (with 0x01 prefix)
+///
+/// The whole `0x01 || left || right` preimage is laid out in one stack buffer
+/// and hashed in a single call, so the compression function runs over
+/// contiguous blocks instead of three fragmented updates.
+fn hash_internal(left: &Digest32, right: &Digest32) -> Digest32 {
+    let mut preimage = [0u8; 65];
+    preimage[0] = 0x01; // Internal node prefix
+    preimage[1..33].copy_from_slice(left);
+    preimage[33..].copy_from_slice(right);
+    Sha256::digest(preimage).into()
+}
+
+/// Trailing node of the next level up that is not a complete subtree
+///
+/// A level of the tree is its complete `nodes` plus, possibly, a `partial`
+/// node built from an incomplete right edge below. If the complete nodes are
+/// odd in number the last one pairs with the partial node, or is promoted
+/// alone when there is none; otherwise the partial node is promoted as is.
+fn carry_partial(nodes: &[Digest32], partial: Option<Digest32>) -> Option<Digest32> {
+    match (nodes.last(), partial) {
+        (Some(last), Some(right)) if nodes.len() % 2 == 1 => Some(hash_internal(last, &right)),
+        (Some(last), None) if nodes.len() % 2 == 1 => Some(*last),
+        _ => partial,
+    }
+}
+
 /// Merkle inclusion proof
 #[derive(Debug, Clone)]
 pub struct MerkleProof {
@@ -232,10 +247,125 @@ pub struct MerkleProof {
 impl MerkleProof {
     /// Verify the proof against a known root
     pub fn verify(&self, expected_root: &str) -> bool {
-        let tree = MerkleTree::new();
-        let computed = tree.compute_root_from_proof(self);
-        computed == expected_root
+        let mut expected = [0u8; 32];
+        if hex::decode_to_slice(expected_root, &mut expected).is_err() {
+            return false;
+        }
+        root_from_path(&self.leaf_hash, &self.path) == Some(expected)
+    }
+
+    /// Verify a batch of proofs against one known root
+    ///
+    /// Gives the same answers as calling [`MerkleProof::verify`] on each
+    /// proof, but the root is decoded once and one preimage buffer serves the
+    /// whole batch. Every digest on a path that verified is remembered
+    /// together with the sibling path that led from it to the root, so a
+    /// later proof stops hashing once it reaches such a node with an
+    /// identical remaining path: proofs for neighbouring leaves only pay for
+    /// the levels they do not share, and every sibling is still checked.
+    pub fn verify_batch(proofs: &[MerkleProof], expected_root: &str) -> Vec<bool> {
+        let mut expected = [0u8; 32];
+        if hex::decode_to_slice(expected_root, &mut expected).is_err() {
+            return vec![false; proofs.len()];
+        }
+
+        // Decoded paths of verified proofs; the root's is empty
+        let mut paths: Vec<Vec<(Digest32, bool)>> = vec![Vec::new()];
+        // digest -> (index into `paths`, offset of its remaining path)
+        let mut known: HashMap<Digest32, (usize, usize)> = HashMap::new();
+        known.insert(expected, (0, 0));
+
+        let mut preimage = [0u8; 65];
+        preimage[0] = 0x01; // Internal node prefix
+        let mut trail: Vec<Digest32> = Vec::new();
+
+        proofs
+            .iter()
+            .map(|proof| {
+                let mut current = [0u8; 32];
+                if hex::decode_to_slice(&proof.leaf_hash, &mut current).is_err() {
+                    return false;
+                }
+                let mut path = Vec::with_capacity(proof.path.len());
+                for (sibling, is_right) in &proof.path {
+                    let mut digest = [0u8; 32];
+                    if hex::decode_to_slice(sibling, &mut digest).is_err() {
+                        return false;
+                    }
+                    path.push((digest, *is_right));
+                }
+
+                // `digest` is a verified node whose path to the root is `rest`
+                let leads_to_root = |known: &HashMap<Digest32, (usize, usize)>,
+                                     digest: &Digest32,
+                                     rest: &[(Digest32, bool)]| {
+                    known.get(digest).map_or(false, |&(id, offset)| paths[id][offset..] == *rest)
+                };
+
+                trail.clear();
+                for (i, (sibling, is_right)) in path.iter().enumerate() {
+                    if leads_to_root(&known, &current, &path[i..]) {
+                        break;
+                    }
+                    trail.push(current);
+                    current = hash_pair(&mut preimage, &current, sibling, *is_right);
+                }
+
+                if !leads_to_root(&known, &current, &path[trail.len()..]) {
+                    return false;
+                }
+                for (i, digest) in trail.iter().enumerate() {
+                    known.insert(*digest, (paths.len(), i));
+                }
+                paths.push(path);
+                true
+            })
+            .collect()
+    }
+}
+
+/// Fold a proof path up from the leaf to the root digest it implies
+///
+/// Digests stay raw for the whole walk: each sibling is hex-decoded straight
+/// into one reused `0x01 || left || right` preimage buffer, so a hop costs a
+/// single SHA-256 call and no allocations. Returns `None` on malformed hex.
+fn root_from_path(leaf_hash: &str, path: &[(String, bool)]) -> Option<[u8; 32]> {
+    let mut current = [0u8; 32];
+    hex::decode_to_slice(leaf_hash, &mut current).ok()?;
+
+    let mut preimage = [0u8; 65];
+    preimage[0] = 0x01; // Internal node prefix
+
+    for (sibling, is_right) in path {
+        current = hash_hop(&mut preimage, &current, sibling, *is_right)?;
     }
+
+    Some(current)
+}
+
+/// Hash one proof hop: place `current` and the hex `sibling` into the
+/// `0x01`-prefixed preimage buffer on their sides and digest it
+fn hash_hop(preimage: &mut [u8; 65], current: &Digest32, sibling: &str, is_right: bool) -> Option<Digest32> {
+    let (current_slot, sibling_slot) = if is_right {
+        (1..33, 33..65)
+    } else {
+        (33..65, 1..33)
+    };
+    preimage[current_slot].copy_from_slice(current);
+    hex::decode_to_slice(sibling, &mut preimage[sibling_slot]).ok()?;
+    Some(Sha256::digest(&preimage[..]).into())
+}
+
+/// [`hash_hop`] for a sibling that is already decoded
+fn hash_pair(preimage: &mut [u8; 65], current: &Digest32, sibling: &Digest32, is_right: bool) -> Digest32 {
+    let (current_slot, sibling_slot) = if is_right {
+        (1..33, 33..65)
+    } else {
+        (33..65, 1..33)
+    };
+    preimage[current_slot].copy_from_slice(current);
+    preimage[sibling_slot].copy_from_slice(sibling);
+    Sha256::digest(&preimage[..]).into()
 }
 
 /// Consistency proof between two tree states
@@ -367,6 +497,143 @@ mod tests {
         assert!(!tree.verify_proof(&proof));
     }
 
+    #[test]
+    fn test_standalone_proof_verify() {
+        let mut tree = MerkleTree::new();
+        for i in 0..7 {
+            tree.append(&format!("leaf{}", i));
+        }
+        let root = tree.root().unwrap();
+
+        for i in 0..7 {
+            let proof = tree.get_proof(i).unwrap();
+            assert!(proof.verify(&root), "Proof failed for leaf {}", i);
+        }
+
+        let mut proof = tree.get_proof(3).unwrap();
+        proof.path[0].1 = !proof.path[0].1;
+        assert!(!proof.verify(&root));
+        assert!(!tree.get_proof(3).unwrap().verify("not-hex"));
+    }
+
+    /// Rebuild-everything reference: hash pairs level by level, promoting
+    /// an odd trailing node
+    fn reference_levels(leaves: &[Digest32]) -> Vec<Vec<Digest32>> {
+        let mut levels = vec![leaves.to_vec()];
+        while levels.last().unwrap().len() > 1 {
+            let next = levels
+                .last()
+                .unwrap()
+                .chunks(2)
+                .map(|pair| match pair {
+                    [left, right] => hash_internal(left, right),
+                    [single] => *single,
+                    _ => unreachable!(),
+                })
+                .collect();
+            levels.push(next);
+        }
+        levels
+    }
+
+    #[test]
+    fn test_incremental_tree_matches_full_rebuild() {
+        let mut tree = MerkleTree::new();
+        let mut leaves = Vec::new();
+
+        for n in 1..=40usize {
+            tree.append(&format!("leaf{}", n));
+            leaves.push(hash_leaf(format!("leaf{}", n).as_bytes()));
+
+            let levels = reference_levels(&leaves);
+            assert_eq!(tree.root().unwrap(), hex::encode(levels.last().unwrap()[0]), "root of {}", n);
+
+            for i in 0..n {
+                let mut expected = Vec::new();
+                let mut index = i;
+                for level in &levels[..levels.len() - 1] {
+                    let sibling = index ^ 1;
+                    if sibling < level.len() {
+                        expected.push((hex::encode(level[sibling]), index % 2 == 0));
+                    }
+                    index /= 2;
+                }
+                assert_eq!(tree.get_proof(i).unwrap().path, expected, "proof {} of {}", i, n);
+            }
+
+            for m in 1..=n {
+                let prefix = reference_levels(&leaves[..m]);
+                let proof = tree.get_consistency_proof(m, n).unwrap();
+                assert_eq!(proof.proof_hashes[0], hex::encode(prefix.last().unwrap()[0]));
+            }
+        }
+    }
+
+    #[test]
+    fn test_internal_hash_matches_streamed_hash() {
+        let left = hash_leaf(b"left");
+        let right = hash_leaf(b"right");
+
+        let mut hasher = Sha256::new();
+        hasher.update([0x01]);
+        hasher.update(left);
+        hasher.update(right);
+        let streamed: Digest32 = hasher.finalize().into();
+
+        assert_eq!(hash_internal(&left, &right), streamed);
+
+        let mut tree = MerkleTree::new();
+        tree.append("left");
+        tree.append("right");
+        assert_eq!(tree.root().unwrap(), hex::encode(streamed));
+        assert_eq!(tree.get_leaf(0).unwrap(), hex::encode(left));
+    }
+
+    #[test]
+    fn test_verify_batch_matches_single() {
+        let mut tree = MerkleTree::new();
+        for i in 0..11 {
+            tree.append(&format!("leaf{}", i));
+        }
+        let root = tree.root().unwrap();
+
+        let mut proofs: Vec<MerkleProof> = (0..11).map(|i| tree.get_proof(i).unwrap()).collect();
+        // Repeat a proof, tamper with one, and add one with an extra hop
+        proofs.push(tree.get_proof(4).unwrap());
+        proofs[2].path[1].1 = !proofs[2].path[1].1;
+        let mut padded = tree.get_proof(7).unwrap();
+        padded.path.push((root.clone(), true));
+        proofs.push(padded);
+
+        let expected: Vec<bool> = proofs.iter().map(|p| p.verify(&root)).collect();
+        assert_eq!(MerkleProof::verify_batch(&proofs, &root), expected);
+        assert_eq!(tree.verify_proofs(&proofs), expected);
+        assert_eq!(expected.iter().filter(|ok| !**ok).count(), 2);
+
+        assert_eq!(MerkleProof::verify_batch(&proofs, "zz"), vec![false; proofs.len()]);
+    }
+
+    #[test]
+    fn test_verify_batch_checks_siblings_above_shared_node() {
+        let mut tree = MerkleTree::new();
+        for i in 0..11 {
+            tree.append(&format!("leaf{}", i));
+        }
+        let root = tree.root().unwrap();
+
+        // Leaves 0 and 1 share their parent; garbage above it must still fail
+        let mut proofs = vec![tree.get_proof(0).unwrap(), tree.get_proof(1).unwrap()];
+        proofs[1].path[1].0 = hex::encode([0x42u8; 32]);
+        let mut bad_hex = tree.get_proof(1).unwrap();
+        bad_hex.path[2].0 = "not hex".to_string();
+        proofs.push(bad_hex);
+        proofs.push(tree.get_proof(1).unwrap());
+
+        let expected: Vec<bool> = proofs.iter().map(|p| p.verify(&root)).collect();
+        assert_eq!(expected, vec![true, false, false, true]);
+        assert_eq!(MerkleProof::verify_batch(&proofs, &root), expected);
+    }
+
     #[test]
     fn test_consistency_proof() {
         let mut tree = MerkleTree::new();
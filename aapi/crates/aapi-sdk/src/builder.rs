@@ -1,16 +1,19 @@
 //! Fluent builders for VĀKYA construction
 
-use chrono::{Duration, Utc};
-
 use aapi_core::{
     Vakya, VakyaBuilder, VakyaId,
     Karta, Karma, Kriya, Karana, Sampradana, Apadana, Adhikarana,
     CapabilityRef, TtlConstraint, BodyType,
-    ActorType, ApprovalLane,
+    ActorType, ApprovalLane, AapiError,
 };
 use aapi_core::types::{PrincipalId, ResourceId, Namespace, Timestamp, SemanticVersion, Budget};
 
 /// Fluent builder for creating VĀKYA requests
+///
+/// The builder is `Clone`, so fields that are fixed for an agent (actor,
+/// actor type, capability, TTL) can be set once on a template and each
+/// request cloned from it, patching only the resource, action and body.
+#[derive(Debug, Clone)]
 pub struct VakyaRequestBuilder {
     actor_pid: Option<String>,
     actor_role: Option<String>,
@@ -19,6 +22,8 @@ pub struct VakyaRequestBuilder {
     resource_kind: Option<String>,
     resource_ns: Option<String>,
     action: Option<String>,
+    /// Pre-split (domain, verb) for preset actions, skips parsing in `build`
+    action_parts: Option<(&'static str, &'static str)>,
     capability_ref: Option<String>,
     ttl_secs: Option<i64>,
     body: serde_json::Value,
@@ -42,6 +47,7 @@ impl VakyaRequestBuilder {
             resource_kind: None,
             resource_ns: None,
             action: None,
+            action_parts: None,
             capability_ref: None,
             ttl_secs: Some(3600), // 1 hour default
             body: serde_json::json!({}),
@@ -100,9 +106,29 @@ impl VakyaRequestBuilder {
     /// Set the action (what is being done)
     pub fn action(mut self, action: impl Into<String>) -> Self {
         self.action = Some(action.into());
+        self.action_parts = None;
         self
     }
 
+    /// Start from a fixed action preset: actor, resource, kind and the
+    /// already-split action are filled in directly
+    fn preset(
+        actor: impl Into<String>,
+        rid: String,
+        kind: &'static str,
+        domain: &'static str,
+        verb: &'static str,
+    ) -> Self {
+        Self {
+            actor_pid: Some(actor.into()),
+            resource_id: Some(rid),
+            resource_kind: Some(kind.to_string()),
+            action: Some(format!("{}.{}", domain, verb)),
+            action_parts: Some((domain, verb)),
+            ..Self::new()
+        }
+    }
+
     /// Set capability reference
     pub fn capability(mut self, cap_ref: impl Into<String>) -> Self {
         self.capability_ref = Some(cap_ref.into());
@@ -159,18 +185,39 @@ impl VakyaRequestBuilder {
         let resource_id = self.resource_id.ok_or("Resource ID is required")?;
         let action = self.action.ok_or("Action is required")?;
 
-        // Parse action into domain.verb
-        let (domain, verb) = if action.contains('.') {
-            let parts: Vec<&str> = action.splitn(2, '.').collect();
-            (parts[0].to_string(), parts[1].to_string())
-        } else {
-            ("default".to_string(), action.clone())
+        // Everything below is synthesized here, so only the checks from
+        // Vakya::validate that caller input can actually trip are repeated
+        // and the final build skips the full validation pass.
+        for (value, field) in [
+            (&actor_pid, "v1_karta.pid"),
+            (&resource_id, "v2_karma.rid"),
+            (&action, "v3_kriya.action"),
+        ] {
+            if value.is_empty() {
+                return Err(AapiError::MissingField(field.into()).to_string());
+            }
+        }
+
+        // Parse action into domain.verb (presets arrive already split)
+        let (domain, verb) = match self.action_parts {
+            Some((domain, verb)) => (domain.to_string(), verb.to_string()),
+            None => match action.split_once('.') {
+                Some((domain, verb)) => (domain.to_string(), verb.to_string()),
+                None => ("default".to_string(), action.clone()),
+            },
         };
 
-        let ttl = self.ttl_secs.map(|secs| TtlConstraint {
-            expires_at: Timestamp(Utc::now() + Duration::seconds(secs)),
-            max_duration_ms: Some((secs * 1000) as u64),
-        });
+        // Read the clock once so created_at and the TTL share the same instant
+        let now = Timestamp::now();
+        let ttl = self.ttl_secs.map(|secs| TtlConstraint::from_secs(&now, secs));
+        if let Some(ref ttl) = ttl {
+            if ttl.expires_at.0 <= now.0 {
+                return Err(AapiError::TtlExpired {
+                    expired_at: ttl.expires_at.to_string(),
+                }
+                .to_string());
+            }
+        }
 
         let cap_ref = self.capability_ref.unwrap_or_else(|| "cap:default".to_string());
 
@@ -211,7 +258,8 @@ impl VakyaRequestBuilder {
                 required_phase: None,
                 required_role: None,
             })
-            .body(self.body);
+            .body(self.body)
+            .created_at(now);
 
         if let Some(trace_id) = self.trace_id {
             builder = builder.trace(aapi_core::types::TraceContext {
@@ -231,7 +279,7 @@ impl VakyaRequestBuilder {
             });
         }
 
-        builder.build().map_err(|e| e.to_string())
+        builder.build_unchecked().map_err(|e| e.to_string())
     }
 }
 
@@ -241,39 +289,23 @@ pub struct FileActionBuilder;
 impl FileActionBuilder {
     /// Read a file
     pub fn read(actor: impl Into<String>, path: impl Into<String>) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(format!("file:{}", path.into()))
-            .resource_with_kind(String::new(), "file")
-            .action("file.read")
+        VakyaRequestBuilder::preset(actor, format!("file:{}", path.into()), "file", "file", "read")
     }
 
     /// Write to a file
     pub fn write(actor: impl Into<String>, path: impl Into<String>, content: impl Into<String>) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(format!("file:{}", path.into()))
-            .resource_with_kind(String::new(), "file")
-            .action("file.write")
+        VakyaRequestBuilder::preset(actor, format!("file:{}", path.into()), "file", "file", "write")
             .body(serde_json::json!({"content": content.into()}))
     }
 
     /// Delete a file
     pub fn delete(actor: impl Into<String>, path: impl Into<String>) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(format!("file:{}", path.into()))
-            .resource_with_kind(String::new(), "file")
-            .action("file.delete")
+        VakyaRequestBuilder::preset(actor, format!("file:{}", path.into()), "file", "file", "delete")
     }
 
     /// List directory
     pub fn list(actor: impl Into<String>, path: impl Into<String>) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(format!("file:{}", path.into()))
-            .resource_with_kind(String::new(), "directory")
-            .action("file.list")
+        VakyaRequestBuilder::preset(actor, format!("file:{}", path.into()), "directory", "file", "list")
     }
 }
 
@@ -283,40 +315,24 @@ pub struct HttpActionBuilder;
 impl HttpActionBuilder {
     /// HTTP GET request
     pub fn get(actor: impl Into<String>, url: impl Into<String>) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(url)
-            .resource_with_kind(String::new(), "http")
-            .action("http.get")
+        VakyaRequestBuilder::preset(actor, url.into(), "http", "http", "get")
     }
 
     /// HTTP POST request
     pub fn post(actor: impl Into<String>, url: impl Into<String>, body: serde_json::Value) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(url)
-            .resource_with_kind(String::new(), "http")
-            .action("http.post")
+        VakyaRequestBuilder::preset(actor, url.into(), "http", "http", "post")
             .body(serde_json::json!({"body": body}))
     }
 
     /// HTTP PUT request
     pub fn put(actor: impl Into<String>, url: impl Into<String>, body: serde_json::Value) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(url)
-            .resource_with_kind(String::new(), "http")
-            .action("http.put")
+        VakyaRequestBuilder::preset(actor, url.into(), "http", "http", "put")
             .body(serde_json::json!({"body": body}))
     }
 
     /// HTTP DELETE request
     pub fn delete(actor: impl Into<String>, url: impl Into<String>) -> VakyaRequestBuilder {
-        VakyaRequestBuilder::new()
-            .actor(actor)
-            .resource(url)
-            .resource_with_kind(String::new(), "http")
-            .action("http.delete")
+        VakyaRequestBuilder::preset(actor, url.into(), "http", "http", "delete")
     }
 }
 
@@ -340,6 +356,71 @@ mod tests {
         assert_eq!(vakya.v3_kriya.action, "file.read");
     }
 
+    #[test]
+    fn test_ttl_derived_from_created_at() {
+        let vakya = VakyaRequestBuilder::new()
+            .actor("user:alice")
+            .resource("file:/home/alice/test.txt")
+            .action("file.read")
+            .ttl_secs(90)
+            .build()
+            .unwrap();
+
+        let ttl = vakya.v7_adhikarana.ttl.unwrap();
+        assert_eq!(ttl.expires_at.0 - vakya.meta.created_at.0, chrono::Duration::seconds(90));
+    }
+
+    #[test]
+    fn test_build_keeps_input_checks() {
+        let err = VakyaRequestBuilder::new()
+            .actor("")
+            .resource("file:/tmp/x")
+            .action("file.read")
+            .build()
+            .unwrap_err();
+        assert!(err.contains("v1_karta.pid"));
+
+        let err = FileActionBuilder::read("user:bob", "/tmp/x")
+            .ttl_secs(-5)
+            .build()
+            .unwrap_err();
+        assert!(err.contains("TTL expired"));
+    }
+
+    #[test]
+    fn test_builder_template_reuse() {
+        let template = VakyaRequestBuilder::new()
+            .actor("agent:ehr-bot")
+            .as_agent()
+            .capability("cap:ehr-write");
+
+        let update = template
+            .clone()
+            .resource("ehr:patient:P-1")
+            .action("ehr.update_allergy")
+            .body_field("allergy", serde_json::json!("penicillin"))
+            .build()
+            .unwrap();
+        let read = template
+            .clone()
+            .resource("ehr:patient:P-2")
+            .action("ehr.read")
+            .build()
+            .unwrap();
+
+        for vakya in [&update, &read] {
+            assert_eq!(vakya.v1_karta.pid.0, "agent:ehr-bot");
+            assert_eq!(vakya.v1_karta.actor_type, ActorType::Agent);
+            assert!(matches!(
+                &vakya.v7_adhikarana.cap,
+                CapabilityRef::Reference { cap_ref } if cap_ref == "cap:ehr-write"
+            ));
+        }
+        assert_eq!(update.body["allergy"], "penicillin");
+        // Body fields set on one clone do not leak into the template
+        assert_eq!(read.body, serde_json::json!({}));
+    }
+
     #[test]
     fn test_file_action_builder() {
         let vakya = FileActionBuilder::read("user:bob", "/data/report.csv")
@@ -349,6 +430,32 @@ mod tests {
         assert!(vakya.is_ok());
     }
 
+    #[test]
+    fn test_preset_matches_parsed_action() {
+        let preset = FileActionBuilder::list("user:bob", "/data").build().unwrap();
+        let parsed = VakyaRequestBuilder::new()
+            .actor("user:bob")
+            .resource("file:/data")
+            .resource_with_kind(String::new(), "directory")
+            .action("file.list")
+            .build()
+            .unwrap();
+
+        assert_eq!(preset.v2_karma.rid.0, parsed.v2_karma.rid.0);
+        assert_eq!(preset.v2_karma.kind, parsed.v2_karma.kind);
+        assert_eq!(preset.v3_kriya.action, parsed.v3_kriya.action);
+        assert_eq!(preset.v3_kriya.domain, parsed.v3_kriya.domain);
+        assert_eq!(preset.v3_kriya.verb, parsed.v3_kriya.verb);
+
+        // Overriding the action drops the pre-split parts
+        let vakya = HttpActionBuilder::get("agent:a", "https://example.com")
+            .action("net.fetch")
+            .build()
+            .unwrap();
+        assert_eq!(vakya.v3_kriya.domain.as_deref(), Some("net"));
+        assert_eq!(vakya.v3_kriya.verb.as_deref(), Some("fetch"));
+    }
+
     #[test]
     fn test_http_action_builder() {
         let vakya = HttpActionBuilder::post(
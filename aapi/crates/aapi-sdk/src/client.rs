@@ -1,12 +1,16 @@
 //! AAPI Client for interacting with the Gateway
 
-use reqwest::{Client, StatusCode};
+use futures::stream::{self, StreamExt};
+use reqwest::{header::CONTENT_TYPE, Client, StatusCode, Url};
 use serde::{Deserialize, Serialize};
-use std::time::Duration;
+use std::collections::{HashMap, VecDeque};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex, MutexGuard, PoisonError};
+use std::time::{Duration, Instant};
 use tracing::{debug, info};
 
-use aapi_core::Vakya;
-use aapi_crypto::{KeyStore, KeyId, VakyaSigner, SignedVakya};
+use aapi_core::{SandhiOutput, Vakya};
+use aapi_crypto::{KeyStore, KeyId, VakyaSigner, VakyaSignature, SignedVakya};
 
 use crate::error::{SdkError, SdkResult};
 
@@ -23,8 +27,43 @@ pub struct ClientConfig {
     pub signing_key_id: Option<KeyId>,
     /// User agent string
     pub user_agent: String,
+    /// Maximum idle keep-alive connections kept per host
+    pub pool_max_idle_per_host: usize,
+    /// How long an idle pooled connection is kept open, in seconds
+    pub pool_idle_timeout_secs: u64,
+    /// Speak HTTP/2 without ALPN negotiation (h2c, for plaintext gateways
+    /// that are known to support it). TLS gateways negotiate HTTP/2 on
+    /// their own.
+    pub http2_prior_knowledge: bool,
+    /// Maximum requests kept in flight by `submit_many`
+    pub max_concurrent_submits: usize,
+    /// How long a fetched Merkle root is served from cache, in milliseconds
+    /// (0, the default, disables root caching). A cached root does not see
+    /// writes made during its TTL, including this client's own submits.
+    pub merkle_root_ttl_ms: u64,
+    /// Maximum inclusion proofs kept in cache, oldest evicted first
+    /// (0, the default, disables proof caching). Cached proofs are only
+    /// dropped when a different root is fetched for their tree, so callers
+    /// enabling this should re-fetch the root before trusting old proofs.
+    pub merkle_proof_cache_size: usize,
+    /// Encoding used for submit request bodies
+    pub wire_format: WireFormat,
 }
 
+/// Encoding of request bodies sent to the gateway
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+pub enum WireFormat {
+    /// `application/json`
+    #[default]
+    Json,
+    /// `application/cbor`, falling back to JSON if the gateway answers
+    /// 415 Unsupported Media Type
+    Cbor,
+}
+
+/// Media type for CBOR request bodies
+const CBOR_CONTENT_TYPE: &str = "application/cbor";
+
 impl Default for ClientConfig {
     fn default() -> Self {
         Self {
@@ -33,6 +72,13 @@ impl Default for ClientConfig {
             sign_requests: false,
             signing_key_id: None,
             user_agent: format!("aapi-sdk/{}", env!("CARGO_PKG_VERSION")),
+            pool_max_idle_per_host: 20,
+            pool_idle_timeout_secs: 30,
+            http2_prior_knowledge: false,
+            max_concurrent_submits: 100,
+            merkle_root_ttl_ms: 0,
+            merkle_proof_cache_size: 0,
+            wire_format: WireFormat::Json,
         }
     }
 }
@@ -55,29 +101,171 @@ impl ClientConfig {
         self.signing_key_id = Some(key_id);
         self
     }
+
+    pub fn with_pool(mut self, max_idle_per_host: usize, idle_timeout_secs: u64) -> Self {
+        self.pool_max_idle_per_host = max_idle_per_host;
+        self.pool_idle_timeout_secs = idle_timeout_secs;
+        self
+    }
+
+    pub fn with_http2_prior_knowledge(mut self) -> Self {
+        self.http2_prior_knowledge = true;
+        self
+    }
+
+    pub fn with_merkle_cache(mut self, root_ttl_ms: u64, proof_cache_size: usize) -> Self {
+        self.merkle_root_ttl_ms = root_ttl_ms;
+        self.merkle_proof_cache_size = proof_cache_size;
+        self
+    }
+
+    pub fn with_wire_format(mut self, wire_format: WireFormat) -> Self {
+        self.wire_format = wire_format;
+        self
+    }
+
+    pub fn with_max_concurrent_submits(mut self, max_concurrent_submits: usize) -> Self {
+        self.max_concurrent_submits = max_concurrent_submits.max(1);
+        self
+    }
 }
 
 /// AAPI Client for submitting requests to the Gateway
+///
+/// Cloning is cheap and clones share the same connection pool, so one
+/// client can be handed to many concurrent tasks.
+#[derive(Clone)]
 pub struct AapiClient {
     config: ClientConfig,
     http_client: Client,
     key_store: Option<KeyStore>,
     signer: Option<VakyaSigner>,
+    endpoints: Arc<Endpoints>,
+    merkle_cache: Arc<Mutex<MerkleCache>>,
+    /// Set once the gateway has rejected a CBOR body with 415
+    cbor_rejected: Arc<AtomicBool>,
+    /// Pre-encoded `,"key_id":"..."}` tail of the signed JSON envelope
+    key_id_suffix: Option<Arc<[u8]>>,
+}
+
+/// Gateway endpoint URLs, parsed once when the client is created
+///
+/// Requests clone a ready `Url` (and append query pairs or path segments
+/// for parametric routes) instead of formatting and re-parsing a string.
+#[derive(Debug)]
+struct Endpoints {
+    submit: Url,
+    submit_batch: Url,
+    health: Url,
+    merkle_root: Url,
+    merkle_proof: Url,
+}
+
+impl Endpoints {
+    fn new(gateway_url: &str) -> SdkResult<Self> {
+        let parse = |path: &str| {
+            let url = Url::parse(&format!("{}{}", gateway_url, path))
+                .map_err(|e| SdkError::Configuration(format!("Invalid gateway URL: {}", e)))?;
+            if url.cannot_be_a_base() {
+                return Err(SdkError::Configuration(format!("Invalid gateway URL: {}", gateway_url)));
+            }
+            Ok(url)
+        };
+
+        Ok(Self {
+            submit: parse("/v1/vakya")?,
+            submit_batch: parse("/v1/vakya/batch")?,
+            health: parse("/health")?,
+            merkle_root: parse("/v1/merkle/root")?,
+            merkle_proof: parse("/v1/merkle/proof")?,
+        })
+    }
+
+    /// `/v1/vakya/{id}` plus an optional trailing segment
+    fn vakya(&self, vakya_id: &str, tail: Option<&str>) -> Url {
+        let mut url = self.submit.clone();
+        if let Ok(mut segments) = url.path_segments_mut() {
+            segments.push(vakya_id);
+            if let Some(tail) = tail {
+                segments.push(tail);
+            }
+        }
+        url
+    }
+}
+
+/// Merkle data already fetched from the gateway, shared between clones
+#[derive(Default)]
+struct MerkleCache {
+    /// tree_type -> (fetched at, root)
+    roots: HashMap<String, (Instant, MerkleRootResponse)>,
+    /// (tree_type, leaf_index) -> proof
+    proofs: HashMap<(String, i64), InclusionProofResponse>,
+    /// Proof keys in insertion order, for eviction
+    proof_order: VecDeque<(String, i64)>,
+}
+
+impl MerkleCache {
+    fn insert_proof(&mut self, key: (String, i64), proof: InclusionProofResponse, capacity: usize) {
+        if self.proofs.insert(key.clone(), proof).is_none() {
+            self.proof_order.push_back(key);
+        }
+        while self.proofs.len() > capacity {
+            match self.proof_order.pop_front() {
+                Some(oldest) => { self.proofs.remove(&oldest); }
+                None => break,
+            }
+        }
+    }
+
+    /// Drop proofs for `tree_type` that do not lead to `root_hash`
+    fn prune_proofs(&mut self, tree_type: &str, root_hash: Option<&str>) {
+        let proofs = &mut self.proofs;
+        proofs.retain(|(tree, _), proof| tree != tree_type || root_hash == Some(proof.root_hash.as_str()));
+        self.proof_order.retain(|key| proofs.contains_key(key));
+    }
+
+    fn clear(&mut self) {
+        self.roots.clear();
+        self.proofs.clear();
+        self.proof_order.clear();
+    }
 }
 
 impl AapiClient {
     /// Create a new client with the given configuration
     pub fn new(config: ClientConfig) -> SdkResult<Self> {
-        let http_client = Client::builder()
+        // Requests are small JSON round-trips, so keep connections warm and
+        // let HTTP/2 multiplex them instead of paying a handshake per call.
+        let mut builder = Client::builder()
             .timeout(Duration::from_secs(config.timeout_secs))
             .user_agent(&config.user_agent)
-            .build()?;
+            .pool_max_idle_per_host(config.pool_max_idle_per_host)
+            .pool_idle_timeout(Duration::from_secs(config.pool_idle_timeout_secs))
+            .tcp_keepalive(Duration::from_secs(config.pool_idle_timeout_secs))
+            .tcp_nodelay(true)
+            .http2_adaptive_window(true);
+
+        if config.http2_prior_knowledge {
+            builder = builder.http2_prior_knowledge();
+        }
+
+        let http_client = builder.build()?;
+        let endpoints = Arc::new(Endpoints::new(&config.gateway_url)?);
+        let key_id_suffix = match config.signing_key_id {
+            Some(ref key_id) => Some(key_id_suffix(&key_id.0)?.into()),
+            None => None,
+        };
 
         Ok(Self {
             config,
             http_client,
             key_store: None,
             signer: None,
+            endpoints,
+            merkle_cache: Arc::new(Mutex::new(MerkleCache::default())),
+            cbor_rejected: Arc::new(AtomicBool::new(false)),
+            key_id_suffix,
         })
     }
 
@@ -91,90 +279,325 @@ impl AapiClient {
 
     /// Submit a VĀKYA request
     pub async fn submit(&self, vakya: Vakya) -> SdkResult<SubmitResponse> {
-        let url = format!("{}/v1/vakya", self.config.gateway_url);
-        
         debug!(vakya_id = %vakya.vakya_id, action = %vakya.v3_kriya.action, "Submitting VĀKYA");
 
-        let request_body = if self.config.sign_requests {
-            if let (Some(ref signer), Some(ref key_id)) = (&self.signer, &self.config.signing_key_id) {
-                let signed = signer.sign(&vakya, key_id)
-                    .map_err(|e| SdkError::Signing(e.to_string()))?;
-                
-                SubmitRequest {
-                    vakya,
-                    signature: Some(signed.signature.value),
-                    key_id: Some(signed.signature.key_id.0),
-                }
-            } else {
-                return Err(SdkError::Configuration(
-                    "Signing enabled but no key store or key ID configured".to_string()
-                ));
-            }
-        } else {
-            SubmitRequest {
-                vakya,
-                signature: None,
-                key_id: None,
+        let signed = self.sign_for_submit(&vakya)?;
+
+        if self.cbor_enabled() {
+            let envelope = SubmitRequest::new(&vakya, signed.as_ref());
+            if let Some(response) = self.post_cbor(self.endpoints.submit.clone(), &envelope).await? {
+                return self.handle_response(response).await;
             }
-        };
+        }
+
+        let mut body = Vec::new();
+        self.write_json_envelope(&mut body, &vakya, signed)?;
 
         let response = self.http_client
-            .post(&url)
-            .json(&request_body)
+            .post(self.endpoints.submit.clone())
+            .header(CONTENT_TYPE, "application/json")
+            .body(body)
             .send()
             .await?;
 
         self.handle_response(response).await
     }
 
+    /// Submit several VĀKYA requests in a single gateway call
+    ///
+    /// All envelopes are signed and sent as one array to `/v1/vakya/batch`
+    /// (CBOR or JSON, following `wire_format`), so the batch costs one
+    /// round-trip instead of one per VĀKYA. The gateway processes entries in
+    /// order; the outer error covers signing and transport, the inner results
+    /// are per-VĀKYA outcomes in input order.
+    pub async fn submit_batch(&self, vakyas: Vec<Vakya>) -> SdkResult<Vec<SdkResult<SubmitResponse>>> {
+        debug!(count = vakyas.len(), "Submitting VĀKYA batch");
+
+        let signed = vakyas
+            .iter()
+            .map(|vakya| self.sign_for_submit(vakya))
+            .collect::<SdkResult<Vec<_>>>()?;
+
+        if self.cbor_enabled() {
+            let envelopes: Vec<SubmitRequest<'_>> = vakyas
+                .iter()
+                .zip(&signed)
+                .map(|(vakya, signed)| SubmitRequest::new(vakya, signed.as_ref()))
+                .collect();
+            if let Some(response) = self.post_cbor(self.endpoints.submit_batch.clone(), &envelopes).await? {
+                let batch: SubmitBatchResponse = self.handle_response(response).await?;
+                return Ok(batch.results.into_iter().map(BatchItem::into_result).collect());
+            }
+        }
+
+        // Envelopes are written straight into the batch body, with no
+        // per-entry buffer to copy
+        let mut body = Vec::new();
+        body.push(b'[');
+        for (i, (vakya, signed)) in vakyas.iter().zip(signed).enumerate() {
+            if i > 0 {
+                body.push(b',');
+            }
+            self.write_json_envelope(&mut body, vakya, signed)?;
+        }
+        body.push(b']');
+
+        let response = self.http_client
+            .post(self.endpoints.submit_batch.clone())
+            .header(CONTENT_TYPE, "application/json")
+            .body(body)
+            .send()
+            .await?;
+
+        let batch: SubmitBatchResponse = self.handle_response(response).await?;
+        Ok(batch.results.into_iter().map(BatchItem::into_result).collect())
+    }
+
+    /// Whether request bodies should be sent as CBOR
+    fn cbor_enabled(&self) -> bool {
+        self.config.wire_format == WireFormat::Cbor && !self.cbor_rejected.load(Ordering::Relaxed)
+    }
+
+    /// POST a CBOR-encoded body
+    ///
+    /// Returns `None` when the gateway answers 415, after which the client
+    /// stops trying CBOR and callers resend as JSON.
+    async fn post_cbor<T: Serialize>(&self, url: Url, value: &T) -> SdkResult<Option<reqwest::Response>> {
+        let mut body = Vec::new();
+        ciborium::into_writer(value, &mut body)
+            .map_err(|e| SdkError::Configuration(format!("CBOR encoding failed: {}", e)))?;
+
+        let response = self.http_client
+            .post(url)
+            .header(CONTENT_TYPE, CBOR_CONTENT_TYPE)
+            .body(body)
+            .send()
+            .await?;
+
+        if response.status() != StatusCode::UNSUPPORTED_MEDIA_TYPE {
+            return Ok(Some(response));
+        }
+
+        // The gateway only speaks JSON; stop trying CBOR and resend
+        debug!("Gateway rejected CBOR body, falling back to JSON");
+        self.cbor_rejected.store(true, Ordering::Relaxed);
+        Ok(None)
+    }
+
+    /// Sign a VĀKYA for submission if request signing is enabled
+    fn sign_for_submit(&self, vakya: &Vakya) -> SdkResult<Option<(VakyaSignature, SandhiOutput)>> {
+        if !self.config.sign_requests {
+            return Ok(None);
+        }
+        match (&self.signer, &self.config.signing_key_id) {
+            (Some(signer), Some(key_id)) => signer
+                .sign_detached(vakya, key_id)
+                .map(Some)
+                .map_err(|e| SdkError::Signing(e.to_string())),
+            _ => Err(SdkError::Configuration(
+                "Signing enabled but no key store or key ID configured".to_string()
+            )),
+        }
+    }
+
+    /// Append the JSON submit envelope for a VĀKYA to `out`
+    fn write_json_envelope(
+        &self,
+        out: &mut Vec<u8>,
+        vakya: &Vakya,
+        signed: Option<(VakyaSignature, SandhiOutput)>,
+    ) -> SdkResult<()> {
+        match signed {
+            // Send the canonical bytes that were signed as the VĀKYA
+            // itself: no second serialization, and the wire form can
+            // never drift from the signed form.
+            Some((signature, sandhi)) => {
+                let suffix = match self.key_id_suffix {
+                    Some(ref suffix) => Arc::clone(suffix),
+                    None => key_id_suffix(&signature.key_id.0)?.into(),
+                };
+                write_signed_envelope(out, &sandhi.canonical_bytes, &signature.value, &suffix)
+            }
+            None => Ok(serde_json::to_writer(&mut *out, &SubmitRequest {
+                vakya,
+                signature: None,
+                key_id: None,
+            })?),
+        }
+    }
+
+    /// Submit several VĀKYA requests concurrently
+    ///
+    /// Up to `max_concurrent_submits` requests are in flight at once over the
+    /// shared pool (multiplexed as streams when the gateway speaks HTTP/2),
+    /// so N submits take roughly the slowest round-trip rather than the sum.
+    /// Results are returned in input order; one failure does not abort the
+    /// rest.
+    pub async fn submit_many(&self, vakyas: Vec<Vakya>) -> Vec<SdkResult<SubmitResponse>> {
+        stream::iter(vakyas)
+            .map(|vakya| self.submit(vakya))
+            .buffered(self.config.max_concurrent_submits.max(1))
+            .collect()
+            .await
+    }
+
+    /// Submit VĀKYAs concurrently, holding back those that depend on others
+    ///
+    /// Each entry lists the indices of earlier entries that the gateway must
+    /// have accepted before it is sent (e.g. a `file.read` after the
+    /// `file.write` that creates the file). Independent entries go out
+    /// together as in [`AapiClient::submit_many`], so the wall time is one
+    /// round-trip per dependency level rather than one per VĀKYA. An entry
+    /// whose dependency was not accepted, or that names itself or a later
+    /// entry, is not sent and reports a validation error. Results are
+    /// returned in input order.
+    pub async fn submit_with_dependencies(
+        &self,
+        entries: Vec<(Vakya, Vec<usize>)>,
+    ) -> Vec<SdkResult<SubmitResponse>> {
+        let (vakyas, deps): (Vec<Vakya>, Vec<Vec<usize>>) = entries.into_iter().unzip();
+        let levels = dependency_levels(&deps);
+
+        let mut pending: Vec<Option<Vakya>> = vakyas.into_iter().map(Some).collect();
+        let mut results: Vec<Option<SdkResult<SubmitResponse>>> = levels
+            .iter()
+            .enumerate()
+            .map(|(i, level)| match level {
+                Some(_) => None,
+                None => Some(Err(SdkError::Validation(format!(
+                    "VĀKYA {} may only depend on earlier entries", i
+                )))),
+            })
+            .collect();
+
+        let depth = levels.iter().flatten().max().map_or(0, |max| max + 1);
+        for level in 0..depth {
+            let mut wave = Vec::new();
+            for i in (0..levels.len()).filter(|&i| levels[i] == Some(level)) {
+                let unmet = deps[i].iter().copied().find(|&d| {
+                    !matches!(results[d], Some(Ok(ref response)) if response.status == "accepted")
+                });
+                match unmet {
+                    Some(d) => {
+                        results[i] = Some(Err(SdkError::Validation(format!(
+                            "VĀKYA {} not sent: dependency {} was not accepted", i, d
+                        ))));
+                    }
+                    None => wave.extend(pending[i].take().map(|vakya| (i, vakya))),
+                }
+            }
+
+            let responses: Vec<(usize, SdkResult<SubmitResponse>)> = stream::iter(wave)
+                .map(|(i, vakya)| async move { (i, self.submit(vakya).await) })
+                .buffer_unordered(self.config.max_concurrent_submits.max(1))
+                .collect()
+                .await;
+            for (i, response) in responses {
+                results[i] = Some(response);
+            }
+        }
+
+        results
+            .into_iter()
+            .map(|result| result.expect("every entry is resolved by its level"))
+            .collect()
+    }
+
     /// Get a VĀKYA by ID
     pub async fn get_vakya(&self, vakya_id: &str) -> SdkResult<VakyaResponse> {
-        let url = format!("{}/v1/vakya/{}", self.config.gateway_url, vakya_id);
+        let url = self.endpoints.vakya(vakya_id, None);
         
-        let response = self.http_client.get(&url).send().await?;
+        let response = self.http_client.get(url).send().await?;
         self.handle_response(response).await
     }
 
     /// Get receipt for a VĀKYA
     pub async fn get_receipt(&self, vakya_id: &str) -> SdkResult<ReceiptResponse> {
-        let url = format!("{}/v1/vakya/{}/receipt", self.config.gateway_url, vakya_id);
+        let url = self.endpoints.vakya(vakya_id, Some("receipt"));
         
-        let response = self.http_client.get(&url).send().await?;
+        let response = self.http_client.get(url).send().await?;
         self.handle_response(response).await
     }
 
     /// Get effects for a VĀKYA
     pub async fn get_effects(&self, vakya_id: &str) -> SdkResult<Vec<EffectResponse>> {
-        let url = format!("{}/v1/vakya/{}/effects", self.config.gateway_url, vakya_id);
+        let url = self.endpoints.vakya(vakya_id, Some("effects"));
         
-        let response = self.http_client.get(&url).send().await?;
+        let response = self.http_client.get(url).send().await?;
         self.handle_response(response).await
     }
 
     /// Get Merkle root for a tree type
+    ///
+    /// When `merkle_root_ttl_ms` is non-zero, roots are served from cache for
+    /// that long after a fetch; by default every call hits the gateway.
     pub async fn get_merkle_root(&self, tree_type: &str) -> SdkResult<MerkleRootResponse> {
-        let url = format!("{}/v1/merkle/root?tree_type={}", self.config.gateway_url, tree_type);
+        let ttl = Duration::from_millis(self.config.merkle_root_ttl_ms);
+        if let Some((fetched_at, root)) = self.merkle_cache().roots.get(tree_type) {
+            if fetched_at.elapsed() < ttl {
+                return Ok(root.clone());
+            }
+        }
+
+        let mut url = self.endpoints.merkle_root.clone();
+        url.query_pairs_mut().append_pair("tree_type", tree_type);
         
-        let response = self.http_client.get(&url).send().await?;
-        self.handle_response(response).await
+        let response = self.http_client.get(url).send().await?;
+        let root: MerkleRootResponse = self.handle_response(response).await?;
+
+        let mut cache = self.merkle_cache();
+        // Proofs for this tree that lead to another root are stale now,
+        // whether or not the root itself gets cached
+        cache.prune_proofs(tree_type, root.root_hash.as_deref());
+        if !ttl.is_zero() {
+            cache.roots.insert(tree_type.to_string(), (Instant::now(), root.clone()));
+        }
+
+        Ok(root)
     }
 
     /// Get inclusion proof
+    ///
+    /// When `merkle_proof_cache_size` is non-zero, proofs are cached per leaf
+    /// until a different root is fetched for the tree, the entry is evicted,
+    /// or [`AapiClient::invalidate_merkle_cache`] is called.
     pub async fn get_inclusion_proof(&self, tree_type: &str, leaf_index: i64) -> SdkResult<InclusionProofResponse> {
-        let url = format!(
-            "{}/v1/merkle/proof?tree_type={}&leaf_index={}",
-            self.config.gateway_url, tree_type, leaf_index
-        );
+        let key = (tree_type.to_string(), leaf_index);
+        if let Some(proof) = self.merkle_cache().proofs.get(&key) {
+            return Ok(proof.clone());
+        }
+
+        let mut url = self.endpoints.merkle_proof.clone();
+        url.query_pairs_mut()
+            .append_pair("tree_type", tree_type)
+            .append_pair("leaf_index", &leaf_index.to_string());
         
-        let response = self.http_client.get(&url).send().await?;
-        self.handle_response(response).await
+        let response = self.http_client.get(url).send().await?;
+        let proof: InclusionProofResponse = self.handle_response(response).await?;
+
+        let capacity = self.config.merkle_proof_cache_size;
+        if capacity > 0 {
+            self.merkle_cache().insert_proof(key, proof.clone(), capacity);
+        }
+
+        Ok(proof)
+    }
+
+    /// Drop all cached Merkle roots and inclusion proofs
+    pub fn invalidate_merkle_cache(&self) {
+        self.merkle_cache().clear();
+    }
+
+    fn merkle_cache(&self) -> MutexGuard<'_, MerkleCache> {
+        // The maps are always left consistent, so a poisoned lock is usable
+        self.merkle_cache.lock().unwrap_or_else(PoisonError::into_inner)
     }
 
     /// Health check
     pub async fn health(&self) -> SdkResult<HealthResponse> {
-        let url = format!("{}/health", self.config.gateway_url);
+        let url = self.endpoints.health.clone();
         
-        let response = self.http_client.get(&url).send().await?;
+        let response = self.http_client.get(url).send().await?;
         self.handle_response(response).await
     }
 
@@ -191,29 +614,77 @@ impl AapiClient {
                     message: "Unknown error".to_string(),
                 });
 
-            match status {
-                StatusCode::NOT_FOUND => Err(SdkError::NotFound(error_body.message)),
-                StatusCode::FORBIDDEN => Err(SdkError::Authorization(error_body.message)),
-                StatusCode::BAD_REQUEST => Err(SdkError::Validation(error_body.message)),
-                _ => Err(SdkError::Gateway {
-                    code: error_body.error,
-                    message: error_body.message,
-                }),
-            }
+            Err(error_body.into_error(status))
+        }
+    }
+}
+
+/// Dependency level of each entry: 0 for entries with no dependencies,
+/// otherwise one more than the deepest dependency. `None` marks entries that
+/// reference themselves, a later entry, or an entry that is itself invalid.
+fn dependency_levels(deps: &[Vec<usize>]) -> Vec<Option<usize>> {
+    let mut levels: Vec<Option<usize>> = Vec::with_capacity(deps.len());
+    for (i, entry_deps) in deps.iter().enumerate() {
+        let mut level = Some(0);
+        for &d in entry_deps {
+            level = match (level, levels.get(d).copied().flatten()) {
+                (Some(current), Some(dep_level)) if d < i => Some(current.max(dep_level + 1)),
+                _ => None,
+            };
         }
+        levels.push(level);
     }
+    levels
 }
 
 /// Request to submit a VĀKYA
 #[derive(Debug, Serialize)]
-struct SubmitRequest {
-    vakya: Vakya,
+struct SubmitRequest<'a> {
+    vakya: &'a Vakya,
     #[serde(skip_serializing_if = "Option::is_none")]
     signature: Option<String>,
     #[serde(skip_serializing_if = "Option::is_none")]
     key_id: Option<String>,
 }
 
+impl<'a> SubmitRequest<'a> {
+    /// Envelope for a VĀKYA and its detached signature, if any
+    fn new(vakya: &'a Vakya, signed: Option<&(VakyaSignature, SandhiOutput)>) -> Self {
+        Self {
+            vakya,
+            signature: signed.map(|(signature, _)| signature.value.clone()),
+            key_id: signed.map(|(signature, _)| signature.key_id.0.clone()),
+        }
+    }
+}
+
+/// Append a signed submit envelope around already-serialized VĀKYA JSON
+///
+/// `key_id_suffix` is the constant envelope tail from [`key_id_suffix`],
+/// encoded once per client rather than once per request.
+fn write_signed_envelope(
+    out: &mut Vec<u8>,
+    vakya_json: &[u8],
+    signature: &str,
+    key_id_suffix: &[u8],
+) -> SdkResult<()> {
+    out.reserve(vakya_json.len() + signature.len() + key_id_suffix.len() + 32);
+    out.extend_from_slice(b"{\"vakya\":");
+    out.extend_from_slice(vakya_json);
+    out.extend_from_slice(b",\"signature\":");
+    serde_json::to_writer(&mut *out, signature)?;
+    out.extend_from_slice(key_id_suffix);
+    Ok(())
+}
+
+/// Encode the `,"key_id":"..."}` tail of a signed submit envelope
+fn key_id_suffix(key_id: &str) -> SdkResult<Vec<u8>> {
+    let mut suffix = b",\"key_id\":".to_vec();
+    serde_json::to_writer(&mut suffix, key_id)?;
+    suffix.push(b'}');
+    Ok(suffix)
+}
+
 /// Response from submitting a VĀKYA
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct SubmitResponse {
@@ -299,6 +770,35 @@ pub struct HealthResponse {
     pub timestamp: String,
 }
 
+/// Response from a batch submission
+#[derive(Debug, Clone, Deserialize)]
+struct SubmitBatchResponse {
+    results: Vec<BatchItem>,
+}
+
+/// One entry of a batch submission response
+#[derive(Debug, Clone, Deserialize)]
+#[serde(untagged)]
+enum BatchItem {
+    Submitted(SubmitResponse),
+    Failed {
+        status_code: u16,
+        #[serde(flatten)]
+        error: ErrorResponse,
+    },
+}
+
+impl BatchItem {
+    fn into_result(self) -> SdkResult<SubmitResponse> {
+        match self {
+            BatchItem::Submitted(response) => Ok(response),
+            BatchItem::Failed { status_code, error } => Err(error.into_error(
+                StatusCode::from_u16(status_code).unwrap_or(StatusCode::INTERNAL_SERVER_ERROR),
+            )),
+        }
+    }
+}
+
 /// Error response from gateway
 #[derive(Debug, Clone, Deserialize)]
 struct ErrorResponse {
@@ -306,10 +806,200 @@ struct ErrorResponse {
     message: String,
 }
 
+impl ErrorResponse {
+    /// Map a gateway error body and its HTTP status to an SDK error
+    fn into_error(self, status: StatusCode) -> SdkError {
+        match status {
+            StatusCode::NOT_FOUND => SdkError::NotFound(self.message),
+            StatusCode::FORBIDDEN => SdkError::Authorization(self.message),
+            StatusCode::BAD_REQUEST => SdkError::Validation(self.message),
+            _ => SdkError::Gateway {
+                code: self.error,
+                message: self.message,
+            },
+        }
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_dependency_levels() {
+        // 0 and 2 are independent, 1 waits for 0, 3 waits for 1 and 2,
+        // 4 points forward and 5 depends on the invalid 4
+        let deps = vec![vec![], vec![0], vec![], vec![1, 2], vec![5], vec![4]];
+        assert_eq!(
+            dependency_levels(&deps),
+            vec![Some(0), Some(1), Some(0), Some(2), None, None]
+        );
+        assert_eq!(dependency_levels(&[vec![0]]), vec![None]);
+    }
+
+    #[test]
+    fn test_batch_items_map_to_results() {
+        let body = serde_json::json!({
+            "results": [
+                {
+                    "vakya_id": "v1",
+                    "vakya_hash": "h1",
+                    "status": "accepted",
+                    "receipt": null,
+                    "merkle_root": "r1",
+                    "leaf_index": 0
+                },
+                {
+                    "status_code": 403,
+                    "error": "AUTHORIZATION_DENIED",
+                    "message": "Invalid signature"
+                }
+            ],
+            "merkle_root": "r1"
+        });
+
+        let batch: SubmitBatchResponse = serde_json::from_value(body).unwrap();
+        let results: Vec<_> = batch.results.into_iter().map(BatchItem::into_result).collect();
+
+        assert_eq!(results[0].as_ref().unwrap().vakya_id, "v1");
+        assert!(matches!(&results[1], Err(SdkError::Authorization(m)) if m == "Invalid signature"));
+    }
+
+    #[tokio::test]
+    async fn test_merkle_cache_serves_and_invalidates() {
+        // Nothing listens here, so any cache miss surfaces as an error
+        let config = ClientConfig::new("http://127.0.0.1:1").with_merkle_cache(60_000, 16);
+        let client = AapiClient::new(config).unwrap();
+        let proof = |root: &str| InclusionProofResponse {
+            leaf_hash: "aa".to_string(),
+            leaf_index: 3,
+            tree_size: 8,
+            proof_hashes: vec![],
+            root_hash: root.to_string(),
+        };
+
+        client.merkle_cache().insert_proof(("vakya".to_string(), 3), proof("r1"), 16);
+        client.merkle_cache().roots.insert(
+            "vakya".to_string(),
+            (Instant::now(), MerkleRootResponse {
+                tree_type: "vakya".to_string(),
+                root_hash: Some("r1".to_string()),
+                timestamp: String::new(),
+            }),
+        );
+
+        assert_eq!(client.get_inclusion_proof("vakya", 3).await.unwrap().root_hash, "r1");
+        assert_eq!(client.get_merkle_root("vakya").await.unwrap().root_hash.as_deref(), Some("r1"));
+
+        // Clones share the cache
+        client.clone().invalidate_merkle_cache();
+        assert!(client.get_inclusion_proof("vakya", 3).await.is_err());
+        assert!(client.get_merkle_root("vakya").await.is_err());
+    }
+
+    #[tokio::test]
+    async fn test_merkle_cache_off_by_default() {
+        let client = AapiClient::new(ClientConfig::new("http://127.0.0.1:1")).unwrap();
+        client.merkle_cache().roots.insert(
+            "vakya".to_string(),
+            (Instant::now(), MerkleRootResponse {
+                tree_type: "vakya".to_string(),
+                root_hash: Some("r1".to_string()),
+                timestamp: String::new(),
+            }),
+        );
+
+        // Every root fetch goes to the gateway, so it sees the latest writes
+        assert!(client.get_merkle_root("vakya").await.is_err());
+    }
+
+    #[test]
+    fn test_merkle_proof_cache_evicts_and_prunes() {
+        let proof = |leaf_index: i64, root: &str| InclusionProofResponse {
+            leaf_hash: "aa".to_string(),
+            leaf_index,
+            tree_size: 8,
+            proof_hashes: vec![],
+            root_hash: root.to_string(),
+        };
+        let key = |tree: &str, leaf: i64| (tree.to_string(), leaf);
+
+        let mut cache = MerkleCache::default();
+        cache.insert_proof(key("vakya", 1), proof(1, "r1"), 2);
+        cache.insert_proof(key("vakya", 2), proof(2, "r1"), 2);
+        cache.insert_proof(key("effect", 1), proof(1, "e1"), 2);
+
+        // Oldest entry goes first, the rest survive
+        assert!(!cache.proofs.contains_key(&key("vakya", 1)));
+        assert!(cache.proofs.contains_key(&key("vakya", 2)));
+        assert!(cache.proofs.contains_key(&key("effect", 1)));
+
+        // A new root only drops proofs for its own tree
+        cache.prune_proofs("vakya", Some("r2"));
+        assert!(!cache.proofs.contains_key(&key("vakya", 2)));
+        assert!(cache.proofs.contains_key(&key("effect", 1)));
+        assert_eq!(cache.proof_order.len(), cache.proofs.len());
+    }
+
+    #[test]
+    fn test_endpoints_prebuilt() {
+        let endpoints = Endpoints::new("http://gw.local:8080/api").unwrap();
+
+        assert_eq!(endpoints.submit.as_str(), "http://gw.local:8080/api/v1/vakya");
+        assert_eq!(endpoints.health.as_str(), "http://gw.local:8080/api/health");
+        assert_eq!(
+            endpoints.vakya("v-1", Some("receipt")).as_str(),
+            "http://gw.local:8080/api/v1/vakya/v-1/receipt"
+        );
+        assert_eq!(
+            endpoints.vakya("a/b", None).as_str(),
+            "http://gw.local:8080/api/v1/vakya/a%2Fb"
+        );
+
+        assert!(AapiClient::new(ClientConfig::new("not a url")).is_err());
+    }
+
+    #[test]
+    fn test_cbor_submit_preserves_canonical_form() {
+        #[derive(Deserialize)]
+        struct Decoded {
+            vakya: Vakya,
+            signature: Option<String>,
+        }
+
+        let vakya = crate::builder::HttpActionBuilder::post(
+            "agent:a",
+            "https://example.com/items",
+            serde_json::json!({"n": 1, "ratio": 0.5, "tags": ["x"]}),
+        )
+        .build()
+        .unwrap();
+
+        let mut body = Vec::new();
+        ciborium::into_writer(&SubmitRequest {
+            vakya: &vakya,
+            signature: Some("sig".to_string()),
+            key_id: None,
+        }, &mut body)
+        .unwrap();
+
+        // The gateway re-canonicalizes what it decodes, so signatures made
+        // over the JSON canonical form must still verify
+        let decoded: Decoded = ciborium::from_reader(body.as_slice()).unwrap();
+        assert_eq!(decoded.signature.as_deref(), Some("sig"));
+        assert_eq!(
+            aapi_core::canonicalize(&decoded.vakya).unwrap().canonical_bytes,
+            aapi_core::canonicalize(&vakya).unwrap().canonical_bytes
+        );
+        // Batch bodies are a plain CBOR array of the same envelopes
+        let mut body = Vec::new();
+        let envelopes = vec![SubmitRequest::new(&vakya, None), SubmitRequest::new(&vakya, None)];
+        ciborium::into_writer(&envelopes, &mut body).unwrap();
+        let decoded: Vec<Decoded> = ciborium::from_reader(body.as_slice()).unwrap();
+        assert_eq!(decoded.len(), 2);
+        assert!(decoded.iter().all(|d| d.signature.is_none()));
+    }
+
     #[test]
     fn test_client_config() {
         let config = ClientConfig::new("http://localhost:8080")
@@ -319,6 +1009,65 @@ mod tests {
         assert_eq!(config.timeout_secs, 60);
     }
 
+    #[test]
+    fn test_submit_request_omits_missing_signature() {
+        let vakya = crate::builder::FileActionBuilder::read("user:alice", "/tmp/a.txt")
+            .build()
+            .unwrap();
+        let body = serde_json::to_vec(&SubmitRequest {
+            vakya: &vakya,
+            signature: None,
+            key_id: None,
+        })
+        .unwrap();
+
+        let value: serde_json::Value = serde_json::from_slice(&body).unwrap();
+        assert_eq!(value["vakya"]["vakya_id"], vakya.vakya_id.0.as_str());
+        assert!(value.get("signature").is_none());
+        assert!(value.get("key_id").is_none());
+    }
+
+    #[test]
+    fn test_signed_envelope_carries_canonical_vakya() {
+        let vakya = crate::builder::FileActionBuilder::read("user:alice", "/tmp/a.txt")
+            .build()
+            .unwrap();
+        let sandhi = aapi_core::canonicalize(&vakya).unwrap();
+        let suffix = key_id_suffix("key-\"1\"").unwrap();
+        let mut body = Vec::new();
+        write_signed_envelope(&mut body, &sandhi.canonical_bytes, "c2ln", &suffix).unwrap();
+
+        let value: serde_json::Value = serde_json::from_slice(&body).unwrap();
+        assert_eq!(value["signature"], "c2ln");
+        assert_eq!(value["key_id"], "key-\"1\"");
+
+        // The embedded VĀKYA round-trips to the same canonical hash
+        let parsed: Vakya = serde_json::from_value(value["vakya"].clone()).unwrap();
+        assert_eq!(aapi_core::canonicalize(&parsed).unwrap().vakya_hash, sandhi.vakya_hash);
+    }
+
+    #[test]
+    fn test_client_is_shareable_across_tasks() {
+        fn assert_shareable<T: Clone + Send + Sync + 'static>() {}
+        assert_shareable::<AapiClient>();
+    }
+
+    #[test]
+    fn test_client_config_pool() {
+        let config = ClientConfig::new("http://localhost:8080")
+            .with_pool(8, 90)
+            .with_http2_prior_knowledge();
+
+        assert_eq!(config.pool_max_idle_per_host, 8);
+        assert_eq!(config.pool_idle_timeout_secs, 90);
+        assert!(config.http2_prior_knowledge);
+        assert_eq!(config.max_concurrent_submits, 100);
+        assert_eq!(config.clone().with_max_concurrent_submits(0).max_concurrent_submits, 1);
+
+        let client = AapiClient::new(config);
+        assert!(client.is_ok());
+    }
+
     #[test]
     fn test_client_creation() {
         let config = ClientConfig::default();
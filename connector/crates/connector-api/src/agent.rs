@@ -435,7 +435,7 @@ impl<'a> AgentBuilder<'a> {
         let dbg = crate::trace::DebugLogger::new(&self.name, self.debug_mode);
         let mut run_trace = crate::trace::RunTrace::new(&pipeline_id, &self.name, user_id);
 
-        dbg.step("init", &format!("Starting pipeline {} for user {}", pipeline_id, user_id));
+        dbg.step("init", format_args!("Starting pipeline {} for user {}", pipeline_id, user_id));
 
         // ── Instruction validation (catch problems BEFORE they happen) ──
         let validation_warnings = crate::trace::validate_instructions(
@@ -517,7 +517,7 @@ impl<'a> AgentBuilder<'a> {
         }
 
         // Register the agent
-        dbg.step("register", &format!("Registering agent '{}'", self.name));
+        dbg.step("register", format_args!("Registering agent '{}'", self.name));
         let config = ActorConfig {
             name: self.name.clone(),
             role: self.role.clone(),
@@ -546,7 +546,7 @@ impl<'a> AgentBuilder<'a> {
         // ══════════════════════════════════════════════════════════
 
         // Write the user input as a memory packet
-        dbg.step("memory", &format!("Storing input: '{}'", &message[..message.len().min(60)]));
+        dbg.step("memory", format_args!("Storing input: '{}'", &message[..message.len().min(60)]));
         let input_mem = dispatcher.remember(
             &pid,
             message,
@@ -583,7 +583,7 @@ impl<'a> AgentBuilder<'a> {
                     all_knowledge_facts.push(trimmed.to_string());
                 }
             }
-            dbg.step("knowledge", &format!("Injected {} connector-level facts", all_knowledge_facts.len()));
+            dbg.step("knowledge", format_args!("Injected {} connector-level facts", all_knowledge_facts.len()));
         }
         run_trace.knowledge_facts = all_knowledge_facts.clone();
 
@@ -594,7 +594,7 @@ impl<'a> AgentBuilder<'a> {
                 self.agent_facts.join("\n")
             ));
             all_knowledge_facts.extend(self.agent_facts.clone());
-            dbg.step("knowledge", &format!("Injected {} agent-level facts", self.agent_facts.len()));
+            dbg.step("knowledge", format_args!("Injected {} agent-level facts", self.agent_facts.len()));
         }
         run_trace.agent_facts = self.agent_facts.clone();
 
@@ -622,7 +622,7 @@ impl<'a> AgentBuilder<'a> {
                 let rag_ctx = dispatcher.rag_retrieve(&entities, &keywords);
                 if rag_ctx.facts_included > 0 {
                     system_parts.push(rag_ctx.to_prompt_context());
-                    dbg.step("rag", &format!("RAG injected {} grounded facts ({} tokens, {} sources)",
+                    dbg.step("rag", format_args!("RAG injected {} grounded facts ({} tokens, {} sources)",
                         rag_ctx.facts_included, rag_ctx.tokens_used, rag_ctx.source_cids.len()));
                 } else {
                     dbg.step("rag", "RAG query returned no relevant facts");
@@ -633,7 +633,7 @@ impl<'a> AgentBuilder<'a> {
         // Layer 3: Instructions
         if let Some(ref instructions) = instructions_or_default {
             system_parts.push(instructions.clone());
-            dbg.step("instructions", &format!("System prompt: '{}'", &instructions[..instructions.len().min(80)]));
+            dbg.step("instructions", format_args!("System prompt: '{}'", &instructions[..instructions.len().min(80)]));
         }
 
         // Layer 4: Task decomposition steps
@@ -646,7 +646,7 @@ impl<'a> AgentBuilder<'a> {
                 "[Task Plan — complete each step in order]\n{}\n[End Task Plan]",
                 steps_text
             ));
-            dbg.step("steps", &format!("{} task steps injected", self.task_steps.len()));
+            dbg.step("steps", format_args!("{} task steps injected", self.task_steps.len()));
         }
         run_trace.task_steps = self.task_steps.clone();
 
@@ -671,7 +671,7 @@ impl<'a> AgentBuilder<'a> {
             tool_lines.push("[End Available Tools]".to_string());
             tool_lines.push("To call a tool, respond with: [TOOL_CALL: tool_name(params)]".to_string());
             system_parts.push(tool_lines.join("\n"));
-            dbg.step("tools", &format!("{} tools injected into prompt ({} simple, {} typed)",
+            dbg.step("tools", format_args!("{} tools injected into prompt ({} simple, {} typed)",
                 self.tools.len() + self.actions.len(),
                 self.tools.len(),
                 self.actions.len()));
@@ -698,7 +698,7 @@ impl<'a> AgentBuilder<'a> {
         // Wire agent_context into the effective message
         let effective_message = match &self.agent_context {
             Some(ctx) => {
-                dbg.step("context", &format!("Prepending context: '{}'", &ctx[..ctx.len().min(60)]));
+                dbg.step("context", format_args!("Prepending context: '{}'", &ctx[..ctx.len().min(60)]));
                 format!("[Context: {}]\n\n{}", ctx, message)
             }
             None => message.to_string(),
@@ -716,7 +716,7 @@ impl<'a> AgentBuilder<'a> {
                 connector_engine::guard_pipeline::GuardDecision::Deny { reason } => reason.clone(),
                 _ => "Guard pipeline denied input".to_string(),
             };
-            dbg.step("guard", &format!("INPUT BLOCKED: {}", reason));
+            dbg.step("guard", format_args!("INPUT BLOCKED: {}", reason));
             // Build a blocked output from kernel state
             let duration_ms = start.elapsed().as_millis() as u64;
             let output = OutputBuilder::build(
@@ -730,7 +730,7 @@ impl<'a> AgentBuilder<'a> {
             );
             return Ok(output);
         }
-        dbg.step("guard", &format!("Input passed 5-layer guard ({} layers evaluated)",
+        dbg.step("guard", format_args!("Input passed 5-layer guard ({} layers evaluated)",
             input_guard.layer_verdicts.len()));
 
         // ══════════════════════════════════════════════════════════
@@ -741,7 +741,7 @@ impl<'a> AgentBuilder<'a> {
         run_trace.llm_model = self.connector.llm_config.as_ref()
             .map(|c| format!("{}:{}", c.provider, c.model));
 
-        dbg.step("llm", &format!("Think cycles: {}, retries: {}, LLM: {}",
+        dbg.step("llm", format_args!("Think cycles: {}, retries: {}, LLM: {}",
             think_cycles, max_retries,
             if llm_has_router { "connected" } else { "simulation" }));
 
@@ -764,12 +764,12 @@ impl<'a> AgentBuilder<'a> {
                 let result = if let Some(router) = dispatcher.llm_router() {
                     match router.complete_sync(&cycle_prompt, system) {
                         Ok(resp) => {
-                            dbg.step("llm", &format!("Cycle {}: received {} chars", cycle + 1, resp.text.len()));
+                            dbg.step("llm", format_args!("Cycle {}: received {} chars", cycle + 1, resp.text.len()));
                             Some(resp.text)
                         }
                         Err(e) => {
                             total_retries += 1;
-                            dbg.step("llm", &format!("Cycle {} attempt {}: error: {}", cycle + 1, attempt + 1, e));
+                            dbg.step("llm", format_args!("Cycle {} attempt {}: error: {}", cycle + 1, attempt + 1, e));
                             if attempt < max_retries {
                                 let backoff_ms = 100 * (1u64 << attempt.min(6));
                                 std::thread::sleep(std::time::Duration::from_millis(backoff_ms));
@@ -806,11 +806,11 @@ impl<'a> AgentBuilder<'a> {
                 connector_engine::guard_pipeline::GuardDecision::Deny { reason } => reason.clone(),
                 _ => "Guard pipeline denied output".to_string(),
             };
-            dbg.step("guard", &format!("OUTPUT BLOCKED: {}", reason));
+            dbg.step("guard", format_args!("OUTPUT BLOCKED: {}", reason));
             response_text = format!("[Output blocked by guard pipeline: {}]", reason);
             run_trace.warnings.push(format!("Guard blocked output: {}", reason));
         } else {
-            dbg.step("guard", &format!("Output passed 5-layer guard ({} layers)",
+            dbg.step("guard", format_args!("Output passed 5-layer guard ({} layers)",
                 output_guard.layer_verdicts.len()));
         }
 
@@ -821,7 +821,7 @@ impl<'a> AgentBuilder<'a> {
         if !self.tools.is_empty() || !self.actions.is_empty() || !dispatcher.tool_registry().is_empty() {
             let tool_calls = parse_tool_calls(&response_text);
             if !tool_calls.is_empty() {
-                dbg.step("tools", &format!("Detected {} tool call(s) in response", tool_calls.len()));
+                dbg.step("tools", format_args!("Detected {} tool call(s) in response", tool_calls.len()));
                 let mut tool_results: Vec<String> = Vec::new();
 
                 for (tool_name, tool_params) in &tool_calls {
@@ -840,12 +840,12 @@ impl<'a> AgentBuilder<'a> {
                         Ok(result) => {
                             let result_str = format!("{}", result);
                             tool_results.push(format!("[Tool '{}': {}]", tool_name, result_str));
-                            dbg.step("tools", &format!("Tool '{}': {}", tool_name, result_str));
+                            dbg.step("tools", format_args!("Tool '{}': {}", tool_name, result_str));
                         }
                         Err(e) => {
                             // Tool blocked by firewall or other gate error
                             tool_results.push(format!("[Tool '{}' BLOCKED: {}]", tool_name, e));
-                            dbg.step("tools", &format!("Tool '{}' BLOCKED: {}", tool_name, e));
+                            dbg.step("tools", format_args!("Tool '{}' BLOCKED: {}", tool_name, e));
                             run_trace.warnings.push(format!("Tool '{}' blocked: {}", tool_name, e));
                         }
                     }
@@ -868,7 +868,7 @@ impl<'a> AgentBuilder<'a> {
         {
             let perceived = dispatcher.perceive_context(&agent_ns, None, 20);
             if perceived.total_found > 0 {
-                dbg.step("perception", &format!("Perceived {} memories in namespace, judgment: {} ({})",
+                dbg.step("perception", format_args!("Perceived {} memories in namespace, judgment: {} ({})",
                     perceived.total_found, perceived.judgment.score, perceived.judgment.grade));
             }
         }
@@ -884,7 +884,7 @@ impl<'a> AgentBuilder<'a> {
         run_trace.grounding_details = grounding_details;
 
         if !all_knowledge_facts.is_empty() {
-            dbg.step("grounding", &format!("Score: {:.0}% ({}/{} claims grounded)",
+            dbg.step("grounding", format_args!("Score: {:.0}% ({}/{} claims grounded)",
                 grounding_score * 100.0,
                 run_trace.grounding_details.iter().filter(|c| c.grounded).count(),
                 run_trace.grounding_details.len()
@@ -892,7 +892,7 @@ impl<'a> AgentBuilder<'a> {
         }
 
         // Write the LLM response as a memory packet
-        dbg.step("memory", &format!("Storing response: '{}'", &response_text[..response_text.len().min(60)]));
+        dbg.step("memory", format_args!("Storing response: '{}'", &response_text[..response_text.len().min(60)]));
         let response_mem = dispatcher.remember(
             &pid,
             &response_text,
@@ -911,10 +911,10 @@ impl<'a> AgentBuilder<'a> {
         // Judgment Engine — 8-dimension trust assessment of kernel state
         // ══════════════════════════════════════════════════════════
         let judgment = dispatcher.judge_kernel_state(None, &connector_engine::judgment::JudgmentConfig::default());
-        dbg.step("judgment", &format!("Kernel judgment: {} ({}) — {} ops analyzed",
+        dbg.step("judgment", format_args!("Kernel judgment: {} ({}) — {} ops analyzed",
             judgment.score, judgment.grade, judgment.operations_analyzed));
 
-        dbg.step("done", &format!("Completed in {}ms | packets:{} | audit:{} | grounding:{:.0}% | judgment:{}",
+        dbg.step("done", format_args!("Completed in {}ms | packets:{} | audit:{} | grounding:{:.0}% | judgment:{}",
             duration_ms, run_trace.total_packets, run_trace.total_audit_entries, grounding_score * 100.0, judgment.score));
 
         // Phase 6: Collect real AAPI stats from the action engine
@@ -169,12 +169,13 @@ impl<'a> DatabaseView<'a> {
     }
 
     /// Get a single memory by ID (CID string).
+    ///
+    /// The ID is parsed once and looked up by its binary CID, rather than
+    /// string-formatting the CID of every stored packet to compare against it.
     pub fn memory(&self, id: &str) -> Option<ConnectorMemory> {
+        let cid = cid::Cid::try_from(id).ok()?;
         let kernel = self.connector.kernel.read().ok()?;
-        kernel.all_packets()
-            .iter()
-            .find(|p| p.index.packet_cid.to_string() == id)
-            .map(|p| ConnectorMemory::from_packet(p))
+        kernel.get_packet(&cid).map(ConnectorMemory::from_packet)
     }
 
     // ─── Agents ────────────────────────────────────────────────
@@ -605,6 +606,17 @@ mod tests {
         // Note: content may or may not match depending on how the engine processes it
     }
 
+    #[test]
+    fn test_db_memory_by_id() {
+        let c = make_test_connector();
+        let db = c.db();
+        let first = db.memories().memories.into_iter().next().expect("should have memories");
+
+        let found = db.memory(&first.id).expect("should find memory by its CID");
+        assert_eq!(found.id, first.id);
+        assert!(db.memory("not-a-cid").is_none());
+    }
+
     #[test]
     fn test_db_agents() {
         let c = make_test_connector();
@@ -379,7 +379,12 @@ impl DebugLogger {
         }
     }
 
-    pub fn step(&self, phase: &str, message: &str) {
+    /// Print a step when debug mode is on.
+    ///
+    /// Takes any `Display` so callers can pass `format_args!(...)`: the message
+    /// is only formatted when it is actually printed, and runs with debug mode
+    /// off pay nothing for it.
+    pub fn step(&self, phase: &str, message: impl fmt::Display) {
         if self.enabled {
             eprintln!("[connector:{}] {} → {}", self.agent, phase, message);
         }
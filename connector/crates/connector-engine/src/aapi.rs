@@ -70,7 +70,10 @@ pub struct IssuedCapability {
 
 impl IssuedCapability {
     pub fn is_valid(&self) -> bool {
-        !self.revoked && chrono::Utc::now().timestamp_millis() <= self.expires_at
+        self.is_valid_at(now_ms())
+    }
+    fn is_valid_at(&self, now: i64) -> bool {
+        !self.revoked && now <= self.expires_at
     }
     pub fn covers_action(&self, a: &str) -> bool {
         self.actions.iter().any(|p| glob_match(p, a))
@@ -139,6 +142,10 @@ pub struct ActionEngine {
     policies: Vec<ActionPolicy>,
     budgets: HashMap<String, BudgetTracker>,
     capabilities: Vec<IssuedCapability>,
+    /// token_id → position in `capabilities`
+    capability_index: HashMap<String, usize>,
+    /// subject → positions in `capabilities`
+    capabilities_by_subject: HashMap<String, Vec<usize>>,
     actions: Vec<ActionEntry>,
     interactions: Vec<InteractionEntry>,
     pub compliance: Option<ComplianceConfig>,
@@ -155,6 +162,8 @@ impl ActionEngine {
             policies: vec![],
             budgets: HashMap::new(),
             capabilities: vec![],
+            capability_index: HashMap::new(),
+            capabilities_by_subject: HashMap::new(),
             actions: vec![],
             interactions: vec![],
             compliance: None,
@@ -168,7 +177,10 @@ impl ActionEngine {
 
     // ── Policy Management ──
 
-    pub fn add_policy(&mut self, id: &str, name: &str, rules: Vec<PolicyRule>) {
+    pub fn add_policy(&mut self, id: &str, name: &str, mut rules: Vec<PolicyRule>) {
+        // Keep rules in evaluation order (highest priority first) so
+        // evaluate_policy doesn't re-sort them on every call
+        rules.sort_by(|a, b| b.priority.cmp(&a.priority));
         self.policies.push(ActionPolicy {
             id: id.into(),
             name: name.into(),
@@ -190,16 +202,14 @@ impl ActionEngine {
     ) -> PolicyDecision {
         for pol in &self.policies {
             if !pol.enabled { continue; }
-            let mut rules: Vec<&PolicyRule> = pol.rules.iter().collect();
-            rules.sort_by(|a, b| b.priority.cmp(&a.priority));
-            for r in rules {
+            for r in &pol.rules {
                 if !glob_match(&r.action_pattern, action) { continue; }
                 if let Some(ref rp) = r.resource_pattern {
                     if !glob_match(rp, resource) { continue; }
                 }
                 if !r.roles.is_empty() {
                     match role {
-                        Some(rl) if r.roles.contains(&rl.to_string()) => {},
+                        Some(rl) if r.roles.iter().any(|x| x == rl) => {},
                         _ => continue,
                     }
                 }
@@ -247,17 +257,15 @@ impl ActionEngine {
                 };
             }
         }
-        // Capability check
-        if !self.capabilities.is_empty() {
-            let has_cap = self.capabilities.iter().any(|c| {
-                c.subject == agent_pid
-                    && c.is_valid()
+        // Capability check: agents holding capabilities need one that covers the call
+        if let Some(held) = self.capabilities_by_subject.get(agent_pid) {
+            let now = now_ms();
+            let has_cap = held.iter().map(|&i| &self.capabilities[i]).any(|c| {
+                c.is_valid_at(now)
                     && c.covers_action(action)
                     && c.covers_resource(resource)
             });
-            if !has_cap
-                && self.capabilities.iter().any(|c| c.subject == agent_pid)
-            {
+            if !has_cap {
                 return PolicyDecision {
                     allowed: false,
                     effect: "deny".into(),
@@ -314,15 +322,15 @@ impl ActionEngine {
             parent_token_id: None,
             revoked: false,
         };
-        self.capabilities.push(cap.clone());
+        self.push_capability(cap.clone());
         cap
     }
 
     pub fn delegate_capability(
         &mut self, parent_id: &str, new_subject: &str, remove_actions: &[&str],
     ) -> Option<IssuedCapability> {
-        let parent = self.capabilities.iter()
-            .find(|c| c.token_id == parent_id && c.is_valid())?
+        let parent = self.capability(parent_id)
+            .filter(|c| c.is_valid())?
             .clone();
         let actions: Vec<String> = parent.actions.iter()
             .filter(|a| !remove_actions.contains(&a.as_str()))
@@ -339,18 +347,29 @@ impl ActionEngine {
             parent_token_id: Some(parent_id.into()),
             revoked: false,
         };
-        self.capabilities.push(cap.clone());
+        self.push_capability(cap.clone());
         Some(cap)
     }
 
     pub fn revoke_capability(&mut self, id: &str) {
-        if let Some(c) = self.capabilities.iter_mut().find(|c| c.token_id == id) {
-            c.revoked = true;
+        if let Some(&i) = self.capability_index.get(id) {
+            self.capabilities[i].revoked = true;
         }
     }
 
     pub fn verify_capability(&self, id: &str) -> Option<bool> {
-        self.capabilities.iter().find(|c| c.token_id == id).map(|c| c.is_valid())
+        self.capability(id).map(|c| c.is_valid())
+    }
+
+    fn capability(&self, id: &str) -> Option<&IssuedCapability> {
+        self.capability_index.get(id).map(|&i| &self.capabilities[i])
+    }
+
+    fn push_capability(&mut self, cap: IssuedCapability) {
+        let i = self.capabilities.len();
+        self.capability_index.insert(cap.token_id.clone(), i);
+        self.capabilities_by_subject.entry(cap.subject.clone()).or_default().push(i);
+        self.capabilities.push(cap);
     }
 
     pub fn capability_count(&self) -> usize {
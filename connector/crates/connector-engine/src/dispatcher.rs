@@ -594,10 +594,14 @@ impl<'k> DualDispatcher<'k> {
             Some(&namespace),
         ).map_err(|e| EngineError::VakyaError(e.to_string()))?;
 
+        // Build the caller's view up front so the packet itself can be moved
+        // into the syscall instead of deep-copied alongside it
+        let memory = ConnectorMemory::from_packet(&packet);
+
         let req = SyscallRequest {
             agent_pid: agent_pid.to_string(),
             operation: MemoryKernelOp::MemWrite,
-            payload: SyscallPayload::MemWrite { packet: packet.clone() },
+            payload: SyscallPayload::MemWrite { packet },
             reason: Some(format!("remember: {}", &text[..text.len().min(50)])),
             vakya_id: Some(_vakya.vakya_id.to_string()),
         };
@@ -612,11 +616,11 @@ impl<'k> DualDispatcher<'k> {
                     subject_id,
                     agent_pid,
                     "success",
-                    vec![packet.index.packet_cid.to_string()],
+                    vec![memory.id.clone()],
                     None,
                     self.compliance.clone(),
                 );
-                Ok(ConnectorMemory::from_packet(&packet))
+                Ok(memory)
             }
             _ => Err(EngineError::MemoryWriteFailed(
                 format!("Kernel returned: {:?}", result.outcome)
@@ -152,21 +152,20 @@ impl GroundingTable {
 
     /// Fuzzy lookup — checks if term is a substring of any key or vice versa.
     pub fn lookup_fuzzy(&self, category: &str, term: &str) -> Option<&CodeEntry> {
-        // Try exact first
-        if let Some(entry) = self.lookup(category, term) {
-            return Some(entry);
-        }
+        let entries = self.categories.get(category)?;
+        fuzzy_match(entries, &term.to_lowercase())
+    }
 
-        // Fuzzy: substring match
+    /// Fuzzy lookup of one term in every category.
+    ///
+    /// Same matching as [`lookup_fuzzy`](Self::lookup_fuzzy) per category, but
+    /// the term is lowercased once instead of once per category lookup.
+    pub fn lookup_fuzzy_all(&self, term: &str) -> Vec<&CodeEntry> {
         let term_lower = term.to_lowercase();
-        self.categories.get(category).and_then(|entries| {
-            for (key, entry) in entries {
-                if term_lower.contains(key.as_str()) || key.contains(term_lower.as_str()) {
-                    return Some(entry);
-                }
-            }
-            None
-        })
+        self.categories
+            .values()
+            .filter_map(|entries| fuzzy_match(entries, &term_lower))
+            .collect()
     }
 
     /// List all categories.
@@ -185,6 +184,17 @@ impl GroundingTable {
     }
 }
 
+/// Exact match first, then the first key that contains or is contained in the term.
+fn fuzzy_match<'a>(entries: &'a HashMap<String, CodeEntry>, term_lower: &str) -> Option<&'a CodeEntry> {
+    if let Some(entry) = entries.get(term_lower) {
+        return Some(entry);
+    }
+    entries
+        .iter()
+        .find(|(key, _)| term_lower.contains(key.as_str()) || key.contains(term_lower))
+        .map(|(_, entry)| entry)
+}
+
 impl Default for GroundingTable {
     fn default() -> Self {
         Self::new()
@@ -249,6 +259,14 @@ mod tests {
         assert_eq!(entry.code, "I21.11");
     }
 
+    #[test]
+    fn test_fuzzy_lookup_all_categories() {
+        let table = GroundingTable::from_json(sample_json()).unwrap();
+        let codes: Vec<&str> = table.lookup_fuzzy_all("Sulfa").iter().map(|e| e.code.as_str()).collect();
+        assert_eq!(codes, vec!["Z88.2"]);
+        assert!(table.lookup_fuzzy_all("appendicitis").is_empty());
+    }
+
     #[test]
     fn test_no_match() {
         let table = GroundingTable::from_json(sample_json()).unwrap();
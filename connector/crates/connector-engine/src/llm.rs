@@ -3,7 +3,11 @@
 //! Supports ALL major providers + custom endpoints.
 //! Provider/model/key are fully dynamic at runtime.
 
+use std::path::PathBuf;
+use std::sync::atomic::{AtomicU64, Ordering};
+
 use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
 
 // ── Config ───────────────────────────────────────────────────
 
@@ -82,7 +86,7 @@ impl LlmConfig {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ChatMessage { pub role: String, pub content: String }
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct LlmResponse {
     pub text: String, pub model: String, pub provider: String,
     pub input_tokens: u32, pub output_tokens: u32, pub finish_reason: String,
@@ -124,14 +128,90 @@ impl std::error::Error for LlmError {}
 
 #[derive(Deserialize)] struct ErrBody { message: Option<String> }
 
+// ── Response cache ───────────────────────────────────────────
+
+/// On-disk cache of LLM responses, content-addressed by request.
+///
+/// The key is SHA-256 over a version tag and every input that shapes the
+/// completion (provider, endpoint, model, sampling settings, messages), each
+/// length-prefixed so field boundaries cannot collide. The API key is not
+/// part of it. Entries live at `<dir>/<hex[..2]>/<hex>.json`; an entry that
+/// no longer parses is treated as a miss and removed.
+#[derive(Debug, Clone)]
+pub struct ResponseCache { dir: PathBuf }
+
+impl ResponseCache {
+    pub fn new(dir: impl Into<PathBuf>) -> Self { Self { dir: dir.into() } }
+
+    pub fn key(cfg: &LlmConfig, msgs: &[ChatMessage]) -> [u8; 32] {
+        fn field(h: &mut Sha256, bytes: &[u8]) {
+            h.update((bytes.len() as u64).to_be_bytes());
+            h.update(bytes);
+        }
+        let mut h = Sha256::new();
+        h.update(b"connector.llm-cache.v1");
+        field(&mut h, cfg.provider.as_bytes());
+        field(&mut h, cfg.base_url().as_bytes());
+        field(&mut h, cfg.model.as_bytes());
+        h.update(cfg.max_tokens.to_be_bytes());
+        h.update(cfg.temperature.to_bits().to_be_bytes());
+        h.update((msgs.len() as u64).to_be_bytes());
+        for m in msgs {
+            field(&mut h, m.role.as_bytes());
+            field(&mut h, m.content.as_bytes());
+        }
+        h.finalize().into()
+    }
+
+    pub fn get(&self, key: &[u8; 32]) -> Option<LlmResponse> {
+        let path = self.path(key);
+        let bytes = std::fs::read(&path).ok()?;
+        match serde_json::from_slice(&bytes) {
+            Ok(resp) => Some(resp),
+            Err(_) => { let _ = std::fs::remove_file(&path); None }
+        }
+    }
+
+    /// Store a response; written to a temp file and renamed into place so
+    /// readers never see a partial entry. Temp names are unique per write,
+    /// so concurrent writers in one process never share a file.
+    pub fn put(&self, key: &[u8; 32], resp: &LlmResponse) -> std::io::Result<()> {
+        static WRITES: AtomicU64 = AtomicU64::new(0);
+        let path = self.path(key);
+        if let Some(parent) = path.parent() { std::fs::create_dir_all(parent)?; }
+        let seq = WRITES.fetch_add(1, Ordering::Relaxed);
+        let tmp = path.with_extension(format!("tmp{}.{}", std::process::id(), seq));
+        std::fs::write(&tmp, serde_json::to_vec(resp)?)?;
+        std::fs::rename(&tmp, &path)
+    }
+
+    fn path(&self, key: &[u8; 32]) -> PathBuf {
+        let hex = hex::encode(key);
+        self.dir.join(&hex[..2]).join(format!("{}.json", hex))
+    }
+}
+
 // ── Client ───────────────────────────────────────────────────
 
-pub struct LlmClient { http: reqwest::Client }
+pub struct LlmClient { http: reqwest::Client, cache: Option<ResponseCache> }
 
 impl LlmClient {
-    pub fn new() -> Self { Self { http: reqwest::Client::new() } }
+    pub fn new() -> Self { Self { http: reqwest::Client::new(), cache: None } }
+
+    /// Serve repeated requests from `cache` instead of calling the provider.
+    pub fn with_cache(mut self, cache: ResponseCache) -> Self { self.cache = Some(cache); self }
 
     pub async fn chat(&self, cfg: &LlmConfig, msgs: Vec<ChatMessage>) -> Result<LlmResponse, LlmError> {
+        let Some(ref cache) = self.cache else { return self.call(cfg, msgs).await };
+        let key = ResponseCache::key(cfg, &msgs);
+        if let Some(resp) = cache.get(&key) { return Ok(resp); }
+        let resp = self.call(cfg, msgs).await?;
+        // A failed write only costs a future miss
+        let _ = cache.put(&key, &resp);
+        Ok(resp)
+    }
+
+    async fn call(&self, cfg: &LlmConfig, msgs: Vec<ChatMessage>) -> Result<LlmResponse, LlmError> {
         match cfg.api_format() {
             ApiFormat::OpenAi => self.openai(cfg, msgs).await,
             ApiFormat::Anthropic => self.anthropic(cfg, msgs).await,
@@ -249,6 +329,64 @@ mod tests {
         assert_eq!(c2.model, "gpt-4o");
     }
 
+    fn msgs(text: &str) -> Vec<ChatMessage> {
+        vec![ChatMessage { role: "user".into(), content: text.into() }]
+    }
+
+    #[test]
+    fn test_cache_key() {
+        let c = LlmConfig::new("openai", "gpt-4o", "k");
+        let k = ResponseCache::key(&c, &msgs("hello"));
+        assert_eq!(k, ResponseCache::key(&LlmConfig::new("openai", "gpt-4o", "other-key"), &msgs("hello")));
+        assert_ne!(k, ResponseCache::key(&c, &msgs("hello!")));
+        assert_ne!(k, ResponseCache::key(&c.clone().with_temperature(0.0), &msgs("hello")));
+        assert_ne!(k, ResponseCache::key(&LlmConfig::new("openai", "gpt-4o-mini", "k"), &msgs("hello")));
+        // Length prefixes keep role/content boundaries distinct
+        let a = vec![ChatMessage { role: "user".into(), content: "ab".into() }];
+        let b = vec![ChatMessage { role: "usera".into(), content: "b".into() }];
+        assert_ne!(ResponseCache::key(&c, &a), ResponseCache::key(&c, &b));
+    }
+
+    #[test]
+    fn test_cache_roundtrip() {
+        let dir = tempfile::tempdir().unwrap();
+        let cache = ResponseCache::new(dir.path());
+        let key = ResponseCache::key(&LlmConfig::new("openai", "gpt-4o", "k"), &msgs("hello"));
+        assert!(cache.get(&key).is_none());
+
+        let resp = LlmResponse { text: "hi".into(), model: "gpt-4o".into(), provider: "openai".into(),
+            input_tokens: 3, output_tokens: 1, finish_reason: "stop".into() };
+        cache.put(&key, &resp).unwrap();
+        let hit = cache.get(&key).unwrap();
+        assert_eq!(hit.text, "hi");
+        assert_eq!(hit.input_tokens, 3);
+
+        // A corrupt entry is a miss and gets evicted
+        let path = cache.path(&key);
+        std::fs::write(&path, b"{not json").unwrap();
+        assert!(cache.get(&key).is_none());
+        assert!(!path.exists());
+    }
+
+    #[test]
+    fn test_cache_concurrent_puts() {
+        let dir = tempfile::tempdir().unwrap();
+        let cache = ResponseCache::new(dir.path());
+        let key = ResponseCache::key(&LlmConfig::new("openai", "gpt-4o", "k"), &msgs("hello"));
+        let resp = LlmResponse { text: "hi".into(), model: "gpt-4o".into(), provider: "openai".into(),
+            input_tokens: 3, output_tokens: 1, finish_reason: "stop".into() };
+
+        std::thread::scope(|s| {
+            for _ in 0..8 {
+                s.spawn(|| for _ in 0..20 { cache.put(&key, &resp).unwrap() });
+            }
+        });
+        assert_eq!(cache.get(&key).unwrap().text, "hi");
+        // Every temp file was renamed into place
+        let entries = std::fs::read_dir(cache.path(&key).parent().unwrap()).unwrap().count();
+        assert_eq!(entries, 1);
+    }
+
     #[test]
     fn test_builder() {
         let c = LlmConfig::new("openai", "gpt-4o", "k")
@@ -525,10 +525,16 @@ impl PipelineOutput {
 
     /// Get provenance summary — how many fields from each source.
     pub fn provenance_summary(&self) -> serde_json::Value {
-        let kernel_count = self.events.iter().filter(|e| e.source == Provenance::Kernel).count();
-        let llm_count = self.events.iter().filter(|e| e.source == Provenance::Llm).count();
-        let derived_count = self.events.iter().filter(|e| e.source == Provenance::Derived).count();
-        let user_count = self.events.iter().filter(|e| e.source == Provenance::User).count();
+        // One pass over the events rather than one per source
+        let (mut kernel_count, mut llm_count, mut derived_count, mut user_count) = (0usize, 0usize, 0usize, 0usize);
+        for e in &self.events {
+            match e.source {
+                Provenance::Kernel => kernel_count += 1,
+                Provenance::Llm => llm_count += 1,
+                Provenance::Derived => derived_count += 1,
+                Provenance::User => user_count += 1,
+            }
+        }
         serde_json::json!({
             "kernel_verified": kernel_count,
             "llm_unverified": llm_count,
@@ -138,10 +138,8 @@ impl PerceptionEngine {
         let mut tags = Vec::new();
         if let Some(table) = grounding {
             for entity in &entities {
-                for cat in table.categories() {
-                    if let Some(entry) = table.lookup_fuzzy(cat, entity) {
-                        tags.push(format!("{}:{}", entry.code, entry.desc));
-                    }
+                for entry in table.lookup_fuzzy_all(entity) {
+                    tags.push(format!("{}:{}", entry.code, entry.desc));
                 }
             }
         }
@@ -254,45 +252,44 @@ impl PerceptionEngine {
 /// Simple heuristic: words with colons (entity:id), capitalized multi-word phrases,
 /// and medical/technical terms.
 fn extract_entities(text: &str, max: usize) -> Vec<String> {
-    let mut entities = Vec::new();
+    const STOP_WORDS: [&str; 10] = ["the", "and", "for", "with", "from", "this", "that", "has", "was", "are"];
+
+    let words: Vec<&str> = text.split_whitespace().collect();
+    let mut entities: Vec<String> = Vec::new();
 
     // 1. Explicit entity references (entity:id format)
-    for word in text.split_whitespace() {
+    for word in &words {
         let clean = word.trim_matches(|c: char| !c.is_alphanumeric() && c != ':' && c != '_');
-        if clean.contains(':') && clean.len() > 3 {
-            if !entities.contains(&clean.to_string()) {
-                entities.push(clean.to_string());
-            }
+        if clean.contains(':') && clean.len() > 3 && !entities.iter().any(|e| e == clean) {
+            entities.push(clean.to_string());
         }
     }
 
     // 2. Capitalized phrases (likely proper nouns / medical terms)
-    let words: Vec<&str> = text.split_whitespace().collect();
+    let starts_upper = |w: &str| w.chars().next().map(|c| c.is_uppercase()).unwrap_or(false);
     let mut i = 0;
     while i < words.len() && entities.len() < max {
         let w = words[i].trim_matches(|c: char| !c.is_alphanumeric());
-        if !w.is_empty() && w.chars().next().map(|c| c.is_uppercase()).unwrap_or(false) && w.len() > 2 {
-            // Check for multi-word capitalized phrase
-            let mut phrase = vec![w.to_string()];
+        if !w.is_empty() && starts_upper(w) && w.len() > 2 {
+            // Extend over the following capitalized words
+            let mut entity = w.to_string();
             let mut j = i + 1;
             while j < words.len() {
                 let nw = words[j].trim_matches(|c: char| !c.is_alphanumeric());
-                if !nw.is_empty() && nw.chars().next().map(|c| c.is_uppercase()).unwrap_or(false) {
-                    phrase.push(nw.to_string());
+                if !nw.is_empty() && starts_upper(nw) {
+                    entity.push(' ');
+                    entity.push_str(nw);
                     j += 1;
                 } else {
                     break;
                 }
             }
-            let entity = phrase.join(" ");
-            if entity.len() > 2 && !entities.contains(&entity) {
-                // Skip common English words
-                let lower = entity.to_lowercase();
-                if !["the", "and", "for", "with", "from", "this", "that", "has", "was", "are"]
-                    .contains(&lower.as_str())
-                {
-                    entities.push(entity);
-                }
+            // Skip common English words
+            if entity.len() > 2
+                && !STOP_WORDS.iter().any(|s| s.eq_ignore_ascii_case(&entity))
+                && !entities.contains(&entity)
+            {
+                entities.push(entity);
             }
             i = j;
         } else {
@@ -508,12 +508,7 @@ impl TraceBuilder {
 
         let name = if let Some(target) = &entry.target {
             // Truncate long CIDs for readability
-            let short_target = if target.len() > 20 {
-                format!("{}...{}", &target[..8], &target[target.len()-4..])
-            } else {
-                target.clone()
-            };
-            format!("{}: {}", human_label, short_target)
+            format!("{}: {}", human_label, ShortCid { cid: target, max: 20 })
         } else {
             human_label.to_string()
         };
@@ -818,9 +813,19 @@ fn truncate_str(s: &str, max: usize) -> String {
     else { format!("{}...", &s[..max-3]) }
 }
 
-fn truncate_cid(cid: &str) -> String {
-    if cid.len() <= 16 { cid.to_string() }
-    else { format!("{}...{}", &cid[..8], &cid[cid.len()-4..]) }
+fn truncate_cid(cid: &str) -> ShortCid<'_> {
+    ShortCid { cid, max: 16 }
+}
+
+/// A CID shown as `first8...last4` when longer than `max` bytes, written
+/// straight into the formatter instead of through a temporary `String`.
+struct ShortCid<'a> { cid: &'a str, max: usize }
+
+impl std::fmt::Display for ShortCid<'_> {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        if self.cid.len() <= self.max { f.write_str(self.cid) }
+        else { write!(f, "{}...{}", &self.cid[..8], &self.cid[self.cid.len()-4..]) }
+    }
 }
 
 fn trust_shield(score: u32) -> &'static str {
@@ -1036,6 +1041,14 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_short_cid() {
+        assert_eq!(truncate_cid("bafy2bzace").to_string(), "bafy2bzace");
+        assert_eq!(truncate_cid("bafy2bzaceabcdefghijk").to_string(), "bafy2bza...hijk");
+        let exact = "bafy2bzaceabcdefghij";
+        assert_eq!(ShortCid { cid: exact, max: 20 }.to_string(), exact);
+    }
+
     #[test]
     fn test_cid_label_detection() {
         let entry = KernelAuditEntry {
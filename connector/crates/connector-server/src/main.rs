@@ -42,6 +42,7 @@
 //!   CONNECTOR_LLM_API_KEY=sk-... \
 //!   CONNECTOR_ENGINE_STORAGE=sqlite:engine.db \
 //!   CONNECTOR_CELL_ID=cell_main \
+//!   CONNECTOR_LLM_CACHE_DIR=.llm-cache \
 //!   connector-server
 //! ```
 
@@ -55,6 +56,7 @@ use tracing_subscriber::EnvFilter;
 use vac_core::kernel::MemoryKernel;
 use vac_core::knot::KnotEngine;
 use connector_engine::engine_store::{EngineStore, InMemoryEngineStore};
+use connector_engine::llm::{LlmClient, ResponseCache};
 use connector_engine::storage_zone::StorageLayout;
 
 pub struct AppState {
@@ -64,6 +66,7 @@ pub struct AppState {
     pub engine_store: Mutex<Box<dyn EngineStore + Send>>,
     pub storage_layout: StorageLayout,
     pub metrics: metrics::Metrics,
+    pub llm: LlmClient,
 }
 
 #[tokio::main]
@@ -110,6 +113,15 @@ async fn main() {
     let storage_layout = StorageLayout::default_for_cell(&cell_id);
     let metrics = metrics::Metrics::new();
 
+    // Optional on-disk cache for identical LLM requests
+    let llm = match std::env::var("CONNECTOR_LLM_CACHE_DIR") {
+        Ok(dir) if !dir.is_empty() => {
+            tracing::info!("llm response cache: {}", dir);
+            LlmClient::new().with_cache(ResponseCache::new(dir))
+        }
+        _ => LlmClient::new(),
+    };
+
     // Log Tier 3 feature flags before moving connector into state
     tracing::info!("cell_id: {}", cell_id);
     tracing::info!("storage zones:\n{}", storage_layout.to_tree());
@@ -137,6 +149,7 @@ async fn main() {
         engine_store: Mutex::new(engine_store),
         storage_layout,
         metrics,
+        llm,
     });
 
     let app = Router::new()
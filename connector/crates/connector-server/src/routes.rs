@@ -11,7 +11,6 @@ use std::sync::Arc;
 use vac_core::kernel::{MemoryKernel, SyscallRequest, SyscallPayload, SyscallValue};
 use vac_core::types::{MemoryKernelOp, PacketType, Source, SourceKind, MemPacket};
 
-use connector_engine::llm::LlmClient;
 use connector_engine::engine_store::FolderOwner;
 use connector_engine::rag::RagEngine;
 
@@ -174,8 +173,7 @@ pub async fn run_agent(
             if let Some(ref instr) = req.instructions {
                 llm_cfg = llm_cfg.with_system(instr);
             }
-            let client = LlmClient::new();
-            client.complete(&llm_cfg, &req.input, None).await
+            state.llm.complete(&llm_cfg, &req.input, None).await
                 .map(|r| r.text)
                 .unwrap_or_else(|e| format!("[LLM error: {}]", e))
         }
@@ -220,8 +218,7 @@ pub async fn run_pipeline(
                 let agent_cfg = if let Some(ref instr) = agent.instructions {
                     cfg.clone().with_system(instr)
                 } else { cfg.clone() };
-                let client = LlmClient::new();
-                client.complete(&agent_cfg, &last_output, None).await
+                state.llm.complete(&agent_cfg, &last_output, None).await
                     .map(|r| r.text)
                     .unwrap_or_else(|e| format!("[LLM error: {}]", e))
             }
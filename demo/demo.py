@@ -5,6 +5,7 @@ Connector OSS — 1-Minute Demo
 Shows: Tool Use · Agent Pipeline · Knowledge Injection · Memory · 3 Sessions
        + Malicious attack simulation → trust score drops in real-time
 Run:   DEEPSEEK_API_KEY=sk-... python demo.py
+       DEMO_SKIP_PREAMBLE=1 skips the config/code walkthrough (e.g. when timing)
 """
 
 import os, json, time
@@ -71,9 +72,9 @@ banner("Connector OSS — 1-Minute Demo")
 print(f"{DIM}pip install connector-agent-oss  ·  github.com/GlobalSushrut/connector-oss{RESET}")
 print(f"{DIM}LLM: DeepSeek  ·  Compliance: HIPAA + SOC2  ·  3 Sessions + Attack Sim{RESET}\n")
 
-# ─── Show YAML config first ──────────────────────────────────────────
-banner("CONFIG — config.yaml")
+SHOW_PREAMBLE = os.getenv("DEMO_SKIP_PREAMBLE") != "1"
 
+# ─── Show YAML config first ──────────────────────────────────────────
 config_display = """\
 connector:
   provider: deepseek
@@ -93,18 +94,18 @@ agents:
   pharmacist:
     instructions: "Recommend medication. Check drug interactions.\""""
 
-for line in config_display.split("\n"):
-    if line.strip().startswith("#") or line.strip() == "":
-        print(f"  {DIM}{line}{RESET}")
-    elif ":" in line and not line.strip().startswith("-"):
-        key, _, val = line.partition(":")
-        print(f"  {CYAN}{key}{RESET}:{GREEN}{val}{RESET}")
-    else:
-        print(f"  {GREEN}{line}{RESET}")
+if SHOW_PREAMBLE:
+    banner("CONFIG — config.yaml")
+    for line in config_display.split("\n"):
+        if line.strip().startswith("#") or line.strip() == "":
+            print(f"  {DIM}{line}{RESET}")
+        elif ":" in line and not line.strip().startswith("-"):
+            key, _, val = line.partition(":")
+            print(f"  {CYAN}{key}{RESET}:{GREEN}{val}{RESET}")
+        else:
+            print(f"  {GREEN}{line}{RESET}")
 
 # ─── Show Python code ────────────────────────────────────────────────
-banner("CODE — demo.py (highlights)")
-
 code_blocks = [
     ("# 1. Init from YAML", """\
 from connector_oss import Connector
@@ -140,14 +141,16 @@ c.grant_access(rogue_pid, rogue_pid, "patient:P-042")  # → DENIED
 c.terminate_agent(rogue_pid)  # permanently banned"""),
 ]
 
-for title, code in code_blocks:
-    print(f"  {YELLOW}{title}{RESET}")
-    for line in code.split("\n"):
-        print(f"    {GREEN}{line}{RESET}")
-    print()
+if SHOW_PREAMBLE:
+    banner("CODE — demo.py (highlights)")
+    for title, code in code_blocks:
+        print(f"  {YELLOW}{title}{RESET}")
+        for line in code.split("\n"):
+            print(f"    {GREEN}{line}{RESET}")
+        print()
 
-print(f"{DIM}{'─'*60}{RESET}")
-print(f"  {BOLD}Running demo now...{RESET}\n")
+    print(f"{DIM}{'─'*60}{RESET}")
+    print(f"  {BOLD}Running demo now...{RESET}\n")
 
 # ─── Init from YAML config ───────────────────────────────────────────
 step("0", "Loading YAML config...")
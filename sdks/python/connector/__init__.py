@@ -12,18 +12,37 @@ print(result)  # beautiful dashboard
 ```
 """
 
-try:
-    from vac_ffi import Connector, Agent, Pipeline, PipelineResult
-except ImportError:
-    raise ImportError(
-        "connector-agent requires the native Rust kernel.\n"
-        "Install it with:\n"
-        "  pip install vac-ffi\n"
-        "Or build from source:\n"
-        "  cd vac/crates/vac-ffi && maturin develop --release"
-    )
-
-from connector.config import load_file as load_config
+import importlib
+
+# Public names are resolved on first access (PEP 562), so importing the
+# package — or just the pure-Python config loader — does not load the
+# native kernel until something actually needs it.
+_NATIVE = ("Connector", "Agent", "Pipeline", "PipelineResult")
 
 __all__ = ["Connector", "Agent", "Pipeline", "PipelineResult", "load_config"]
 __version__ = "0.1.0"
+
+
+def __getattr__(name):
+    if name in _NATIVE:
+        try:
+            vac_ffi = importlib.import_module("vac_ffi")
+        except ImportError:
+            raise ImportError(
+                "connector-agent requires the native Rust kernel.\n"
+                "Install it with:\n"
+                "  pip install vac-ffi\n"
+                "Or build from source:\n"
+                "  cd vac/crates/vac-ffi && maturin develop --release"
+            )
+        value = getattr(vac_ffi, name)
+    elif name == "load_config":
+        from connector.config import load_file as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -17,24 +17,42 @@ Usage:
     print(result.verified)     # True if all events are kernel-verified
 """
 
-try:
-    from connector_oss.vac_ffi import Connector, Agent, Pipeline, PipelineResult
-except ImportError:
-    try:
-        from vac_ffi import Connector, Agent, Pipeline, PipelineResult  # type: ignore
-    except ImportError:
-        raise ImportError(
-            "\n"
-            "connector_oss requires the native Rust kernel.\n"
-            "\n"
-            "If you installed via pip and see this, please report a bug.\n"
-            "To build from source:\n"
-            "\n"
-            "  cd sdks/python\n"
-            "  maturin develop --release\n"
-        )
+import importlib
 
 __all__ = ["Connector", "Agent", "Pipeline", "PipelineResult"]
 __version__ = "0.1.0"
 __author__ = "Connector OSS Contributors"
 __license__ = "Apache-2.0"
+
+
+def _native():
+    try:
+        return importlib.import_module("connector_oss.vac_ffi")
+    except ImportError:
+        try:
+            return importlib.import_module("vac_ffi")
+        except ImportError:
+            raise ImportError(
+                "\n"
+                "connector_oss requires the native Rust kernel.\n"
+                "\n"
+                "If you installed via pip and see this, please report a bug.\n"
+                "To build from source:\n"
+                "\n"
+                "  cd sdks/python\n"
+                "  maturin develop --release\n"
+            )
+
+
+# Resolved on first access (PEP 562) so `import connector_oss` stays cheap
+# and the native kernel is only loaded when one of its types is used.
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_native(), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,7 +5,7 @@
 use cid::Cid;
 use multihash::Multihash;
 use serde::Serialize;
-use sha2::Digest;
+use sha2::{Digest, Sha256};
 
 use crate::error::{VacError, VacResult};
 
@@ -17,11 +17,8 @@ const SHA256_CODE: u64 = 0x12;
 
 /// Compute CIDv1 for any serializable object using DAG-CBOR + SHA2-256
 pub fn compute_cid<T: Serialize>(obj: &T) -> VacResult<Cid> {
-    // Serialize to DAG-CBOR
-    let bytes = to_dag_cbor(obj)?;
-    
-    // Compute SHA2-256 hash
-    let hash_bytes = sha256(&bytes);
+    // Serialize to DAG-CBOR straight into the SHA2-256 hasher
+    let hash_bytes = hash_dag_cbor(b"", obj)?;
     
     // Create multihash (SHA2-256 = 0x12, 32 bytes)
     let mh = Multihash::<64>::wrap(SHA256_CODE, &hash_bytes)
@@ -41,19 +38,27 @@ pub fn to_dag_cbor<T: Serialize>(obj: &T) -> VacResult<Vec<u8>> {
     Ok(bytes)
 }
 
+/// Hash `domain || DAG-CBOR(obj)` without materialising the CBOR bytes.
+///
+/// The hasher is the serializer's writer, so the encoding is fed to SHA2-256
+/// as it is produced; the digest is identical to hashing `to_dag_cbor(obj)`.
+fn hash_dag_cbor<T: Serialize>(domain: &[u8], obj: &T) -> VacResult<[u8; 32]> {
+    let mut hasher = Sha256::new();
+    hasher.update(domain);
+    ciborium::into_writer(obj, &mut hasher)
+        .map_err(|e| VacError::CodecError(e.to_string()))?;
+    Ok(hasher.finalize().into())
+}
+
 /// Compute SHA2-256 hash
 pub fn sha256(data: &[u8]) -> [u8; 32] {
-    use sha2::{Sha256, Digest};
-    let mut hasher = Sha256::new();
-    hasher.update(data);
-    hasher.finalize().into()
+    Sha256::digest(data).into()
 }
 
 /// Compute a domain-separated SHA2-256 hash: H(domain || data).
 /// Prevents cross-context hash collisions between block hashes,
 /// manifest hashes, Prolly node hashes, etc.
 pub fn sha256_domain(domain: &[u8], data: &[u8]) -> [u8; 32] {
-    use sha2::{Sha256, Digest};
     let mut hasher = Sha256::new();
     hasher.update(domain);
     hasher.update(data);
@@ -101,23 +106,22 @@ pub fn compute_block_hash(
         block_no,
         prev_block_hash: *prev_block_hash,
         ts,
-        patch_cid: patch_cid.clone(),
-        manifest_cid: manifest_cid.clone(),
-        signatures: signatures.to_vec(),
+        patch_cid,
+        manifest_cid,
+        signatures,
     };
     
-    let bytes = to_dag_cbor(&block_data)?;
-    Ok(sha256_domain(b"vac.block.v1", &bytes))
+    hash_dag_cbor(b"vac.block.v1", &block_data)
 }
 
 #[derive(serde::Serialize)]
-struct BlockHashData {
+struct BlockHashData<'a> {
     block_no: u64,
     prev_block_hash: [u8; 32],
     ts: i64,
-    patch_cid: Cid,
-    manifest_cid: Cid,
-    signatures: Vec<crate::types::Signature>,
+    patch_cid: &'a Cid,
+    manifest_cid: &'a Cid,
+    signatures: &'a [crate::types::Signature],
 }
 
 /// Compute manifest hash
@@ -135,7 +139,7 @@ pub fn compute_manifest_hash(
     let manifest_data = ManifestHashData {
         block_no,
         chapter_index_root: *chapter_index_root,
-        snaptree_roots: snaptree_roots.clone(),
+        snaptree_roots,
         pcnn_basis_root: *pcnn_basis_root,
         pcnn_mpn_root: *pcnn_mpn_root,
         pcnn_ie_root: *pcnn_ie_root,
@@ -144,8 +148,7 @@ pub fn compute_manifest_hash(
         revocation_root: *revocation_root,
     };
     
-    let bytes = to_dag_cbor(&manifest_data)?;
-    Ok(sha256_domain(b"vac.manifest.v1", &bytes))
+    hash_dag_cbor(b"vac.manifest.v1", &manifest_data)
 }
 
 /// Build a structured Prolly tree key for MemPackets.
@@ -188,10 +191,10 @@ pub fn parse_prolly_key(key: &[u8]) -> Option<(&str, &str, &str, &str)> {
 }
 
 #[derive(serde::Serialize)]
-struct ManifestHashData {
+struct ManifestHashData<'a> {
     block_no: u64,
     chapter_index_root: [u8; 32],
-    snaptree_roots: std::collections::BTreeMap<String, [u8; 32]>,
+    snaptree_roots: &'a std::collections::BTreeMap<String, [u8; 32]>,
     pcnn_basis_root: [u8; 32],
     pcnn_mpn_root: [u8; 32],
     pcnn_ie_root: [u8; 32],
@@ -218,6 +221,32 @@ mod tests {
         assert_eq!(cid.codec(), DAG_CBOR_CODE);
     }
     
+    #[test]
+    fn test_streamed_cid_matches_encoded_bytes() {
+        let source = Source {
+            kind: SourceKind::User,
+            principal_id: "did:key:z6Mk...".to_string(),
+        };
+        let event = Event::new(1706764800000, Cid::default(), source);
+
+        let bytes = to_dag_cbor(&event).unwrap();
+        let cid = compute_cid(&event).unwrap();
+        assert_eq!(cid.hash().digest(), &sha256(&bytes)[..]);
+
+        let signatures = Vec::new();
+        let block_data = BlockHashData {
+            block_no: 7,
+            prev_block_hash: [1u8; 32],
+            ts: 1706764800000,
+            patch_cid: &cid,
+            manifest_cid: &cid,
+            signatures: &signatures,
+        };
+        let expected = sha256_domain(b"vac.block.v1", &to_dag_cbor(&block_data).unwrap());
+        let block = compute_block_hash(7, &[1u8; 32], 1706764800000, &cid, &cid, &signatures).unwrap();
+        assert_eq!(block, expected);
+    }
+
     #[test]
     fn test_sha256() {
         let hash = sha256(b"hello world");
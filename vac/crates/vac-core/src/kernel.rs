@@ -1421,26 +1421,28 @@ impl MemoryKernel {
         // Store the packet
         let ns = packet.namespace.clone().unwrap_or_default();
         let sid = packet.session_id.clone();
-        self.packets.insert(packet_cid.clone(), packet);
+        let is_new = self.packets.insert(packet_cid.clone(), packet).is_none();
 
         // D10 FIX: Dedup namespace_index and session_index entries.
         // HashMap packet store already deduplicates by CID, but indexes
-        // accumulated duplicates on re-write of same CID.
+        // accumulated duplicates on re-write of same CID. Every indexed CID
+        // is backed by a stored packet, so a CID new to the store cannot be
+        // indexed yet and only identical re-writes pay for the scan.
         let ns_entry = self.namespace_index.entry(ns).or_default();
-        if !ns_entry.contains(&packet_cid) {
+        if is_new || !ns_entry.contains(&packet_cid) {
             ns_entry.push(packet_cid.clone());
         }
 
         // Update session index
         if let Some(ref session_id) = sid {
             let si_entry = self.session_index.entry(session_id.clone()).or_default();
-            if !si_entry.contains(&packet_cid) {
+            if is_new || !si_entry.contains(&packet_cid) {
                 si_entry.push(packet_cid.clone());
-            }
 
-            // Add CID to session envelope
-            if let Some(session) = self.sessions.get_mut(session_id) {
-                session.add_packet(packet_cid.clone());
+                // Add CID to session envelope
+                if let Some(session) = self.sessions.get_mut(session_id) {
+                    session.add_packet(packet_cid.clone());
+                }
             }
         }
 
@@ -1882,6 +1884,11 @@ impl MemoryKernel {
         if let Some(cids) = self.namespace_index.get_mut(&ns) {
             cids.retain(|cid| self.sealed_cids.contains(cid));
         }
+        if cleared > 0 {
+            for cids in self.session_index.values_mut() {
+                cids.retain(|cid| self.packets.contains_key(cid));
+            }
+        }
 
         // Update agent stats
         let acb = self.agents.get_mut(&req.agent_pid).unwrap();
@@ -2931,24 +2938,23 @@ impl MemoryKernel {
         let packets = store.load_all_packets().map_err(|e| e.to_string())?;
         for packet in packets {
             let cid = packet.index.packet_cid.clone();
+            let ns = packet.namespace.clone();
+            let sid = packet.session_id.clone();
+
+            // Only the first copy of a CID is indexed
+            if kernel.packets.insert(cid.clone(), packet).is_some() {
+                continue;
+            }
 
             // Rebuild namespace_index
-            if let Some(ref ns) = packet.namespace {
-                let entry = kernel.namespace_index.entry(ns.clone()).or_default();
-                if !entry.contains(&cid) {
-                    entry.push(cid.clone());
-                }
+            if let Some(ns) = ns {
+                kernel.namespace_index.entry(ns).or_default().push(cid.clone());
             }
 
             // Rebuild session_index
-            if let Some(ref sid) = packet.session_id {
-                let entry = kernel.session_index.entry(sid.clone()).or_default();
-                if !entry.contains(&cid) {
-                    entry.push(cid.clone());
-                }
+            if let Some(sid) = sid {
+                kernel.session_index.entry(sid).or_default().push(cid);
             }
-
-            kernel.packets.insert(cid, packet);
         }
 
         Ok(kernel)
@@ -6855,6 +6861,53 @@ mod tests {
         assert!(!sess_cids.contains(&cid), "D8: session_index must be cleaned after GC");
     }
 
+    #[test]
+    fn test_mem_clear_cleans_session_index() {
+        let mut kernel = MemoryKernel::new();
+        let pid = register_agent(&mut kernel, "clr-bot", "ns:clr");
+        kernel.dispatch(SyscallRequest {
+            agent_pid: pid.clone(),
+            operation: MemoryKernelOp::AgentStart,
+            payload: SyscallPayload::Empty,
+            reason: None, vakya_id: None,
+        });
+        kernel.dispatch(SyscallRequest {
+            agent_pid: pid.clone(),
+            operation: MemoryKernelOp::SessionCreate,
+            payload: SyscallPayload::SessionCreate {
+                session_id: "sess:clr".to_string(),
+                label: None,
+                parent_session_id: None,
+            },
+            reason: None, vakya_id: None,
+        });
+
+        for i in 0..3 {
+            let packet = make_packet(&format!("subject:clr_{}", i), Some("sess:clr"));
+            kernel.dispatch(SyscallRequest {
+                agent_pid: pid.clone(),
+                operation: MemoryKernelOp::MemWrite,
+                payload: SyscallPayload::MemWrite { packet },
+                reason: None, vakya_id: None,
+            });
+        }
+        assert_eq!(kernel.namespace_index.get("ns:clr").unwrap().len(), 3);
+        assert_eq!(kernel.session_index.get("sess:clr").unwrap().len(), 3);
+
+        let r = kernel.dispatch(SyscallRequest {
+            agent_pid: pid.clone(),
+            operation: MemoryKernelOp::MemClear,
+            payload: SyscallPayload::MemClear,
+            reason: None, vakya_id: None,
+        });
+        assert_eq!(r.outcome, OpOutcome::Success);
+
+        // No index may point at a cleared packet
+        for cids in kernel.namespace_index.values().chain(kernel.session_index.values()) {
+            assert!(cids.iter().all(|cid| kernel.packets.contains_key(cid)));
+        }
+    }
+
     #[test]
     fn test_d9_audit_returns_newest() {
         // D9: load_audit_entries_by_agent must return newest entries
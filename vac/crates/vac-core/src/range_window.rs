@@ -155,8 +155,13 @@ struct WindowAccumulator {
 
 impl WindowAccumulator {
     fn new(namespace: String, agent_pid: String) -> Self {
+        Self::with_capacity(namespace, agent_pid, 0)
+    }
+
+    /// Accumulator with room for `capacity` CIDs before reallocating
+    fn with_capacity(namespace: String, agent_pid: String, capacity: usize) -> Self {
         Self {
-            leaf_cids: Vec::new(),
+            leaf_cids: Vec::with_capacity(capacity),
             token_count: 0,
             event_time_start: None,
             event_time_end: None,
@@ -371,35 +376,44 @@ impl RangeWindowManager {
         let namespace = self.accumulator.namespace.clone();
         let agent_pid = self.accumulator.agent_pid.clone();
 
+        // Take the accumulated state instead of copying it, leaving a fresh
+        // accumulator sized for a window like this one
+        let capacity = self.accumulator.leaf_cids.len();
+        let accumulator = std::mem::replace(
+            &mut self.accumulator,
+            WindowAccumulator::with_capacity(namespace.clone(), agent_pid.clone(), capacity),
+        );
+
         // Compute Merkle root: H(cid_0_bytes || cid_1_bytes || ... || cid_n_bytes)
-        let rw_root = compute_merkle_root(&self.accumulator.leaf_cids);
+        let rw_root = compute_merkle_root(&accumulator.leaf_cids);
+        let leaf_count = accumulator.leaf_cids.len() as u64;
 
         // Determine session_id (if all packets share one session)
-        let session_id = if self.accumulator.session_ids.len() == 1 {
-            self.accumulator.session_ids.iter().next().cloned()
+        let session_id = if accumulator.session_ids.len() == 1 {
+            accumulator.session_ids.into_iter().next()
         } else {
             None
         };
 
         let page_code = format!("{}/{:06}", namespace, sn);
 
-        let entities: Vec<String> = self.accumulator.entities.iter().cloned().collect();
+        let entities: Vec<String> = accumulator.entities.into_iter().collect();
 
         let window = RangeWindow {
             sn,
             page_code: page_code.clone(),
-            event_time_start: self.accumulator.event_time_start.unwrap_or(now),
-            event_time_end: self.accumulator.event_time_end.unwrap_or(now),
+            event_time_start: accumulator.event_time_start.unwrap_or(now),
+            event_time_end: accumulator.event_time_end.unwrap_or(now),
             ingest_time: now,
-            leaf_cids: self.accumulator.leaf_cids.clone(),
-            token_count: self.accumulator.token_count,
-            packet_count: self.accumulator.packet_count(),
+            leaf_cids: accumulator.leaf_cids,
+            token_count: accumulator.token_count,
+            packet_count: leaf_count as u32,
             rw_root,
             prev_rw_root: self.prev_rw_root,
-            tree_size: self.cumulative_tree_size + self.accumulator.leaf_cids.len() as u64,
+            tree_size: self.cumulative_tree_size + leaf_count,
             boundary_reason,
             namespace: namespace.clone(),
-            agent_pid: agent_pid.clone(),
+            agent_pid,
             session_id,
             tier: MemoryTier::Hot,
             scope: MemoryScope::Episodic,
@@ -417,7 +431,7 @@ impl RangeWindowManager {
             event_time_start: window.event_time_start,
             event_time_end: window.event_time_end,
             entities,
-            namespace: namespace.clone(),
+            namespace,
             sealed: true,
         };
         self.index.insert(sn, index_entry);
@@ -427,11 +441,10 @@ impl RangeWindowManager {
 
         // Update chain state
         self.prev_rw_root = rw_root;
-        self.cumulative_tree_size += self.accumulator.leaf_cids.len() as u64;
+        self.cumulative_tree_size += leaf_count;
         self.next_sn += 1;
 
-        // Reset accumulator and clear WAL (committed data is now safe)
-        self.accumulator = WindowAccumulator::new(namespace, agent_pid);
+        // Accumulator was reset above; clear WAL (committed data is now safe)
         // D17 FIX: Clear WAL after successful commit — data is now in committed window
         self.wal.clear();
 
@@ -618,29 +631,26 @@ pub fn compute_merkle_root(cids: &[Cid]) -> [u8; 32] {
 
     let tree_size = hashes.len() as u64;
 
-    // Build tree bottom-up
+    // Build tree bottom-up, in place: node i of the next level only reads
+    // slots 2i and 2i+1, which are never before slot i
     while hashes.len() > 1 {
-        let mut next_level = Vec::new();
-        let mut i = 0;
-        while i < hashes.len() {
-            if i + 1 < hashes.len() {
-                // Pair: hash both children with domain separation
-                next_level.push(merkle_node_hash(&hashes[i], &hashes[i + 1]));
-                i += 2;
-            } else {
-                // Odd node: promote directly (no duplication)
-                next_level.push(hashes[i]);
-                i += 1;
-            }
+        let len = hashes.len();
+        for i in 0..len / 2 {
+            // Pair: hash both children with domain separation
+            hashes[i] = merkle_node_hash(&hashes[2 * i], &hashes[2 * i + 1]);
         }
-        hashes = next_level;
+        if len % 2 == 1 {
+            // Odd node: promote directly (no duplication)
+            hashes[len / 2] = hashes[len - 1];
+        }
+        hashes.truncate((len + 1) / 2);
     }
 
     // Bind tree size into root to prevent truncation attacks
-    let mut final_buf = Vec::with_capacity(1 + 8 + 32);
-    final_buf.push(MERKLE_NODE_PREFIX);
-    final_buf.extend_from_slice(&tree_size.to_be_bytes());
-    final_buf.extend_from_slice(&hashes[0]);
+    let mut final_buf = [0u8; 1 + 8 + 32];
+    final_buf[0] = MERKLE_NODE_PREFIX;
+    final_buf[1..9].copy_from_slice(&tree_size.to_be_bytes());
+    final_buf[9..].copy_from_slice(&hashes[0]);
     sha256(&final_buf)
 }
 
@@ -814,6 +824,24 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_inclusion_proof_verify_odd_sizes() {
+        // Odd levels promote their last node; the root and the proofs must agree
+        for size in 1..=9u8 {
+            let cids: Vec<Cid> = (0..size).map(make_cid).collect();
+            let root = compute_merkle_root(&cids);
+            for i in 0..cids.len() {
+                let proof = compute_inclusion_proof(&cids, i).unwrap();
+                assert!(
+                    verify_inclusion_proof(&cids[i], i, cids.len(), &proof, &root),
+                    "Inclusion proof failed for index {} of {}",
+                    i,
+                    size
+                );
+            }
+        }
+    }
+
     #[test]
     fn test_inclusion_proof_invalid_index() {
         let cids = vec![make_cid(1)];
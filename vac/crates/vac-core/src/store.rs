@@ -164,6 +164,8 @@ pub struct InMemoryKernelStore {
     state_vectors: BTreeMap<(String, u64), StateVector>,
     interference_edges: HashMap<String, Vec<IEdge>>,
     audit_entries: Vec<KernelAuditEntry>,
+    /// agent_pid -> positions in `audit_entries`, oldest first
+    audit_by_agent: HashMap<String, Vec<usize>>,
     scitt_receipts: HashMap<String, ScittReceipt>,
     agents: HashMap<String, AgentControlBlock>,
     sessions: HashMap<String, SessionEnvelope>,
@@ -272,6 +274,10 @@ impl KernelStore for InMemoryKernelStore {
 
     // --- Audit ---
     fn store_audit_entry(&mut self, entry: &KernelAuditEntry) -> StoreResult<()> {
+        self.audit_by_agent
+            .entry(entry.agent_pid.clone())
+            .or_default()
+            .push(self.audit_entries.len());
         self.audit_entries.push(entry.clone());
         Ok(())
     }
@@ -285,17 +291,15 @@ impl KernelStore for InMemoryKernelStore {
     }
 
     fn load_audit_entries_by_agent(&self, agent_pid: &str, limit: usize) -> StoreResult<Vec<KernelAuditEntry>> {
-        // D9 FIX: Return newest entries first (rev iterator), not oldest.
+        // D9 FIX: Return the newest `limit` entries, not the oldest.
         // Audit queries almost always want the most recent entries.
-        let mut entries: Vec<KernelAuditEntry> = self.audit_entries
-            .iter()
-            .rev()
-            .filter(|e| e.agent_pid == agent_pid)
-            .take(limit)
-            .cloned()
-            .collect();
-        entries.reverse(); // Restore chronological order within the result
-        Ok(entries)
+        // The per-agent index avoids scanning every agent's entries.
+        let positions = match self.audit_by_agent.get(agent_pid) {
+            Some(positions) => positions,
+            None => return Ok(Vec::new()),
+        };
+        let newest = &positions[positions.len().saturating_sub(limit)..];
+        Ok(newest.iter().map(|&i| self.audit_entries[i].clone()).collect())
     }
 
     // --- SCITT Receipts ---
@@ -950,6 +954,25 @@ mod tests {
 
         let empty = store.load_audit_entries(5000, 6000).unwrap();
         assert!(empty.is_empty());
+
+        // Interleave a second agent; per-agent queries return the newest
+        // entries of that agent only, in chronological order
+        for ts in 1001..1006 {
+            let mut other = entry.clone();
+            other.agent_pid = "pid:002".to_string();
+            other.timestamp = ts;
+            store.store_audit_entry(&other).unwrap();
+            let mut own = entry.clone();
+            own.timestamp = ts;
+            store.store_audit_entry(&own).unwrap();
+        }
+
+        let recent = store.load_audit_entries_by_agent("pid:001", 3).unwrap();
+        let stamps: Vec<i64> = recent.iter().map(|e| e.timestamp).collect();
+        assert_eq!(stamps, vec![1003, 1004, 1005]);
+        assert!(recent.iter().all(|e| e.agent_pid == "pid:001"));
+        assert_eq!(store.load_audit_entries_by_agent("pid:002", 100).unwrap().len(), 5);
+        assert!(store.load_audit_entries_by_agent("pid:404", 10).unwrap().is_empty());
     }
 
     #[test]